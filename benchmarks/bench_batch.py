@@ -0,0 +1,90 @@
+"""Compare parse_many() with a serial parse() loop over many spec files.
+
+Run with ``uv run python benchmarks/bench_batch.py [specs] [workers]``.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any
+
+from openapi_parser import parse, parse_many
+
+
+def _spec(index: int, paths: int) -> dict[str, Any]:
+    """Build a spec whose operations reference a shared schema file."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": f"spec {index}", "version": "1.0.0"},
+        "paths": {
+            f"/items{i}/{{id}}": {
+                "get": {
+                    "operationId": f"getItem{i}",
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "common.json#/Item"},
+                                },
+                            },
+                        },
+                    },
+                },
+            }
+            for i in range(paths)
+        },
+    }
+
+
+def _write_specs(directory: str, specs: int, paths: int) -> list[str]:
+    """Write *specs* JSON files sharing ``common.json`` into *directory*."""
+    common = {
+        "Item": {
+            "type": "object",
+            "properties": {f"field{j}": {"type": "string"} for j in range(20)},
+        },
+    }
+
+    with open(os.path.join(directory, "common.json"), "w") as f:
+        json.dump(common, f)
+
+    locations = []
+
+    for index in range(specs):
+        location = os.path.join(directory, f"spec{index}.json")
+
+        with open(location, "w") as f:
+            json.dump(_spec(index, paths), f)
+
+        locations.append(location)
+
+    return locations
+
+
+def main(specs: int = 200, workers: int = os.cpu_count() or 1) -> None:
+    """Time both strategies over the same generated specs."""
+    with tempfile.TemporaryDirectory() as directory:
+        locations = _write_specs(directory, specs, paths=100)
+
+        started = time.perf_counter()
+        for location in locations:
+            parse(location)
+        serial = time.perf_counter() - started
+
+        started = time.perf_counter()
+        failures = sum(
+            isinstance(result, Exception)
+            for _, result in parse_many(locations, workers=workers)
+        )
+        batch = time.perf_counter() - started
+
+    print(f"{specs} specs, {workers} workers, {failures} failures")
+    print(f"serial     {serial:7.3f}s  {specs / serial:8.1f} specs/s")
+    print(f"parse_many {batch:7.3f}s  {specs / batch:8.1f} specs/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,101 @@
+"""Compare the memory retained by a parsed spec with and without ``compact``.
+
+Every schema repeats the same property names, formats and descriptions,
+as in generated specs. Compact mode interns those strings so that each
+is held once. Models without ``x-*`` keys share one empty ``extensions``
+mapping in both modes, so that saving is not part of the difference.
+
+Run with ``uv run python benchmarks/bench_compact.py [schemas] [repeat]``.
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+import yaml
+
+from openapi_parser import parse
+
+
+def _spec(schemas: int) -> dict[str, Any]:
+    """Build a spec with *schemas* component schemas of eight properties."""
+
+    def properties() -> dict[str, Any]:
+        return {
+            "id": {"type": "string", "format": "uuid", "description": "Identifier"},
+            "name": {"type": "string", "maxLength": 128, "description": "Name"},
+            "created": {"type": "string", "format": "date-time"},
+            "updated": {"type": "string", "format": "date-time"},
+            "count": {"type": "integer", "format": "int64", "minimum": 0},
+            "enabled": {"type": "boolean", "default": True},
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "owner": {"$ref": "#/components/schemas/Owner"},
+        }
+
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "generated", "version": "1.0.0"},
+        "paths": {},
+        "components": {
+            "schemas": {
+                "Owner": {"type": "object", "properties": {"name": {"type": "string"}}},
+                **{
+                    f"Model{i}": {
+                        "type": "object",
+                        "required": ["id", "name"],
+                        "properties": properties(),
+                    }
+                    for i in range(schemas)
+                },
+            },
+        },
+    }
+
+
+def _measure(path: str, compact: bool, repeat: int) -> tuple[float, int]:
+    """Return the best parse time and the bytes held by one parsed spec."""
+    best = float("inf")
+
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        parse(path, compact=compact)
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    spec = parse(path, compact=compact)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del spec
+
+    return best, retained
+
+
+def main(schemas: int = 5_000, repeat: int = 3) -> None:
+    """Parse one spec in both modes and report the bytes compact mode saves."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "spec.yaml")
+
+        with open(path, "w") as f:
+            yaml.dump(_spec(schemas), f, Dumper=yaml.CSafeDumper)
+
+        results = {}
+
+        for compact in (False, True):
+            best, retained = _measure(path, compact, repeat)
+            results[compact] = retained
+            label = "compact" if compact else "default"
+            print(f"{label:>8}: {best:7.3f}s  retained {retained / 1e6:8.1f} MB")
+
+        saved = results[False] - results[True]
+        print(f"   saved: {saved / 1e6:8.1f} MB ({saved / results[False]:.0%})")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
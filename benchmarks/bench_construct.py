@@ -0,0 +1,58 @@
+"""Compare model_validate() with model_construct() on typical spec objects.
+
+Skipping validation with ``model_construct`` only pays off when it is
+cheaper than validating. With pydantic-core doing validation, it is not:
+``model_construct`` resolves every default in Python on each call, which
+makes it slower than validating the same object, even before nested
+models, enums and ``x-*`` extensions would have to be converted by hand.
+
+Run with ``uv run python benchmarks/bench_construct.py [number]``.
+"""
+
+import sys
+import timeit
+from functools import partial
+from typing import Any
+
+from pydantic import BaseModel
+
+from openapi_parser.enumeration import DataType, ParameterLocation
+from openapi_parser.models import v3_0
+
+# (model, raw spec object, the same object as already typed field values)
+CASES: list[tuple[type[BaseModel], dict[str, Any], dict[str, Any]]] = [
+    (
+        v3_0.Schema,
+        {"type": "string", "maxLength": 64},
+        {"type": DataType.STRING, "max_length": 64},
+    ),
+    (
+        v3_0.Parameter,
+        {"name": "id", "in": "path", "required": True},
+        {"name": "id", "location": ParameterLocation.PATH, "required": True},
+    ),
+    (
+        v3_0.Tag,
+        {"name": "users", "description": "User operations"},
+        {"name": "users", "description": "User operations"},
+    ),
+]
+
+
+def main(number: int = 20_000) -> None:
+    """Time both ways of building each model *number* times."""
+    for model, raw, values in CASES:
+        validate = timeit.timeit(partial(model.model_validate, raw), number=number)
+        construct = timeit.timeit(
+            partial(model.model_construct, **values), number=number
+        )
+
+        print(
+            f"{model.__name__:<10} "
+            f"validate {validate / number * 1e6:7.2f}us  "
+            f"construct {construct / number * 1e6:7.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
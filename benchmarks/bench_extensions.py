@@ -0,0 +1,121 @@
+"""Count the allocations of the ``extensions`` handling of validated models.
+
+Most models of a spec carry no extensions. The shared empty mapping is
+compared with the former handling, rebuilt here as a baseline: a fresh
+``{}`` default per model and a copy of every input mapping. Each
+validation is measured by the blocks ``tracemalloc`` sees allocated and
+still held afterwards, and by the time per model.
+
+Run with ``uv run python benchmarks/bench_extensions.py [models] [repeat]``.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from pydantic import BaseModel, Field, model_validator
+
+from openapi_parser.models.v3_0 import MediaType, Parameter, Schema
+
+Inputs = list[tuple[type[BaseModel], dict[str, Any]]]
+
+
+class _CopyingExtensions(BaseModel):
+    """The former ``ExtensionsMixin``: a dict per model, input always copied."""
+
+    extensions: dict[str, Any] = Field(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _extract_extensions(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+
+        raw_extensions = data.get("extensions")
+        extensions = dict(raw_extensions) if isinstance(raw_extensions, dict) else {}
+        result = {}
+
+        for key, value in data.items():
+            if isinstance(key, str) and key.startswith("x-"):
+                extensions[key] = value
+            else:
+                result[key] = value
+
+        if extensions:
+            result["extensions"] = extensions
+
+        return result
+
+
+class _BaselineSchema(_CopyingExtensions, Schema):
+    pass
+
+
+class _BaselineParameter(_CopyingExtensions, Parameter):
+    pass
+
+
+class _BaselineMediaType(_CopyingExtensions, MediaType):
+    pass
+
+
+_MODELS: dict[str, tuple[type[BaseModel], type[BaseModel], type[BaseModel]]] = {
+    "baseline": (_BaselineSchema, _BaselineParameter, _BaselineMediaType),
+    "shared": (Schema, Parameter, MediaType),
+}
+
+
+def _inputs(variant: str, models: int, extended: bool) -> Inputs:
+    """Build *models* raw schemas, parameters and media types."""
+    schema, parameter, media_type = _MODELS[variant]
+    extra = {"x-internal": True} if extended else {}
+    inputs: Inputs = []
+
+    for i in range(models):
+        inputs.append((schema, {"type": "string", "maxLength": i, **extra}))
+        inputs.append((parameter, {"name": f"p{i}", "in": "query", **extra}))
+        inputs.append((media_type, {"example": i, **extra}))
+
+    return inputs
+
+
+def _validate(inputs: Inputs) -> list[BaseModel]:
+    return [model.model_validate(data) for model, data in inputs]
+
+
+def main(models: int = 100_000, repeat: int = 3) -> None:
+    """Validate the models both ways, with and without extensions."""
+    for extended in (False, True):
+        for variant in _MODELS:
+            inputs = _inputs(variant, models, extended)
+            best = float("inf")
+
+            for _ in range(repeat):
+                gc.collect()
+                started = time.perf_counter()
+                _validate(inputs)
+                best = min(best, time.perf_counter() - started)
+
+            gc.collect()
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            result = _validate(inputs)
+            after = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+            stats = after.compare_to(before, "filename")
+            blocks = sum(stat.count_diff for stat in stats)
+            size = sum(stat.size_diff for stat in stats)
+            count = len(result)
+            label = f"{variant}, {'x-*' if extended else 'plain'}"
+            print(
+                f"{label:>15}: {best / count * 1e6:6.2f} us/model  "
+                f"{blocks / count:5.2f} blocks/model  {size / count:7.1f} B/model"
+            )
+            del result
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
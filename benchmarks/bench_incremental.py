@@ -0,0 +1,88 @@
+"""Compare a full parse with incremental updates after small edits.
+
+Run with ``uv run python benchmarks/bench_incremental.py [paths] [repeat]``.
+"""
+
+import json
+import sys
+import time
+from typing import Any
+
+from openapi_parser import IncrementalParser, parse
+
+
+def _spec(paths: int) -> dict[str, Any]:
+    """Build a spec with *paths* operations, each with its own schema."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "incremental", "version": "1.0.0"},
+        "paths": {
+            f"/items{i}": {
+                "get": {
+                    "operationId": f"getItem{i}",
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": f"#/components/schemas/S{i}"},
+                                },
+                            },
+                        },
+                    },
+                },
+            }
+            for i in range(paths)
+        },
+        "components": {
+            "schemas": {
+                f"S{i}": {
+                    "type": "object",
+                    "properties": {
+                        f"field{j}": {"type": "string", "maxLength": j + 1}
+                        for j in range(10)
+                    },
+                }
+                for i in range(paths)
+            },
+        },
+    }
+
+
+def _edits(spec: dict[str, Any], repeat: int) -> list[str]:
+    """Return *repeat* versions of *spec*, each with one schema edited."""
+    schemas = spec["components"]["schemas"]
+    texts = []
+
+    for i in range(repeat):
+        schemas[f"S{i}"]["description"] = f"edit {i}"
+        texts.append(json.dumps(spec))
+
+    return texts
+
+
+def main(paths: int = 5_000, repeat: int = 5) -> None:
+    """Time full parses and incremental updates of the same edits."""
+    spec = _spec(paths)
+    texts = _edits(spec, repeat)
+
+    started = time.perf_counter()
+    for text in texts:
+        parse(spec_string=text)
+    full = (time.perf_counter() - started) / repeat
+
+    parser = IncrementalParser()
+    parser.update(json.dumps(_spec(paths)))
+
+    started = time.perf_counter()
+    for text in texts:
+        parser.update(text)
+    incremental = (time.perf_counter() - started) / repeat
+
+    print(f"{paths} paths, one schema edited per update")
+    print(f"full parse   {full:7.3f}s")
+    print(f"incremental  {incremental:7.3f}s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,92 @@
+"""Compare eager and lazy parsing of a large synthetic spec.
+
+Run with ``uv run python benchmarks/bench_lazy.py [paths]``.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from openapi_parser import parse
+
+
+def _spec_text(paths: int, schemas: int) -> str:
+    """Build a JSON spec with *paths* operations over *schemas* components."""
+    spec: dict[str, Any] = {
+        "openapi": "3.0.0",
+        "info": {"title": "lazy", "version": "1.0.0"},
+        "paths": {
+            f"/items{i}/{{id}}": {
+                "parameters": [
+                    {"name": "id", "in": "path", "required": True},
+                ],
+                "get": {
+                    "operationId": f"getItem{i}",
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "$ref": f"#/components/schemas/S{i % schemas}"
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            }
+            for i in range(paths)
+        },
+        "components": {
+            "schemas": {
+                f"S{i}": {
+                    "type": "object",
+                    "description": f"Schema {i}",
+                    "properties": {
+                        f"field{j}": {"type": "string", "maxLength": j + 1}
+                        for j in range(10)
+                    },
+                }
+                for i in range(schemas)
+            },
+        },
+    }
+
+    return json.dumps(spec)
+
+
+def _measure(text: str, lazy: bool, touched: int) -> tuple[float, float]:
+    """Return seconds and peak MB to parse *text* and touch *touched* paths."""
+    tracemalloc.start()
+    started = time.perf_counter()
+
+    spec = parse(spec_string=text, lazy=lazy)
+    for path in list(spec.paths)[:touched]:
+        spec.paths[path].get  # noqa: B018
+
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak / 1e6
+
+
+def main(paths: int = 5_000) -> None:
+    """Parse one spec eagerly and lazily, touching only a few paths."""
+    text = _spec_text(paths, paths // 5)
+    touched = 10
+
+    for lazy in (False, True):
+        elapsed, peak = _measure(text, lazy, touched)
+        mode = "lazy " if lazy else "eager"
+        print(
+            f"{mode} {paths} paths, {touched} touched: "
+            f"{elapsed:7.3f}s  peak {peak:8.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
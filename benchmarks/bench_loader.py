@@ -0,0 +1,77 @@
+"""Compare YAML/JSON loading backends on scaled-up test fixtures.
+
+Run with ``uv run python benchmarks/bench_loader.py [copies]``.
+"""
+
+import copy
+import json
+import os
+import sys
+import timeit
+from functools import partial
+from typing import Any
+
+import yaml
+
+from openapi_parser.loader import (
+    JSON_BACKEND,
+    YAML_BACKEND,
+    load_document,
+    safe_load_yaml,
+)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "tests", "data")
+
+
+def _scale(spec: dict[str, Any], copies: int) -> dict[str, Any]:
+    """Duplicate every path and schema *copies* times under unique names."""
+    paths = spec.get("paths") or {}
+    schemas = (spec.get("components") or {}).get("schemas") or {}
+
+    spec["paths"] = {
+        f"{path}/v{i}": copy.deepcopy(item)
+        for i in range(copies)
+        for path, item in paths.items()
+    }
+
+    if schemas:
+        spec["components"]["schemas"] = {
+            **schemas,
+            **{
+                f"{name}V{i}": copy.deepcopy(s)
+                for i in range(copies)
+                for name, s in schemas.items()
+            },
+        }
+
+    return spec
+
+
+def main(copies: int = 200) -> None:
+    """Time ``yaml.safe_load`` against the selected loaders per fixture."""
+    print(f"yaml: {YAML_BACKEND}, json: {JSON_BACKEND}, copies: {copies}")
+
+    for name in sorted(os.listdir(FIXTURES)):
+        with open(os.path.join(FIXTURES, name)) as f:
+            spec = yaml.safe_load(f)
+
+        scaled = _scale(spec, copies)
+        text = yaml.safe_dump(scaled, sort_keys=False)
+        json_text = json.dumps(scaled, default=str)
+
+        baseline = min(timeit.repeat(partial(yaml.safe_load, text), number=1, repeat=3))
+        selected = min(timeit.repeat(partial(safe_load_yaml, text), number=1, repeat=3))
+        as_json = min(
+            timeit.repeat(partial(load_document, json_text), number=1, repeat=3)
+        )
+
+        print(
+            f"{name:<24} {len(text) / 1e6:6.2f} MB  "
+            f"safe_load {baseline:7.3f}s  yaml {selected:7.3f}s  "
+            f"x{baseline / selected:5.1f}  json {as_json:7.3f}s  "
+            f"x{baseline / as_json:5.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
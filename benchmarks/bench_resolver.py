@@ -0,0 +1,233 @@
+"""Compare the iterative ``$ref`` walker with the previous recursive one.
+
+On ref chains most of the gain comes from never walking a resolved
+target twice, not from dropping recursion. On wide documents the hot
+loop has to stay at least as fast as the recursive calls it replaces.
+
+Run with ``uv run python benchmarks/bench_resolver.py``.
+"""
+
+import sys
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from openapi_parser import resolver
+
+
+def _legacy_traverse(
+    node: Any,
+    process_dict: Callable[[dict[str, Any]], Any],
+    tracking: set[int],
+) -> Any:
+    """Recursive traversal used before the explicit-stack walker."""
+    if isinstance(node, dict):
+        replacement = process_dict(node)
+
+        if replacement is not None:
+            return replacement
+
+        nid = id(node)
+        tracking.add(nid)
+
+        try:
+            for k, v in list(node.items()):
+                node[k] = _legacy_traverse(v, process_dict, tracking)
+
+            return node
+        finally:
+            tracking.discard(nid)
+
+    if isinstance(node, list):
+        for i, v in enumerate(node):
+            node[i] = _legacy_traverse(v, process_dict, tracking)
+
+    return node
+
+
+def _legacy_resolve_ref_node(
+    node: dict[str, Any],
+    ref_resolver: Any,
+    resolved_cache: dict[str, Any],
+    walking: set[int],
+) -> Any:
+    """Recursive ``$ref`` resolution used before the explicit-stack walker."""
+    ref = node["$ref"]
+
+    if ref in resolved_cache:
+        cached = resolved_cache[ref]
+
+        if isinstance(cached, dict) and id(cached) in walking:
+            return {"ref_name": ref}
+
+        return cached
+
+    result = ref_resolver.lookup(ref)
+    contents = result.contents
+
+    if isinstance(contents, dict):
+        resolved_cache[ref] = contents
+
+        if id(contents) in walking:
+            return {"ref_name": ref}
+
+        if "$ref" in contents and isinstance(contents["$ref"], str):
+            resolved = _legacy_resolve_ref_node(
+                contents, result.resolver, resolved_cache, walking
+            )
+            resolved_cache[ref] = resolved
+            return resolved
+
+        walking.add(id(contents))
+
+        try:
+            for k, v in list(contents.items()):
+                contents[k] = _legacy_walk(v, result.resolver, resolved_cache, walking)
+        finally:
+            walking.discard(id(contents))
+
+        contents["ref_name"] = ref
+
+        return contents
+
+    return _legacy_walk(contents, result.resolver, resolved_cache, walking)
+
+
+def _legacy_walk(
+    node: Any,
+    ref_resolver: Any,
+    resolved_cache: dict[str, Any],
+    walking: set[int],
+) -> Any:
+    """Recursive walker used before the explicit-stack walker."""
+
+    def _dict_fn(d: dict[str, Any]) -> Any:
+        if "$ref" in d and isinstance(d["$ref"], str):
+            return _legacy_resolve_ref_node(d, ref_resolver, resolved_cache, walking)
+
+        return None
+
+    return _legacy_traverse(node, _dict_fn, walking)
+
+
+def _wide_spec(paths: int, schemas: int) -> dict[str, Any]:
+    """Build a spec with many paths referencing a pool of schemas."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "wide", "version": "1.0.0"},
+        "paths": {
+            f"/items{i}": {
+                "get": {
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "$ref": f"#/components/schemas/S{i % schemas}"
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            }
+            for i in range(paths)
+        },
+        "components": {
+            "schemas": {
+                f"S{i}": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer"},
+                        "parent": {"$ref": f"#/components/schemas/S{i // 2}"},
+                    },
+                }
+                for i in range(schemas)
+            },
+        },
+    }
+
+
+def _deep_spec(depth: int) -> dict[str, Any]:
+    """Build a spec with a single schema nested *depth* levels deep."""
+    schema: dict[str, Any] = {"type": "string"}
+
+    for _ in range(depth):
+        schema = {"type": "object", "properties": {"child": schema}}
+
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "deep", "version": "1.0.0"},
+        "paths": {},
+        "components": {"schemas": {"Deep": schema}},
+    }
+
+
+def _chain_spec(length: int, copies: int) -> dict[str, Any]:
+    """Build *copies* independent chains of *length* schemas referencing the next."""
+    schemas = {
+        f"C{c}S{i}": {
+            "type": "object",
+            "properties": {
+                "next": {"$ref": f"#/components/schemas/C{c}S{i + 1}"}
+                if i + 1 < length
+                else {"type": "string"},
+            },
+        }
+        for c in range(copies)
+        for i in range(length)
+    }
+
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "chain", "version": "1.0.0"},
+        "paths": {},
+        "components": {"schemas": schemas},
+    }
+
+
+def _time(
+    fn: Callable[[dict[str, Any]], Any],
+    build: Callable[[], dict[str, Any]],
+) -> float:
+    """Return the best of seven runs of *fn* on freshly built specs."""
+    specs = [build() for _ in range(7)]
+
+    return min(timeit.repeat(lambda: fn(specs.pop()), number=1, repeat=7))
+
+
+def _run_iterative(raw: dict[str, Any]) -> Any:
+    registry = resolver._build_registry(raw, None, "3.0")
+    return resolver._walk(raw, registry.resolver(base_uri="urn:root"))
+
+
+def _run_recursive(raw: dict[str, Any]) -> Any:
+    registry = resolver._build_registry(raw, None, "3.0")
+    return _legacy_walk(raw, registry.resolver(base_uri="urn:root"), {}, set())
+
+
+def main() -> None:
+    """Time both walkers on deep and wide synthetic specs."""
+    too_deep = sys.getrecursionlimit() * 2
+    cases: dict[str, Callable[[], dict[str, Any]]] = {
+        "wide 20k paths / 2k schemas": partial(_wide_spec, 20_000, 2_000),
+        "20 chains of 100 schemas": partial(_chain_spec, 100, 20),
+        "deep 200 levels": partial(_deep_spec, 200),
+        f"deep {too_deep} levels": partial(_deep_spec, too_deep),
+    }
+
+    for name, build in cases.items():
+        iterative = _time(_run_iterative, build)
+
+        try:
+            recursive = f"{_time(_run_recursive, build):7.3f}s"
+        except RecursionError:
+            recursive = "RecursionError"
+
+        print(f"{name:<30} iterative {iterative:7.3f}s  recursive {recursive}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Compare the trie router against scanning per-path regexes.
+
+Run with ``uv run python benchmarks/bench_router.py [paths]``.
+"""
+
+import json
+import random
+import re
+import sys
+import time
+from typing import Any
+
+from openapi_parser import parse
+from openapi_parser.router import Router
+
+_OPERATION = {"get": {"responses": {"200": {"description": "OK"}}}}
+
+
+def _spec_text(paths: int) -> str:
+    """Build a JSON spec with *paths* nested, templated path items."""
+    spec: dict[str, Any] = {
+        "openapi": "3.0.0",
+        "info": {"title": "router", "version": "1.0.0"},
+        "servers": [{"url": "https://api.example.com/v1"}],
+        "paths": {
+            f"/resource{i}/{{id}}/items/{{itemId}}": _OPERATION for i in range(paths)
+        },
+    }
+
+    return json.dumps(spec)
+
+
+def _regex_table(templates: list[str]) -> list[tuple[re.Pattern[str], str]]:
+    """Compile one anchored regex per template, as a naive router would."""
+    return [
+        (re.compile("^" + re.sub(r"\{[^}]+\}", "([^/]+)", t) + "$"), t)
+        for t in templates
+    ]
+
+
+def _scan(table: list[tuple[re.Pattern[str], str]], path: str) -> str | None:
+    """Return the first template whose regex matches *path*."""
+    for pattern, template in table:
+        if pattern.match(path):
+            return template
+
+    return None
+
+
+def main(paths: int = 5_000) -> None:
+    """Time matching random requests with both strategies."""
+    spec = parse(spec_string=_spec_text(paths))
+
+    started = time.perf_counter()
+    router = Router(spec)
+    built = time.perf_counter() - started
+
+    table = _regex_table(list(spec.paths))
+    rng = random.Random(0)
+    requests = [
+        f"/resource{rng.randrange(paths)}/{rng.randrange(1000)}/items/x"
+        for _ in range(2_000)
+    ]
+
+    started = time.perf_counter()
+    for path in requests:
+        router.match("get", f"https://api.example.com/v1{path}")
+    trie = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for path in requests:
+        _scan(table, path)
+    scan = time.perf_counter() - started
+
+    per_request = 1e6 / len(requests)
+    print(f"{paths} paths, router built in {built:.3f}s")
+    print(f"trie  {trie * per_request:9.2f} us/request")
+    print(f"regex {scan * per_request:9.2f} us/request")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,106 @@
+"""Compare parsing a whole large spec with parsing a slice of it.
+
+The spec is a monolith of thousands of operations in 100 tags, each
+returning its own schema that references a schema shared by its tag,
+plus a common error response; the slice is the operations of one tag,
+as a per-team gateway would load them.
+
+Run with ``uv run python benchmarks/bench_selection.py [operations] [repeat]``.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from openapi_parser import parse
+
+_TAGS = 100
+
+
+def _spec(operations: int) -> dict[str, Any]:
+    """Build a spec with *operations* operations and as many schemas."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "monolith", "version": "1.0.0"},
+        "paths": {
+            f"/items{i}": {
+                "get": {
+                    "operationId": f"getItem{i}",
+                    "tags": [f"Team{i % _TAGS}"],
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": f"#/components/schemas/S{i}"},
+                                },
+                            },
+                        },
+                        "default": {"$ref": "#/components/responses/Error"},
+                    },
+                },
+            }
+            for i in range(operations)
+        },
+        "components": {
+            "responses": {
+                "Error": {
+                    "description": "Error",
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/Error"},
+                        },
+                    },
+                },
+            },
+            "schemas": {
+                "Error": {"type": "object", "properties": {"code": {"type": "string"}}},
+                **{f"Team{t}": {"type": "object"} for t in range(_TAGS)},
+                **{
+                    f"S{i}": {
+                        "type": "object",
+                        "properties": {
+                            **{
+                                f"field{j}": {"type": "string", "maxLength": j + 1}
+                                for j in range(10)
+                            },
+                            "team": {"$ref": f"#/components/schemas/Team{i % _TAGS}"},
+                        },
+                    }
+                    for i in range(operations)
+                },
+            },
+        },
+    }
+
+
+def _measure(text: str, repeat: int, **selection: Any) -> tuple[float, float]:
+    """Return the best parse time and the peak memory of one parse."""
+    best = float("inf")
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse(spec_string=text, **selection)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    parse(spec_string=text, **selection)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def main(operations: int = 4_000, repeat: int = 3) -> None:
+    """Parse the whole spec and one tag of it, and report both."""
+    text = json.dumps(_spec(operations))
+
+    for label, selection in (("full", {}), ("one tag", {"include_tags": ["Team0"]})):
+        best, peak = _measure(text, repeat, **selection)
+        print(f"{label:>8}: {best:7.3f}s  peak {peak / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
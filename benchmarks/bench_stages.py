@@ -0,0 +1,383 @@
+"""Time every parsing stage on synthetic specs and keep results per commit.
+
+Each scenario is written to disk and run through the stages of
+``parse()`` one at a time: loading, Swagger 2.0 normalization, ``$ref``
+resolution and validation. A stage is timed as the best of *repeat*
+runs and its peak memory is traced in one extra run. Results go to
+``benchmarks/results/<git rev>-x<scale>.json`` and are compared with
+the most recent earlier results of the same scale, so regressions
+between commits show up as a percentage.
+
+Run with ``uv run python benchmarks/bench_stages.py [scale] [repeat]``.
+"""
+
+import copy
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from openapi_parser.models.v2_0 import normalize_swagger_v2
+from openapi_parser.parser import (
+    _VERSION_SPEC_MAP,
+    _detect_version,
+    _load_raw,
+    _validate_model,
+)
+from openapi_parser.resolver import resolve
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# file name -> document, the root document being "main.json"
+Documents = dict[str, dict[str, Any]]
+
+
+def _response(schema: dict[str, Any]) -> dict[str, Any]:
+    """Build a 200 response returning *schema* as JSON."""
+    return {
+        "200": {
+            "description": "OK",
+            "content": {"application/json": {"schema": schema}},
+        },
+    }
+
+
+def _openapi(
+    paths: dict[str, Any], schemas: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Wrap *paths* and component *schemas* into an OpenAPI 3.0 document."""
+    spec: dict[str, Any] = {
+        "openapi": "3.0.3",
+        "info": {"title": "bench", "version": "1.0.0"},
+        "paths": paths,
+    }
+
+    if schemas is not None:
+        spec["components"] = {"schemas": schemas}
+
+    return spec
+
+
+def _object(fields: int) -> dict[str, Any]:
+    """Build an object schema with *fields* string properties."""
+    return {
+        "type": "object",
+        "properties": {
+            f"field{j}": {"type": "string", "maxLength": j + 1} for j in range(fields)
+        },
+    }
+
+
+def _paths(scale: int) -> Documents:
+    """Many operations over a few shared component schemas."""
+    count = 1_000 * scale
+    schemas = {f"S{i}": _object(10) for i in range(count // 10)}
+    paths = {
+        f"/items{i}/{{id}}": {
+            "parameters": [{"name": "id", "in": "path", "required": True}],
+            "get": {
+                "operationId": f"getItem{i}",
+                "responses": _response({"$ref": f"#/components/schemas/S{i // 10}"}),
+            },
+        }
+        for i in range(count)
+    }
+
+    return {"main.json": _openapi(paths, schemas)}
+
+
+def _schemas(scale: int) -> Documents:
+    """Many component schemas in short chains of ``allOf`` references."""
+    count = 2_000 * scale
+    schemas = {
+        f"S{i}": {
+            **_object(5),
+            "x-index": i,
+            "allOf": [{"$ref": f"#/components/schemas/S{i + 1}"}]
+            if (i + 1) % 10
+            else [],
+        }
+        for i in range(count)
+    }
+
+    return {"main.json": _openapi({}, schemas)}
+
+
+def _deep(scale: int) -> Documents:
+    """Inline schemas nested many levels deep."""
+    schemas = {}
+
+    for i in range(20 * scale):
+        node: dict[str, Any] = {"type": "string"}
+
+        for level in range(50):
+            node = {"type": "object", "properties": {f"level{level}": node}}
+
+        schemas[f"Deep{i}"] = node
+
+    return {"main.json": _openapi({}, schemas)}
+
+
+def _fanout(scale: int) -> Documents:
+    """Thousands of ``$ref`` sites pointing at one schema."""
+    count = 200 * scale
+    schemas: dict[str, Any] = {"Shared": _object(20)}
+    schemas.update(
+        {
+            f"User{i}": {
+                "type": "object",
+                "properties": {
+                    f"ref{j}": {"$ref": "#/components/schemas/Shared"}
+                    for j in range(20)
+                },
+            }
+            for i in range(count)
+        }
+    )
+
+    return {"main.json": _openapi({}, schemas)}
+
+
+def _circular(scale: int) -> Documents:
+    """Self-referencing trees and small rings of mutually referencing schemas."""
+    count = 500 * scale
+    schemas = {
+        f"Node{i}": {
+            "type": "object",
+            "properties": {
+                "children": {
+                    "type": "array",
+                    "items": {"$ref": f"#/components/schemas/Node{i}"},
+                },
+                "next": {
+                    "$ref": f"#/components/schemas/Node{i // 5 * 5 + (i + 1) % 5}"
+                },
+            },
+        }
+        for i in range(count)
+    }
+
+    return {"main.json": _openapi({}, schemas)}
+
+
+def _external(scale: int) -> Documents:
+    """Operations referencing schemas spread over many external files."""
+    files = 50 * scale
+    documents: Documents = {
+        f"schemas{i}.json": {f"S{j}": _object(10) for j in range(20)}
+        for i in range(files)
+    }
+    paths = {
+        f"/items{i}": {
+            "get": {
+                "responses": _response({"$ref": f"schemas{i % files}.json#/S{i % 20}"}),
+            },
+        }
+        for i in range(20 * files)
+    }
+    documents["main.json"] = _openapi(paths)
+
+    return documents
+
+
+def _swagger(scale: int) -> Documents:
+    """A Swagger 2.0 spec with body parameters and shared definitions."""
+    count = 1_000 * scale
+    spec = {
+        "swagger": "2.0",
+        "info": {"title": "bench", "version": "1.0.0"},
+        "consumes": ["application/json"],
+        "produces": ["application/json"],
+        "definitions": {f"D{i}": _object(10) for i in range(count // 10)},
+        "paths": {
+            f"/items{i}": {
+                "post": {
+                    "parameters": [
+                        {"name": "limit", "in": "query", "type": "integer"},
+                        {
+                            "name": "body",
+                            "in": "body",
+                            "schema": {"$ref": f"#/definitions/D{i // 10}"},
+                        },
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "schema": {"$ref": f"#/definitions/D{i // 10}"},
+                        },
+                    },
+                },
+            }
+            for i in range(count)
+        },
+    }
+
+    return {"main.json": spec}
+
+
+SCENARIOS: dict[str, Callable[[int], Documents]] = {
+    "paths": _paths,
+    "schemas": _schemas,
+    "deep": _deep,
+    "fanout": _fanout,
+    "circular": _circular,
+    "external": _external,
+    "swagger": _swagger,
+}
+
+
+def _measure(
+    stage: Callable[[Any], Any], value: Any, repeat: int
+) -> tuple[Any, float, float]:
+    """Run *stage* on copies of *value*; return its result, best seconds and peak MB.
+
+    Every run gets a fresh deep copy, since stages may change their input.
+    """
+    best = float("inf")
+    result = None
+
+    for _ in range(repeat):
+        argument = copy.deepcopy(value)
+        started = time.perf_counter()
+        result = stage(argument)
+        best = min(best, time.perf_counter() - started)
+
+    argument = copy.deepcopy(value)
+    tracemalloc.start()
+    stage(argument)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, best, peak / 1e6
+
+
+def _run(location: str, repeat: int) -> dict[str, dict[str, float]]:
+    """Time the stages of parsing the spec at *location*."""
+    timings: dict[str, dict[str, float]] = {}
+
+    def _record(name: str, stage: Callable[[Any], Any], value: Any) -> Any:
+        result, seconds, peak = _measure(stage, value, repeat)
+        timings[name] = {"seconds": seconds, "peak_mb": peak}
+        return result
+
+    raw = _record("load", lambda _: _load_raw(location, None), None)
+    version = _detect_version(raw)
+
+    if version == "2.0":
+        raw = _record("normalize", normalize_swagger_v2, raw)
+
+    resolved = _record("resolve", lambda r: resolve(r, location, version), raw)
+    _record(
+        "validate",
+        lambda r: _validate_model(_VERSION_SPEC_MAP[version], r, version),
+        resolved,
+    )
+
+    return timings
+
+
+def _git_rev() -> str:
+    """Return the short commit hash, marked ``-dirty`` with local changes."""
+    try:
+        rev = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "diff", "--quiet", "HEAD"], check=False
+        ).returncode
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return f"{rev}-dirty" if dirty else rev
+
+
+def _previous(scale: int, rev: str) -> dict[str, Any] | None:
+    """Load the newest stored results of *scale* from another revision."""
+    if not os.path.isdir(RESULTS_DIR):
+        return None
+
+    candidates = []
+
+    for name in os.listdir(RESULTS_DIR):
+        path = os.path.join(RESULTS_DIR, name)
+
+        with open(path) as f:
+            results = json.load(f)
+
+        if results["scale"] == scale and results["rev"] != rev:
+            candidates.append((os.path.getmtime(path), results))
+
+    return max(candidates, key=lambda c: c[0])[1] if candidates else None
+
+
+def _store(results: dict[str, Any]) -> str:
+    """Write *results* to the results directory and return the file path."""
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"{results['rev']}-x{results['scale']}.json")
+
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+    return path
+
+
+def main(scale: int = 1, repeat: int = 5) -> None:
+    """Run every scenario, print the stage timings and store them."""
+    rev = _git_rev()
+    scenarios: dict[str, dict[str, dict[str, float]]] = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, generate in SCENARIOS.items():
+            scenario_dir = os.path.join(directory, name)
+            os.makedirs(scenario_dir)
+
+            for file_name, document in generate(scale).items():
+                with open(os.path.join(scenario_dir, file_name), "w") as f:
+                    json.dump(document, f)
+
+            location = os.path.join(scenario_dir, "main.json")
+            scenarios[name] = _run(location, repeat)
+
+    previous = _previous(scale, rev)
+    baseline = previous["scenarios"] if previous else {}
+    compared = f"vs {previous['rev']}" if previous else ""
+
+    print(f"rev {rev}, scale {scale}, best of {repeat}")
+    print(f"{'scenario':<10} {'stage':<10} {'seconds':>9} {'peak MB':>9}  {compared}")
+
+    for name, stages in scenarios.items():
+        for stage, result in stages.items():
+            before = baseline.get(name, {}).get(stage)
+            change = (
+                f"{(result['seconds'] / before['seconds'] - 1) * 100:+6.1f}%"
+                if before
+                else ""
+            )
+            print(
+                f"{name:<10} {stage:<10} {result['seconds']:9.4f} "
+                f"{result['peak_mb']:9.1f}  {change}"
+            )
+
+    path = _store(
+        {
+            "rev": rev,
+            "scale": scale,
+            "repeat": repeat,
+            "python": platform.python_version(),
+            "scenarios": scenarios,
+        }
+    )
+    print(f"results written to {path}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,114 @@
+"""Compare loading a large spec file from text with streaming it.
+
+The text path reads the whole file into a ``str`` before decoding it;
+``load_stream`` decodes the memory-mapped file. Peak memory is what
+``tracemalloc`` sees, so mapped file pages, which the OS can drop at
+will, are not counted.
+
+Run with ``uv run python benchmarks/bench_stream.py [paths] [repeat]``.
+"""
+
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import yaml
+
+from openapi_parser.loader import JSON_BACKEND, YAML_BACKEND, load_document, load_stream
+
+
+def _spec(paths: int) -> dict[str, Any]:
+    """Build a spec with *paths* path items with inline schemas."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "generated", "version": "1.0.0"},
+        "paths": {
+            f"/items{i}/{{id}}": {
+                "get": {
+                    "operationId": f"getItem{i}",
+                    "description": "Returns the item with the given id. " * 4,
+                    "parameters": [{"name": "id", "in": "path", "required": True}],
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {
+                                            f"field{j}": {"type": "string"}
+                                            for j in range(10)
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            }
+            for i in range(paths)
+        },
+    }
+
+
+def _from_text(path: str) -> Any:
+    with open(path) as f:
+        return load_document(f.read(), path)
+
+
+def _from_stream(path: str) -> Any:
+    with open(path, "rb") as f:
+        return load_stream(f, path)
+
+
+def _measure(load: Callable[[str], Any], path: str, repeat: int) -> tuple[float, float]:
+    """Return the best load time and the peak memory of one load."""
+    best = float("inf")
+
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        load(path)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    load(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def main(paths: int = 20_000, repeat: int = 3) -> None:
+    """Write the spec as JSON and YAML, and load each both ways."""
+    print(f"yaml: {YAML_BACKEND}, json: {JSON_BACKEND}, paths: {paths}")
+    spec = _spec(paths)
+
+    with tempfile.TemporaryDirectory() as directory:
+        files = {
+            "spec.json": json.dumps(spec),
+            "spec.yaml": yaml.dump(spec, Dumper=yaml.CSafeDumper, sort_keys=False),
+        }
+
+        for name, text in files.items():
+            path = os.path.join(directory, name)
+
+            with open(path, "w") as f:
+                f.write(text)
+
+            for label, load in (("text", _from_text), ("stream", _from_stream)):
+                best, peak = _measure(load, path, repeat)
+                print(
+                    f"{name} {len(text) / 1e6:6.1f} MB  {label:>6}: "
+                    f"{best:7.3f}s  peak {peak / 1e6:8.1f} MB"
+                )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,125 @@
+"""Compare iterating operations of a parsed spec with ``iter_operations``.
+
+Each path item carries inline schemas and shares a few components, as
+generated specs do. ``parse()`` holds every model at once, while
+``iter_operations`` holds the components and one path item.
+
+Run with ``uv run python benchmarks/bench_streaming.py [paths] [repeat]``.
+"""
+
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from openapi_parser import iter_operations, parse
+from openapi_parser.models.index import iter_path_item_operations
+
+
+def _spec(paths: int) -> dict[str, Any]:
+    """Build a spec with *paths* path items of two operations each."""
+    operation = {
+        "responses": {
+            "200": {
+                "description": "OK",
+                "content": {
+                    "application/json": {
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                **{
+                                    f"field{j}": {"type": "string", "maxLength": 64}
+                                    for j in range(10)
+                                },
+                                "owner": {"$ref": "#/components/schemas/Owner"},
+                            },
+                        },
+                    },
+                },
+            },
+            "default": {"$ref": "#/components/responses/Error"},
+        },
+    }
+
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "generated", "version": "1.0.0"},
+        "paths": {
+            f"/items{i}": {
+                "get": {"operationId": f"getItem{i}", **operation},
+                "put": {"operationId": f"putItem{i}", **operation},
+            }
+            for i in range(paths)
+        },
+        "components": {
+            "responses": {
+                "Error": {
+                    "description": "Error",
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/Error"},
+                        },
+                    },
+                },
+            },
+            "schemas": {
+                "Error": {"type": "object", "properties": {"code": {"type": "string"}}},
+                "Owner": {"type": "object", "properties": {"name": {"type": "string"}}},
+            },
+        },
+    }
+
+
+def _parsed(path: str) -> int:
+    spec = parse(path)
+
+    return sum(
+        1
+        for path_item in spec.paths.values()
+        for _ in iter_path_item_operations(path_item)
+    )
+
+
+def _streamed(path: str) -> int:
+    return sum(1 for _ in iter_operations(path))
+
+
+def _measure(run: Callable[[str], int], path: str, repeat: int) -> tuple[float, float]:
+    """Return the best time and the peak memory of one run."""
+    best = float("inf")
+
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        run(path)
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    run(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def main(paths: int = 5_000, repeat: int = 3) -> None:
+    """Count the operations of one spec both ways and report each."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "spec.json")
+
+        with open(path, "w") as f:
+            json.dump(_spec(paths), f)
+
+        for label, run in (("parse", _parsed), ("iterate", _streamed)):
+            best, peak = _measure(run, path, repeat)
+            print(f"{label:>8}: {best:7.3f}s  peak {peak / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,130 @@
+"""Time Swagger 2.0 normalization on a large synthetic spec.
+
+The spec mimics big cloud-provider Swagger files: thousands of
+operations with body, formData and shared parameters, vendor
+extensions, and definitions referencing each other.
+
+Run with ``uv run python benchmarks/bench_swagger.py [operations] [repeat]``.
+"""
+
+import copy
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from openapi_parser.models.v2_0 import normalize_swagger_v2
+
+
+def _definition(index: int, definitions: int) -> dict[str, Any]:
+    """Build a model with scalar fields and references to other models."""
+    return {
+        "type": "object",
+        "description": f"Resource {index}",
+        "required": ["id"],
+        "properties": {
+            "id": {"type": "string", "readOnly": True},
+            **{f"field{j}": {"type": "string", "maxLength": 64} for j in range(12)},
+            "owner": {"$ref": f"#/definitions/Model{(index + 1) % definitions}"},
+            "items": {
+                "type": "array",
+                "items": {"$ref": f"#/definitions/Model{(index + 2) % definitions}"},
+            },
+        },
+        "x-ms-azure-resource": index % 2 == 0,
+    }
+
+
+def _operation(index: int, method: str) -> dict[str, Any]:
+    """Build an operation of the given HTTP *method*."""
+    parameters: list[dict[str, Any]] = [
+        {"$ref": "#/parameters/ApiVersion"},
+        {"name": "id", "in": "path", "required": True, "type": "string"},
+    ]
+
+    if method == "put":
+        parameters.append(
+            {
+                "name": "body",
+                "in": "body",
+                "required": True,
+                "schema": {"$ref": f"#/definitions/Model{index}"},
+            },
+        )
+    elif method == "post":
+        parameters.extend(
+            {"name": f"form{j}", "in": "formData", "type": "string"} for j in range(3)
+        )
+
+    return {
+        "operationId": f"{method}Resource{index}",
+        "tags": [f"Group{index % 20}"],
+        "parameters": parameters,
+        "responses": {
+            "200": {
+                "description": "OK",
+                "schema": {"$ref": f"#/definitions/Model{index}"},
+            },
+            "default": {"$ref": "#/responses/Error"},
+        },
+        "x-ms-long-running-operation": method != "get",
+    }
+
+
+def _spec(operations: int) -> dict[str, Any]:
+    """Build a Swagger 2.0 spec with about *operations* operations."""
+    paths = operations // 3
+    definitions = max(paths, 3)
+
+    return {
+        "swagger": "2.0",
+        "info": {"title": "Cloud Resources", "version": "2024-01-01"},
+        "host": "management.example.com",
+        "schemes": ["https"],
+        "consumes": ["application/json"],
+        "produces": ["application/json"],
+        "securityDefinitions": {"oauth": {"type": "oauth2", "flow": "implicit"}},
+        "parameters": {
+            "ApiVersion": {"name": "api-version", "in": "query", "type": "string"},
+        },
+        "responses": {
+            "Error": {
+                "description": "Error",
+                "schema": {"$ref": "#/definitions/Error"},
+            },
+        },
+        "definitions": {
+            "Error": {"type": "object", "properties": {"code": {"type": "string"}}},
+            **{f"Model{i}": _definition(i, definitions) for i in range(definitions)},
+        },
+        "paths": {
+            f"/resources{i}/{{id}}": {
+                method: _operation(i, method) for method in ("get", "put", "post")
+            }
+            for i in range(paths)
+        },
+    }
+
+
+def main(operations: int = 15_000, repeat: int = 5) -> None:
+    """Normalize copies of one spec and report the best time and peak memory."""
+    spec = _spec(operations)
+    best = float("inf")
+
+    for _ in range(repeat):
+        data = copy.deepcopy(spec)
+        started = time.perf_counter()
+        normalize_swagger_v2(data)
+        best = min(best, time.perf_counter() - started)
+
+    data = copy.deepcopy(spec)
+    tracemalloc.start()
+    normalize_swagger_v2(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{operations} operations: {best:7.3f}s  peak {peak / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -1,8 +1,21 @@
 """OpenAPI v3 specification parser."""
 
 from openapi_parser import enumeration
+from openapi_parser.batch import parse_many
 from openapi_parser.errors import ParserError
+from openapi_parser.incremental import IncrementalParser
 from openapi_parser.models import v3_0, v3_1
-from openapi_parser.parser import parse
+from openapi_parser.parser import parse, parse_async
+from openapi_parser.streaming import iter_operations
 
-__all__ = ["parse", "ParserError", "enumeration", "v3_0", "v3_1"]
+__all__ = [
+    "parse",
+    "parse_async",
+    "parse_many",
+    "iter_operations",
+    "IncrementalParser",
+    "ParserError",
+    "enumeration",
+    "v3_0",
+    "v3_1",
+]
@@ -0,0 +1,172 @@
+"""Parse many specifications in parallel worker processes."""
+
+import multiprocessing
+import os
+from collections.abc import Callable, Generator, Iterable, MutableSequence
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import TypeAlias
+from urllib.parse import urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+from openapi_parser import resolver
+from openapi_parser.errors import ParserError
+from openapi_parser.fetcher import Fetcher, HTTPFetcher, MemoizingFetcher
+from openapi_parser.parser import Specification, parse
+
+BatchResult: TypeAlias = tuple[str, Specification | ParserError]
+
+# Fresh pools started for specs queued on a pool that broke.
+_MAX_RESTARTS = 3
+
+# Fetcher shared by every parse of one worker process.
+_worker_fetcher: Fetcher | None = None
+
+# States of the specs in shared memory, set by the workers parsing them.
+_worker_states: MutableSequence[int] | None = None
+
+# Spec states: queued, being parsed, parsed (its result may still be lost).
+_QUEUED, _RUNNING, _DONE = 0, 1, 2
+
+
+class _ProxyAwareFetcher:
+    """Fetch through ``urlopen`` where a proxy applies, like :func:`parse`.
+
+    :class:`HTTPFetcher` ignores ``http_proxy``, ``https_proxy`` and
+    ``no_proxy``, so hosts those send through a proxy are read the way
+    ``parse()`` reads them without a fetcher.
+    """
+
+    def __init__(self) -> None:
+        """Read the proxy settings of the environment."""
+        self._direct = HTTPFetcher()
+        self._proxies = getproxies()
+
+    def fetch(self, url: str) -> tuple[str, str | None]:
+        """Return the body of *url* and its ``Content-Type``."""
+        parts = urlsplit(url)
+
+        if parts.scheme in self._proxies and not proxy_bypass(parts.hostname or ""):
+            return resolver._read_uri(url)
+
+        return self._direct.fetch(url)
+
+
+def _default_fetcher() -> Fetcher:
+    """Remember remote documents for the lifetime of a worker."""
+    return MemoizingFetcher(_ProxyAwareFetcher())
+
+
+def _init_worker(
+    fetcher_factory: Callable[[], Fetcher],
+    states: MutableSequence[int],
+) -> None:
+    """Create the fetcher of a freshly started worker process."""
+    global _worker_fetcher, _worker_states  # one of each per worker process
+    _worker_fetcher = fetcher_factory()
+    _worker_states = states
+
+
+def _parse_in_worker(
+    index: int,
+    uri: str,
+    cache_dir: str | None,
+) -> Specification | ParserError:
+    """Parse spec *index*, recording in shared memory while it runs."""
+    if _worker_states is not None:
+        _worker_states[index] = _RUNNING
+
+    try:
+        return _parse_spec(uri, cache_dir)
+    finally:
+        if _worker_states is not None:
+            _worker_states[index] = _DONE
+
+
+def _parse_spec(uri: str, cache_dir: str | None) -> Specification | ParserError:
+    """Parse one spec, returning failures instead of raising them."""
+    try:
+        return parse(uri, cache_dir=cache_dir, fetcher=_worker_fetcher)
+    except ParserError as e:
+        return e
+    except Exception as e:  # noqa: BLE001  # isolate every failure to its spec
+        return ParserError(f"Failed to parse {uri}: {e!r}")
+
+
+def parse_many(
+    uris: Iterable[str | os.PathLike[str]],
+    workers: int | None = None,
+    cache_dir: str | os.PathLike[str] | None = None,
+    fetcher_factory: Callable[[], Fetcher] = _default_fetcher,
+) -> Generator[BatchResult, None, None]:
+    """Parse every spec in *uris* on a pool of worker processes.
+
+    Results are yielded as ``(uri, Specification | ParserError)`` pairs
+    in completion order, so a failing spec never affects the others. A
+    worker that dies takes the specs then being parsed down as errors;
+    specs still queued are parsed on a fresh pool instead, up to three
+    times.
+
+    Parameters
+    ----------
+    uris : iterable of str
+        Locations of the specs, as accepted by :func:`parse`.
+    workers : int, optional
+        Number of processes; defaults to the number of CPUs.
+    cache_dir : str, optional
+        Persistent parse cache shared by all workers, as in :func:`parse`.
+    fetcher_factory : callable, optional
+        Picklable callable creating the fetcher of each worker. The
+        default remembers remote documents, so ``$ref`` targets shared
+        between specs are downloaded once per worker over pooled
+        connections, and honours proxy environment variables.
+
+    Yields:
+    ------
+    tuple
+        The location of a spec, as a string, and its parse result.
+    """
+    locations = [os.fspath(uri) for uri in uris]
+    directory = os.fspath(cache_dir) if cache_dir is not None else None
+
+    if not locations:
+        return
+
+    states = multiprocessing.RawArray("b", len(locations))
+    pending = dict(enumerate(locations))
+
+    for restarts in range(_MAX_RESTARTS + 1):
+        pool = ProcessPoolExecutor(
+            max_workers=min(workers or os.cpu_count() or 1, len(pending)),
+            initializer=_init_worker,
+            initargs=(fetcher_factory, states),
+        )
+
+        try:
+            futures: dict[Future[Specification | ParserError], int] = {
+                pool.submit(_parse_in_worker, index, location, directory): index
+                for index, location in pending.items()
+            }
+
+            for future in as_completed(futures):
+                index = futures[future]
+                result: Specification | ParserError
+
+                try:
+                    result = future.result()
+                except BrokenProcessPool as e:
+                    # only a spec being parsed may have killed the worker;
+                    # queued ones and lost results are retried on a fresh pool
+                    if states[index] != _RUNNING and restarts < _MAX_RESTARTS:
+                        continue
+
+                    result = ParserError(f"Worker process failed: {e}")
+
+                del pending[index]
+                yield locations[index], result
+        finally:
+            # don't parse the rest if the caller stops iterating early
+            pool.shutdown(cancel_futures=True)
+
+        if not pending:
+            return
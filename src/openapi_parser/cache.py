@@ -0,0 +1,313 @@
+"""Persistent on-disk caches of parsed specifications and remote documents."""
+
+import contextlib
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from email.message import Message
+from email.utils import parsedate_to_datetime
+from importlib.metadata import PackageNotFoundError, version
+from typing import IO, Any
+from urllib.error import HTTPError
+
+import pydantic
+
+from openapi_parser.fetcher import Fetcher, HTTPFetcher
+from openapi_parser.resolver import _read_uri
+
+# Bump whenever the pickled entry layout changes.
+_FORMAT_VERSION = 1
+
+
+def _package_version() -> str:
+    """Return the installed openapi3-parser version, if known."""
+    try:
+        return version("openapi3-parser")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+_ENVIRONMENT = (
+    f"{_FORMAT_VERSION}:{_package_version()}:{pydantic.VERSION}:"
+    f"{sys.version_info.major}.{sys.version_info.minor}"
+)
+
+
+def content_digest(text: str) -> str:
+    """Return the hex SHA-256 digest of a document's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# Errors of content that can't be pickled; they only miss the cache.
+_UNPICKLABLE_ERRORS = (pickle.PicklingError, RecursionError, TypeError, AttributeError)
+
+
+def _write_atomic(
+    directory: str, path: str, write: Callable[[IO[bytes]], object]
+) -> None:
+    """Write *path* inside *directory* through *write*, replacing it atomically.
+
+    Failures to write or pickle are ignored; the caches are best effort.
+    The temporary file is removed on any failure, including those that
+    are re-raised.
+    """
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    except OSError:
+        return
+
+    written = False
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+
+        os.replace(tmp_path, path)
+        written = True
+    except (OSError, *_UNPICKLABLE_ERRORS):
+        pass
+    finally:
+        if not written:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+
+class SpecCache:
+    """Content-addressed store of validated specifications.
+
+    Entries are keyed by the hash of the root document, its location
+    and the library versions. Each entry records the hash of every
+    external ``$ref`` document read while resolving it, and is only
+    served while all of those documents still hash the same.
+
+    Entries are pickled, so *directory* must not be writable by
+    untrusted users.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        fetcher: Fetcher | None = None,
+    ) -> None:
+        """Use *directory* for cache entries, creating it on first write.
+
+        Remote documents are re-read with *fetcher* to check freshness.
+        """
+        self.directory = os.fspath(directory)
+        self.fetcher = fetcher
+
+    def key(self, text: str, location: str | None, variant: str = "") -> str:
+        """Return the cache key for a root document read from *location*.
+
+        *variant* keeps apart differently parsed specs of the same
+        document, such as selections of its operations.
+        """
+        digest = hashlib.sha256()
+        parts = [_ENVIRONMENT, location or "", text]
+
+        # without a variant, keys stay those of earlier releases
+        if variant:
+            parts.append(variant)
+
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    def load(self, key: str) -> Any | None:
+        """Return the cached specification for *key*, or ``None`` on a miss.
+
+        A stale, unreadable or corrupt entry counts as a miss.
+        """
+        try:
+            with open(self._path(key), "rb") as f:
+                documents: dict[str, str] = pickle.load(f)
+
+                if not self._is_fresh(documents):
+                    return None
+
+                return pickle.load(f)
+        except (  # unreadable or corrupt entries are plain misses
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ImportError,
+            TypeError,
+            ValueError,
+        ):
+            return None
+
+    def _is_fresh(self, documents: dict[str, str]) -> bool:
+        """Check that every recorded external document is unchanged."""
+        for uri, digest in documents.items():
+            try:
+                text, _ = _read_uri(uri, self.fetcher)
+            except OSError:
+                return False
+
+            if content_digest(text) != digest:
+                return False
+
+        return True
+
+    def store(self, key: str, documents: dict[str, str], spec: Any) -> None:
+        """Write *spec* and the digests of its external *documents* atomically.
+
+        Failures to write are ignored; the cache is best effort.
+        """
+
+        def _write(f: IO[bytes]) -> None:
+            # the manifest goes first so freshness checks skip the spec
+            pickle.dump(documents, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(spec, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        _write_atomic(self.directory, self._path(key), _write)
+
+
+def _freshness_lifetime(headers: Message) -> float:
+    """Return how many seconds a response may be served without revalidation."""
+    directives = {
+        name.strip().lower(): value.strip().strip('"')
+        for name, _, value in (
+            part.partition("=")
+            for part in (headers.get("Cache-Control") or "").split(",")
+        )
+    }
+
+    if "no-cache" in directives or "no-store" in directives:
+        return 0.0
+
+    try:
+        age = float(headers.get("Age") or 0)
+    except ValueError:
+        age = 0.0
+
+    for name in ("s-maxage", "max-age"):
+        if name in directives:
+            try:
+                return max(float(directives[name]) - age, 0.0)
+            except ValueError:
+                return 0.0
+
+    expires, date = headers.get("Expires"), headers.get("Date")
+
+    if expires and date:
+        try:
+            lifetime = parsedate_to_datetime(expires) - parsedate_to_datetime(date)
+        except (TypeError, ValueError):
+            return 0.0
+
+        return max(lifetime.total_seconds() - age, 0.0)
+
+    return 0.0
+
+
+class HTTPCache:
+    """Fetcher keeping remote documents on disk and revalidating them.
+
+    Responses are stored with their ``ETag`` and ``Last-Modified``
+    validators. While an entry is fresh according to ``Cache-Control``
+    (or ``Expires``) it is served without any request; afterwards it is
+    revalidated with ``If-None-Match``/``If-Modified-Since``, and a
+    ``304 Not Modified`` serves the stored body without a transfer.
+    Combined with ``parse(cache_dir=...)`` an unchanged remote spec is
+    then neither downloaded nor parsed again.
+
+    With *offline* set, stored entries are served regardless of their
+    age and nothing is requested; uncached documents fail with
+    :class:`OSError`.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        fetcher: HTTPFetcher | None = None,
+        offline: bool = False,
+    ) -> None:
+        """Store entries in *directory*, fetching through *fetcher*."""
+        self.directory = os.fspath(directory)
+        self.fetcher = fetcher or HTTPFetcher()
+        self.offline = offline
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def _load(self, url: str) -> dict[str, Any] | None:
+        """Return the stored entry for *url*, if any."""
+        try:
+            with open(self._path(url), "rb") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("url") != url:
+            return None
+
+        return entry
+
+    def _store(self, entry: dict[str, Any]) -> None:
+        data = json.dumps(entry).encode("utf-8")
+        _write_atomic(self.directory, self._path(entry["url"]), lambda f: f.write(data))
+
+    def fetch(self, url: str) -> tuple[str, str | None]:
+        """Return the body of *url* and its ``Content-Type``, from disk if valid.
+
+        Raises:
+            urllib.error.HTTPError: On a non-successful status.
+            OSError: If the document cannot be retrieved, or is not
+                cached in offline mode.
+        """
+        entry = self._load(url)
+
+        if entry is not None and (self.offline or time.time() < entry["expires"]):
+            return entry["text"], entry["content_type"]
+
+        if self.offline:
+            raise OSError(f"Offline and not cached: {url}")
+
+        conditional: dict[str, str] = {}
+
+        if entry is not None:
+            if entry["etag"]:
+                conditional["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                conditional["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.fetcher.get(url, conditional)
+        cacheable = "no-store" not in (response.headers.get("Cache-Control") or "")
+        expires = time.time() + _freshness_lifetime(response.headers)
+
+        if response.status == 304 and entry is not None:
+            entry["expires"] = expires
+            self._store(entry)
+
+            return entry["text"], entry["content_type"]
+
+        if not 200 <= response.status < 300:
+            raise HTTPError(url, response.status, "", response.headers, None)
+
+        entry = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "expires": expires,
+            "content_type": response.headers.get("Content-Type"),
+            "text": response.text(),
+        }
+
+        if cacheable:
+            self._store(entry)
+
+        return entry["text"], entry["content_type"]
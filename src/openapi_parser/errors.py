@@ -1,12 +1,28 @@
 """Custom exceptions for OpenAPI parsing errors."""
 
+from typing import Any
+
 from pydantic import ValidationError
 from pydantic_core import ErrorDetails
 
 
+def _restore_parser_error(
+    cls: type["ParserError"],
+    args: tuple[Any, ...],
+    errors: list[ErrorDetails],
+) -> "ParserError":
+    """Rebuild a pickled :class:`ParserError` with its validation errors."""
+    error = cls(*args)
+    error._errors = errors
+
+    return error
+
+
 class ParserError(Exception):
     """Wraps all parsing/validation errors with context."""
 
+    _errors: list[ErrorDetails] | None = None
+
     def errors(self) -> list[ErrorDetails]:
         """Return validation errors if available.
 
@@ -15,4 +31,11 @@ class ParserError(Exception):
         if isinstance(self.__cause__, ValidationError):
             return self.__cause__.errors()
 
-        return []
+        return list(self._errors or [])
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle along with the validation errors of the unpicklable cause.
+
+        Keeps :meth:`errors` working for errors sent across processes.
+        """
+        return _restore_parser_error, (type(self), self.args, self.errors())
@@ -0,0 +1,339 @@
+"""Pluggable fetching of remote specification documents."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import http.client
+import ssl
+import threading
+import time
+import zlib
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
+from email.message import Message
+from types import TracebackType
+from typing import TYPE_CHECKING, Protocol
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# Statuses that are followed to their ``Location``.
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+_HostKey = tuple[str, str, int | None]
+
+
+class Fetcher(Protocol):
+    """Retrieves the text of ``http://`` and ``https://`` documents.
+
+    Local files are always read directly; a fetcher is only consulted
+    for remote documents, the root one and every external ``$ref``.
+    Fetchers may be called from several threads at once.
+    """
+
+    def fetch(self, url: str) -> tuple[str, str | None]:
+        """Return the decoded body of *url* and its ``Content-Type``.
+
+        Raises:
+            OSError: If the document cannot be retrieved.
+        """
+        ...
+
+
+class MemoizingFetcher:
+    """Fetcher remembering every document retrieved through it.
+
+    Suited to batches of short-lived parses that share remote ``$ref``
+    targets: each URL is fetched once per instance, and never again.
+    """
+
+    def __init__(self, fetcher: Fetcher) -> None:
+        """Wrap *fetcher*."""
+        self.fetcher = fetcher
+        self._documents: dict[str, tuple[str, str | None]] = {}
+
+    def fetch(self, url: str) -> tuple[str, str | None]:
+        """Return the remembered document for *url*, fetching it on first use."""
+        document = self._documents.get(url)
+
+        if document is None:
+            document = self._documents[url] = self.fetcher.fetch(url)
+
+        return document
+
+
+class AsyncFetcher(Protocol):
+    """Asynchronous counterpart of :class:`Fetcher` for :func:`parse_async`.
+
+    ``fetch`` is awaited concurrently for independent documents.
+    """
+
+    async def fetch(self, url: str) -> tuple[str, str | None]:
+        """Return the decoded body of *url* and its ``Content-Type``.
+
+        Raises:
+            OSError: If the document cannot be retrieved.
+        """
+        ...
+
+
+class ThreadedFetcher:
+    """Adapt a blocking :class:`Fetcher` to :class:`AsyncFetcher`.
+
+    Each fetch runs in the default executor of the running loop, so an
+    :class:`HTTPFetcher` or :class:`~openapi_parser.cache.HTTPCache` can
+    be shared with :func:`~openapi_parser.parse_async`.
+    """
+
+    def __init__(self, fetcher: Fetcher) -> None:
+        """Wrap *fetcher*."""
+        self.fetcher = fetcher
+
+    async def fetch(self, url: str) -> tuple[str, str | None]:
+        """Fetch *url* with the wrapped fetcher in a worker thread."""
+        return await asyncio.to_thread(self.fetcher.fetch, url)
+
+
+def _decode_body(body: bytes, encoding: str | None) -> bytes:
+    """Undo a gzip or deflate ``Content-Encoding``."""
+    encoding = (encoding or "").strip().lower()
+
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(body)
+
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:  # raw deflate stream without a zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+
+    return body
+
+
+@dataclass(frozen=True, slots=True)
+class FetchResponse:
+    """A complete HTTP response, with its content encoding undone."""
+
+    url: str
+    status: int
+    headers: Message
+    body: bytes
+
+    def text(self) -> str:
+        """Return the body decoded with the charset of its ``Content-Type``."""
+        return self.body.decode(self.headers.get_content_charset() or "utf-8")
+
+
+class HTTPFetcher:
+    """Fetcher reusing keep-alive connections per host.
+
+    Idle connections are pooled per ``(scheme, host, port)`` and reused
+    by later requests, so a spec split across many files on one server
+    pays a single TCP/TLS handshake per concurrent request. Responses
+    compressed with gzip or deflate are decoded transparently.
+
+    Connection errors and *retry_statuses* are retried up to *retries*
+    times with exponential backoff starting at *backoff* seconds.
+    Unlike ``urllib``, proxy environment variables are not honoured.
+
+    The fetcher can be shared between parses and threads; call
+    :meth:`close` (or use it as a context manager) to drop idle
+    connections.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        retries: int = 2,
+        backoff: float = 0.2,
+        retry_statuses: Collection[int] = (429, 500, 502, 503, 504),
+        max_idle_per_host: int = 8,
+        max_redirects: int = 5,
+        headers: Mapping[str, str] | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        """Configure timeouts, retry policy and extra request headers."""
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_idle_per_host = max_idle_per_host
+        self.max_redirects = max_redirects
+        self.headers = {"Accept-Encoding": "gzip, deflate", **(headers or {})}
+        self.ssl_context = ssl_context
+        self._idle: dict[_HostKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        """Return the fetcher itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close idle connections."""
+        self.close()
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        with self._lock:
+            pools, self._idle = self._idle, {}
+
+        for pool in pools.values():
+            for connection in pool:
+                connection.close()
+
+    def fetch(self, url: str) -> tuple[str, str | None]:
+        """Return the decoded body of *url* and its ``Content-Type``.
+
+        Raises:
+            urllib.error.HTTPError: On a non-successful status.
+            OSError: If the document cannot be retrieved.
+        """
+        response = self.get(url)
+
+        if not 200 <= response.status < 300:
+            raise HTTPError(url, response.status, "", response.headers, None)
+
+        return response.text(), response.headers.get("Content-Type")
+
+    def get(self, url: str, headers: Mapping[str, str] | None = None) -> FetchResponse:
+        """Send a GET with extra *headers*, retrying and following redirects.
+
+        Unlike :meth:`fetch`, informational results such as
+        ``304 Not Modified`` are returned rather than raised.
+
+        Raises:
+            urllib.error.HTTPError: On an error status, once retries are
+                exhausted for retryable ones.
+            OSError: If the server cannot be reached.
+        """
+        request_headers = {**self.headers, **(headers or {})}
+
+        for attempt in range(self.retries + 1):
+            try:
+                return self._get_following_redirects(url, request_headers)
+            except HTTPError as e:
+                if e.code not in self.retry_statuses or attempt == self.retries:
+                    raise
+            except OSError:
+                if attempt == self.retries:
+                    raise
+            except http.client.HTTPException as e:
+                if attempt == self.retries:
+                    raise OSError(f"Invalid response from {url}: {e!r}") from e
+
+            time.sleep(self.backoff * 2**attempt)
+
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _get_following_redirects(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+    ) -> FetchResponse:
+        """Fetch *url*, following up to ``max_redirects`` redirects."""
+        for _ in range(self.max_redirects + 1):
+            response, body = self._request(url, headers)
+            location = response.getheader("Location")
+
+            if response.status in _REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                continue
+
+            if response.status >= 400:
+                raise HTTPError(
+                    url, response.status, response.reason, response.headers, None
+                )
+
+            return FetchResponse(
+                url=url,
+                status=response.status,
+                headers=response.headers,
+                body=_decode_body(body, response.getheader("Content-Encoding")),
+            )
+
+        raise OSError(f"Too many redirects fetching {url}")
+
+    def _request(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        """Send a GET over a pooled connection and read the full response.
+
+        A pooled connection the server has meanwhile closed is replaced
+        by a fresh one without counting as a retry.
+        """
+        parts = urlsplit(url)
+
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise OSError(f"Unsupported URL: {url}")
+
+        key: _HostKey = (parts.scheme, parts.hostname, parts.port)
+        target = parts.path or "/"
+
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        while True:
+            connection, reused = self._acquire(key)
+
+            try:
+                connection.request("GET", target, headers=dict(headers))
+                response = connection.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                connection.close()
+
+                if reused:
+                    continue
+
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(key, connection)
+
+            return response, body
+
+    def _acquire(self, key: _HostKey) -> tuple[http.client.HTTPConnection, bool]:
+        """Return an idle connection for *key*, or a new one."""
+        with self._lock:
+            pool = self._idle.get(key)
+
+            if pool:
+                return pool.pop(), True
+
+        scheme, host, port = key
+
+        if scheme == "https":
+            if self.ssl_context is None:
+                self.ssl_context = ssl.create_default_context()
+
+            return (
+                http.client.HTTPSConnection(
+                    host, port, timeout=self.timeout, context=self.ssl_context
+                ),
+                False,
+            )
+
+        return http.client.HTTPConnection(host, port, timeout=self.timeout), False
+
+    def _release(self, key: _HostKey, connection: http.client.HTTPConnection) -> None:
+        """Return *connection* to the idle pool, or close it if the pool is full."""
+        with self._lock:
+            pool = self._idle.setdefault(key, [])
+
+            if len(pool) < self.max_idle_per_host:
+                pool.append(connection)
+                return
+
+        connection.close()
@@ -0,0 +1,400 @@
+"""Re-parse an edited specification, revalidating only what changed."""
+
+import functools
+import hashlib
+import marshal
+import os
+from dataclasses import dataclass, field
+from typing import Any, TypeAlias
+from urllib.parse import unquote
+
+from pydantic import BaseModel
+from referencing import Resource
+from referencing.jsonschema import DRAFT202012
+
+from openapi_parser.errors import ParserError
+from openapi_parser.fetcher import Fetcher
+from openapi_parser.models.lazy import _model_map_fields, _optional_model
+from openapi_parser.models.mixins import ref_cache_scope
+from openapi_parser.parser import (
+    _VERSION_SPEC_MAP,
+    Specification,
+    _decode_raw,
+    _prepare_raw,
+    _validate_model,
+)
+from openapi_parser.resolver import (
+    _DRAFT_BY_VERSION,
+    _ROOT_URI,
+    OnRead,
+    _build_registry,
+    _iter_refs,
+    _make_retriever,
+    _prefetch,
+    _RefWalker,
+)
+
+# A part of the root document that is resolved and validated on its own:
+# ``("paths", path)``, ``("webhooks", name)`` or
+# ``("components", section, name)``.
+Unit: TypeAlias = tuple[str, ...]
+
+# Everything outside of the units, such as ``info`` and ``servers``.
+_REST: Unit = ()
+
+# Changes with any unit; depended on by ``$ref``s to a whole map of
+# units, e.g. ``#/components/schemas``.
+_ANY: Unit = ("*",)
+
+# Changes when external documents are read again.
+_EXTERNAL: Unit = ("external",)
+
+_UNIT_FIELDS = ("paths", "webhooks")
+
+
+def _digest(node: Any) -> bytes:
+    """Return a digest of the raw content of *node*.
+
+    Unlike ``==``, this tells ``1``, ``1.0`` and ``True`` apart. Values
+    that ``marshal`` cannot encode, such as YAML timestamps, are
+    digested by ``repr``.
+    """
+    try:
+        # version 2 writes no back-references, so sharing doesn't matter
+        data = marshal.dumps(node, 2)
+    except ValueError:
+        data = repr(node).encode("utf-8", "surrogatepass")
+
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+@functools.lru_cache(maxsize=65_536)
+def _ref_unit(ref: str) -> Unit:
+    """Return the unit a ``$ref`` points into."""
+    if not ref.startswith("#"):
+        return _EXTERNAL
+
+    parts = [
+        unquote(part).replace("~1", "/").replace("~0", "~")
+        for part in ref[2:].split("/")
+    ]
+
+    if parts[0] in _UNIT_FIELDS:
+        return (parts[0], parts[1]) if len(parts) > 1 else _ANY
+
+    if parts[0] == "components":
+        return ("components", parts[1], parts[2]) if len(parts) > 2 else _ANY
+
+    return _REST
+
+
+def _ref_targets(node: Any) -> set[Unit]:
+    """Collect the units referenced by ``$ref``s below *node*."""
+    return {_ref_unit(ref) for ref in _iter_refs(node)}
+
+
+def _section_fields(spec_model: type[BaseModel]) -> dict[str, str]:
+    """Map the ``components`` sections of *spec_model* to their field names."""
+    components_model = _optional_model(spec_model, "components")
+
+    if components_model is None:
+        return {}
+
+    return {
+        components_model.model_fields[name].alias or name: name
+        for name in _model_map_fields(components_model)
+    }
+
+
+def _split_units(
+    raw: dict[str, Any],
+    spec_model: type[BaseModel],
+    sections: dict[str, str],
+) -> tuple[dict[str, Any], dict[Unit, Any]]:
+    """Split *raw* into its units and the rest.
+
+    The rest is a shallow copy of *raw* in which the maps holding units
+    are left empty.
+    """
+    rest = dict(raw)
+    units: dict[Unit, Any] = {}
+
+    for name in _UNIT_FIELDS:
+        entries = raw.get(name)
+
+        if name in spec_model.model_fields and isinstance(entries, dict):
+            rest[name] = {}
+            units.update({(name, key): entry for key, entry in entries.items()})
+
+    components = raw.get("components")
+
+    if isinstance(components, dict):
+        rest["components"] = rest_components = dict(components)
+
+        for section in sections:
+            entries = components.get(section)
+
+            if isinstance(entries, dict):
+                rest_components[section] = {}
+                units.update(
+                    {
+                        ("components", section, name): entry
+                        for name, entry in entries.items()
+                    }
+                )
+
+    return rest, units
+
+
+def _dirty_closure(changed: set[Unit], deps: dict[Unit, set[Unit]]) -> set[Unit]:
+    """Return *changed* and every unit that references one of them, transitively."""
+    dependents: dict[Unit, list[Unit]] = {}
+
+    for unit, targets in deps.items():
+        for target in targets:
+            dependents.setdefault(target, []).append(unit)
+
+    dirty = set(changed)
+
+    if changed:
+        dirty.add(_ANY)
+
+    stack = list(dirty)
+
+    while stack:
+        for unit in dependents.get(stack.pop(), ()):
+            if unit not in dirty:
+                dirty.add(unit)
+                stack.append(unit)
+
+    return dirty
+
+
+def _keep_clean(cache: dict[str, Any], dirty: set[Unit]) -> dict[str, Any]:
+    """Copy the entries of a ``$ref``-keyed *cache* that no dirty unit affects."""
+    annotated = {
+        f"#/components/{unit[1]}/{unit[2]}" for unit in dirty if len(unit) == 3
+    }
+
+    return {
+        ref: value
+        for ref, value in cache.items()
+        if ref not in annotated and _ref_unit(ref) not in dirty
+    }
+
+
+def _assemble(
+    rest: dict[str, Any],
+    units: dict[Unit, Any],
+    resolved: dict[Unit, Any],
+    models: dict[Unit, BaseModel],
+) -> dict[str, Any]:
+    """Put resolved dirty units and models of clean ones back into *rest*."""
+    for unit in units:
+        value = resolved[unit] if unit in resolved else models[unit]
+
+        if unit[0] == "components":
+            rest["components"][unit[1]][unit[2]] = value
+        else:
+            rest[unit[0]][unit[1]] = value
+
+    return rest
+
+
+def _unit_models(
+    spec: Specification,
+    units: dict[Unit, Any],
+    sections: dict[str, str],
+) -> dict[Unit, BaseModel]:
+    """Look up the validated model of every unit in *spec*."""
+    models: dict[Unit, BaseModel] = {}
+    components = spec.components
+
+    for unit in units:
+        if unit[0] == "components":
+            entries = getattr(components, sections[unit[1]])
+        else:
+            entries = getattr(spec, unit[0])
+
+        models[unit] = entries[unit[-1]]
+
+    return models
+
+
+@dataclass
+class _State:
+    """What an :class:`IncrementalParser` keeps from its last successful update."""
+
+    version: str | None = None
+    digests: dict[Unit, bytes] = field(default_factory=dict)
+    deps: dict[Unit, set[Unit]] = field(default_factory=dict)
+    models: dict[Unit, BaseModel] = field(default_factory=dict)
+    resolved_cache: dict[str, Any] = field(default_factory=dict)
+    ref_caches: dict[type, dict[str, Any]] = field(default_factory=dict)
+    documents: dict[str, Resource[Any]] = field(default_factory=dict)
+
+
+class IncrementalParser:
+    """Parses successive versions of one specification, reusing unchanged parts.
+
+    Each :meth:`update` decodes the whole document, but only resolves
+    and validates the path items, webhooks and component entries whose
+    content changed, together with everything that reaches them through
+    local ``$ref`` chains. The models of all other entries are reused as
+    they are, so an edit costs time in proportion to what it touches
+    rather than to the size of the document::
+
+        parser = IncrementalParser(base_uri="specs/openapi.yml")
+        spec = parser.update(text)
+        spec = parser.update(edited_text)  # untouched PathItems are reused
+
+    External ``$ref`` documents are read once and kept until an update
+    asks to read them again. Updates must not run concurrently.
+    """
+
+    def __init__(
+        self,
+        base_uri: str | os.PathLike[str] | None = None,
+        fetcher: Fetcher | None = None,
+        on_read: OnRead | None = None,
+    ) -> None:
+        """Resolve external ``$ref`` targets against *base_uri* with *fetcher*.
+
+        *on_read* is called with ``(uri, text)`` for every external
+        document read, possibly from several threads at once.
+        """
+        self.base_uri = os.fspath(base_uri) if base_uri is not None else None
+        self.fetcher = fetcher
+        self.on_read = on_read
+        self.specification: Specification | None = None
+        self._state = _State()
+
+    def reset(self) -> None:
+        """Forget all state, so the next update parses the whole document."""
+        self._state = _State()
+
+    def update(self, spec_string: str, reload_documents: bool = False) -> Specification:
+        """Parse a new version of the document and return its specification.
+
+        Parameters
+        ----------
+        spec_string : str
+            Full YAML/JSON text of the new version.
+        reload_documents : bool, optional
+            Read every external ``$ref`` document again, e.g. after they
+            were edited, and revalidate the entries that reference them.
+
+        Returns:
+        -------
+        Specification
+            Version-specific typed specification model.
+
+        Raises:
+        ------
+        ParserError
+            On parse failures, wrapping the original exception. The
+            state of the last successful update is kept.
+        """
+        raw, version = _prepare_raw(_decode_raw(spec_string, self.base_uri))
+        state = self._state if version == self._state.version else _State()
+
+        spec_module = _VERSION_SPEC_MAP[version]
+        sections = _section_fields(spec_module.Specification)
+        rest, units = _split_units(raw, spec_module.Specification, sections)
+
+        digests = {unit: _digest(node) for unit, node in units.items()}
+        digests[_REST] = _digest(rest)
+        changed = {
+            unit
+            for unit in state.digests.keys() | digests.keys()
+            if state.digests.get(unit) != digests.get(unit)
+        }
+
+        deps = {unit: state.deps[unit] for unit in units if unit not in changed}
+        deps.update(
+            {unit: _ref_targets(units[unit]) for unit in changed & units.keys()}
+        )
+
+        if reload_documents:
+            # local $refs inside external documents count as the rest's
+            changed |= {_EXTERNAL, _REST}
+
+        dirty = _dirty_closure(changed, deps)
+
+        resolved_cache = _keep_clean(state.resolved_cache, dirty)
+        ref_caches = {
+            cls: _keep_clean(cache, dirty) for cls, cache in state.ref_caches.items()
+        }
+        documents = self._prefetch(
+            raw, version, {} if reload_documents else state.documents
+        )
+        rest, resolved = self._resolve(
+            raw, version, documents, resolved_cache, rest, units, dirty
+        )
+        data = _assemble(rest, units, resolved, state.models)
+
+        with ref_cache_scope(ref_caches):
+            spec = _validate_model(spec_module, data, version)
+
+        self._state = _State(
+            version,
+            digests,
+            deps,
+            _unit_models(spec, units, sections),
+            resolved_cache,
+            ref_caches,
+            dict(documents),
+        )
+        self.specification = spec
+
+        return spec
+
+    def _resolve(
+        self,
+        raw: dict[str, Any],
+        version: str,
+        documents: list[tuple[str, Resource[Any]]],
+        resolved_cache: dict[str, Any],
+        rest: dict[str, Any],
+        units: dict[Unit, Any],
+        dirty: set[Unit],
+    ) -> tuple[dict[str, Any], dict[Unit, Any]]:
+        """Resolve the ``$ref``s of *rest* and of the dirty *units* in place.
+
+        Targets found in *resolved_cache* are reused rather than walked.
+        """
+        try:
+            registry = _build_registry(
+                raw, self.base_uri, version, self.on_read, self.fetcher, documents
+            )
+            resolver = registry.resolver(base_uri=_ROOT_URI)
+            walker = _RefWalker(resolved_cache)
+            rest = walker.walk(rest, resolver)
+            resolved = {
+                unit: walker.walk(node, resolver)
+                for unit, node in units.items()
+                if unit in dirty
+            }
+        except Exception as e:
+            raise ParserError(f"Failed to resolve references: {e}") from e
+
+        for unit, node in resolved.items():
+            if unit[0] == "components" and isinstance(node, dict):
+                node.setdefault("ref_name", f"#/components/{unit[1]}/{unit[2]}")
+
+        return rest, resolved
+
+    def _prefetch(
+        self,
+        raw: dict[str, Any],
+        version: str,
+        known: dict[str, Resource[Any]],
+    ) -> list[tuple[str, Resource[Any]]]:
+        """Return the external documents of *raw*, reading only those not *known*."""
+        if self.base_uri is None:
+            return []
+
+        draft = _DRAFT_BY_VERSION.get(version, DRAFT202012)
+        retrieve = _make_retriever(self.base_uri, draft, self.on_read, self.fetcher)
+
+        return _prefetch(raw, retrieve, known=known)
@@ -0,0 +1,157 @@
+"""YAML/JSON document loading with the fastest available backend."""
+
+import io
+import json
+import mmap
+from collections.abc import Callable
+from typing import IO, Any
+from urllib.parse import urlparse
+
+from yaml import SafeLoader
+from yaml import load as load_yaml_with
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+
+    YAML_BACKEND = "libyaml"
+except ImportError:  # PyYAML built without libyaml bindings
+    _SafeLoader = SafeLoader  # type: ignore[assignment,misc]  # same interface, pure-Python scanner
+
+    YAML_BACKEND = "python"
+
+_json_loads: Callable[[str | bytes], Any]
+# decodes a buffer in place; ``None`` if the backend only takes str/bytes
+_json_loads_buffer: Callable[[memoryview], Any] | None
+_json_errors: tuple[type[Exception], ...]
+
+try:
+    import orjson
+
+    _json_loads = _json_loads_buffer = orjson.loads
+    _json_errors = (orjson.JSONDecodeError,)
+    JSON_BACKEND = "orjson"
+except ImportError:
+    try:
+        import msgspec
+
+        _json_loads = _json_loads_buffer = msgspec.json.decode
+        _json_errors = (msgspec.DecodeError,)
+        JSON_BACKEND = "msgspec"
+    except ImportError:
+        _json_loads = json.loads
+        _json_loads_buffer = None
+        _json_errors = (ValueError,)
+        JSON_BACKEND = "json"
+
+_JSON_START = ("{", "[")
+
+# Bytes looked at to tell JSON from YAML in a stream.
+_SNIFF_SIZE = 4096
+
+
+def safe_load_yaml(stream: str | bytes | IO[bytes] | mmap.mmap) -> Any:
+    """Load a YAML document with ``yaml.safe_load`` semantics.
+
+    Uses libyaml's ``CSafeLoader`` when PyYAML was built with it and
+    falls back to the pure-Python ``SafeLoader`` otherwise. The active
+    backend is exposed as :data:`YAML_BACKEND`. File objects are read
+    in chunks rather than all at once.
+    """
+    return load_yaml_with(stream, Loader=_SafeLoader)
+
+
+def _looks_like_json(
+    text: str,
+    uri: str | None,
+    content_type: str | None,
+) -> bool:
+    """Sniff the document format from content type, extension, or first byte."""
+    if content_type is not None and "json" in content_type.lower():
+        return True
+
+    if uri is not None and urlparse(uri).path.lower().endswith(".json"):
+        return True
+
+    return text.lstrip()[:1] in _JSON_START
+
+
+def load_document(
+    text: str,
+    uri: str | None = None,
+    content_type: str | None = None,
+) -> Any:
+    """Load a JSON or YAML document, skipping YAML when the input is JSON.
+
+    Documents that look like JSON (by *content_type*, a ``.json``
+    extension in *uri*, or a leading ``{``/``[``) are decoded with the
+    fastest JSON backend available (see :data:`JSON_BACKEND`). Anything
+    else, including JSON-looking input that fails to decode (e.g. YAML
+    flow mappings), goes through :func:`safe_load_yaml`.
+    """
+    if _looks_like_json(text, uri, content_type):
+        try:
+            return _json_loads(text)
+        except _json_errors:
+            pass
+
+    return safe_load_yaml(text)
+
+
+def _load_mapped(
+    buffer: mmap.mmap,
+    uri: str | None,
+    content_type: str | None,
+) -> Any:
+    """Load a document from a memory map without copying it into a string."""
+    prefix = buffer[:_SNIFF_SIZE].decode("utf-8", "ignore")
+
+    if _looks_like_json(prefix, uri, content_type):
+        try:
+            if _json_loads_buffer is None:
+                return _json_loads(buffer[:])
+
+            with memoryview(buffer) as view:
+                return _json_loads_buffer(view)
+        except _json_errors:
+            pass
+
+    buffer.seek(0)
+
+    return safe_load_yaml(buffer)
+
+
+def load_stream(
+    source: IO[bytes] | mmap.mmap,
+    uri: str | None = None,
+    content_type: str | None = None,
+) -> Any:
+    """Load a JSON or YAML document straight from a binary file or memory map.
+
+    Unlike :func:`load_document`, the text is never held as one ``str``.
+    Files are memory-mapped: JSON is decoded from the mapped pages in
+    place by ``orjson`` or ``msgspec``, and YAML is read from them in
+    chunks by the loader, so the pages can be dropped by the OS as soon
+    as they are consumed. Streams that cannot be mapped, such as pipes,
+    are read in full and decoded from bytes. The format is sniffed as
+    in :func:`load_document`.
+    """
+    if isinstance(source, mmap.mmap):
+        return _load_mapped(source, uri, content_type)
+
+    try:
+        mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, io.UnsupportedOperation):
+        # not a file, or an empty one, which can't be mapped
+        data = source.read()
+        prefix = data[:_SNIFF_SIZE].decode("utf-8", "ignore")
+
+        if _looks_like_json(prefix, uri, content_type):
+            try:
+                return _json_loads(data)
+            except _json_errors:
+                pass
+
+        return safe_load_yaml(data)
+
+    with mapped:
+        return _load_mapped(mapped, uri, content_type)
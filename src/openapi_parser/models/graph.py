@@ -0,0 +1,306 @@
+"""Precomputed ``$ref`` dependency graph of a parsed specification."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from openapi_parser.models.index import iter_path_item_operations
+
+if TYPE_CHECKING:
+    from openapi_parser.models.v3_0 import Components, Operation, PathItem
+
+# Field values that never hold a model, skipped before any ``isinstance``.
+_LEAF_TYPES = frozenset({type(None), str, int, float, bool})
+
+
+def _node_name(ref_name: str) -> str:
+    """Name the node of a ``$ref`` target, folding refs into a component into it."""
+    if ref_name.startswith("#/components/"):
+        return "/".join(ref_name.split("/", 4)[:4])
+
+    return ref_name
+
+
+def _component_entries(components: Components | None) -> Iterator[tuple[str, Any]]:
+    """Yield ``(node name, model)`` for every entry of every components section."""
+    if components is None:
+        return
+
+    for field, info in type(components).model_fields.items():
+        entries = getattr(components, field)
+
+        if not isinstance(entries, Mapping) or field == "extensions":
+            continue
+
+        for name, model in entries.items():
+            if isinstance(model, BaseModel):
+                yield f"#/components/{info.alias or field}/{name}", model
+
+
+class _RefCollector:
+    """Finds the ``$ref`` targets directly below models.
+
+    A model is a target if it is a component entry or carries a
+    ``ref_name``; the walk records it and does not descend into it.
+    Targets met for the first time are queued in ``pending``, so their
+    own references can be collected in turn.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, Any]]) -> None:
+        self.nodes: dict[int, str] = {}
+        self.pending: list[tuple[str, Any]] = []
+        self.known: set[str] = set()
+
+        for node, model in entries:
+            self.nodes.setdefault(id(model), node)
+            self._queue(node, model)
+
+    def _queue(self, node: str, model: Any) -> None:
+        if node not in self.known:
+            self.known.add(node)
+            self.pending.append((node, model))
+
+    def _target(self, model: BaseModel) -> str | None:
+        """Return the node *model* stands for, if it is a ``$ref`` target."""
+        node = self.nodes.get(id(model))
+
+        if node is None:
+            ref_name = getattr(model, "ref_name", None)
+
+            if not isinstance(ref_name, str):
+                return None
+
+            node = _node_name(ref_name)
+            self._queue(node, model)
+
+        return node
+
+    def collect(self, roots: Iterable[Any]) -> set[str]:
+        """Return the targets referenced below *roots* without crossing a target."""
+        targets: set[str] = set()
+        seen: set[int] = set()
+        stack = list(roots)
+
+        while stack:
+            node = stack.pop()
+
+            if id(node) in seen:
+                continue
+
+            seen.add(id(node))
+
+            if isinstance(node, BaseModel):
+                # defaults never hold references, so unset fields are skipped
+                fields = node.__dict__
+                values: Any = [fields.get(name) for name in node.model_fields_set]
+            elif isinstance(node, dict):
+                values = node.values()
+            else:
+                values = node
+
+            for value in values:
+                if type(value) in _LEAF_TYPES:
+                    continue
+
+                if isinstance(value, BaseModel):
+                    target = self._target(value)
+
+                    if target is not None:
+                        targets.add(target)
+                        continue
+
+                    stack.append(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+
+        return targets
+
+
+class _Tarjan:
+    """Finds the strongly connected components of a graph.
+
+    Iterative, so long reference chains never hit the recursion limit.
+    """
+
+    def __init__(self, graph: Mapping[str, Iterable[str]]) -> None:
+        self.graph = graph
+        self.index: dict[str, int] = {}
+        self.low: dict[str, int] = {}
+        self.stack: list[str] = []
+        self.on_stack: set[str] = set()
+        self.work: list[tuple[str, Iterator[str]]] = []
+        self.components: list[list[str]] = []
+
+    def run(self) -> list[list[str]]:
+        """Return the components, each after all components it reaches."""
+        for root in self.graph:
+            if root not in self.index:
+                self._visit(root)
+
+            while self.work:
+                self._step()
+
+        return self.components
+
+    def _visit(self, node: str) -> None:
+        self.index[node] = self.low[node] = len(self.index)
+        self.stack.append(node)
+        self.on_stack.add(node)
+        self.work.append((node, iter(self.graph.get(node, ()))))
+
+    def _step(self) -> None:
+        """Descend into the next unvisited child, or finish the current node."""
+        node, children = self.work[-1]
+
+        for child in children:
+            if child not in self.index:
+                self._visit(child)
+                return
+
+            if child in self.on_stack:
+                self.low[node] = min(self.low[node], self.index[child])
+
+        self.work.pop()
+
+        if self.work:
+            parent = self.work[-1][0]
+            self.low[parent] = min(self.low[parent], self.low[node])
+
+        if self.low[node] == self.index[node]:
+            component = []
+
+            while True:
+                member = self.stack.pop()
+                self.on_stack.discard(member)
+                component.append(member)
+
+                if member == node:
+                    break
+
+            self.components.append(component)
+
+
+@dataclass(frozen=True, slots=True)
+class DependencyGraph:
+    """Immutable ``$ref`` graph over the components of a specification.
+
+    Nodes are named after ``ref_name``: component entries as
+    ``#/components/<section>/<name>``, other targets such as external
+    documents by the reference that reached them. A ``$ref`` into a
+    component, e.g. to one of its properties, counts as a reference to
+    the component. All lookups are single dict accesses.
+    """
+
+    paths: Mapping[str, PathItem]
+    webhooks: Mapping[str, PathItem] | None
+    components: Components | None
+    references: Mapping[str, frozenset[str]]
+    referenced_by: Mapping[str, frozenset[str]]
+    operations_by_ref: Mapping[str, tuple[Operation, ...]]
+    cycles: tuple[frozenset[str], ...]
+    cycle_by_ref: Mapping[str, frozenset[str]]
+
+    @classmethod
+    def build(
+        cls,
+        paths: Mapping[str, PathItem],
+        webhooks: Mapping[str, PathItem] | None = None,
+        components: Components | None = None,
+    ) -> DependencyGraph:
+        """Collect the references between components and from operations.
+
+        An operation uses every node it reaches through ``$ref`` chains,
+        including through the ``parameters`` of its path item.
+        """
+        collector = _RefCollector(_component_entries(components))
+        operation_refs: list[tuple[Operation, set[str]]] = []
+
+        for path_item in (*paths.values(), *(webhooks or {}).values()):
+            shared = collector.collect([path_item.parameters or []])
+
+            for _, operation in iter_path_item_operations(path_item):
+                refs = collector.collect([operation]) | shared
+                operation_refs.append((operation, refs))
+
+        references: dict[str, frozenset[str]] = {}
+
+        while collector.pending:
+            node, model = collector.pending.pop()
+            references[node] = frozenset(collector.collect([model]))
+
+        referenced_by: dict[str, set[str]] = {}
+
+        for node, targets in references.items():
+            for target in targets:
+                referenced_by.setdefault(target, set()).add(node)
+
+        operations_by_ref: dict[str, list[Operation]] = {}
+
+        for operation, refs in operation_refs:
+            reached = set(refs)
+            stack = list(refs)
+
+            while stack:
+                for target in references.get(stack.pop(), ()):
+                    if target not in reached:
+                        reached.add(target)
+                        stack.append(target)
+
+            for node in reached:
+                operations_by_ref.setdefault(node, []).append(operation)
+
+        cycles = tuple(
+            frozenset(component)
+            for component in _Tarjan(references).run()
+            if len(component) > 1 or component[0] in references[component[0]]
+        )
+
+        return cls(
+            paths=paths,
+            webhooks=webhooks,
+            components=components,
+            references=MappingProxyType(references),
+            referenced_by=MappingProxyType(
+                {k: frozenset(v) for k, v in referenced_by.items()}
+            ),
+            operations_by_ref=MappingProxyType(
+                {k: tuple(v) for k, v in operations_by_ref.items()}
+            ),
+            cycles=cycles,
+            cycle_by_ref=MappingProxyType(
+                {node: cycle for cycle in cycles for node in cycle}
+            ),
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle by rebuilding, since mapping proxies cannot be pickled."""
+        return type(self).build, (self.paths, self.webhooks, self.components)
+
+    def is_current(self, paths: Any, webhooks: Any, components: Any) -> bool:
+        """Check that the graph was built from these exact objects."""
+        return (
+            self.paths is paths
+            and self.webhooks is webhooks
+            and self.components is components
+        )
+
+    def dependencies(self, ref: str) -> frozenset[str]:
+        """Return the nodes *ref* references directly."""
+        return self.references.get(_node_name(ref), frozenset())
+
+    def dependents(self, ref: str) -> frozenset[str]:
+        """Return the nodes that reference *ref* directly."""
+        return self.referenced_by.get(_node_name(ref), frozenset())
+
+    def operations_using(self, ref: str) -> tuple[Operation, ...]:
+        """Return the operations that reach *ref*, directly or transitively."""
+        return self.operations_by_ref.get(_node_name(ref), ())
+
+    def cycle_of(self, ref: str) -> frozenset[str] | None:
+        """Return the nodes on a reference cycle through *ref*, if any."""
+        return self.cycle_by_ref.get(_node_name(ref))
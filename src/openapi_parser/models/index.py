@@ -0,0 +1,95 @@
+"""Precomputed operation lookups for a parsed specification."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from openapi_parser.models.v3_0 import Operation, PathItem
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+
+def iter_path_item_operations(path_item: PathItem) -> Iterator[tuple[str, Operation]]:
+    """Yield ``(method, operation)`` for every operation of *path_item*.
+
+    Methods are lower-cased and include the OpenAPI 3.2
+    ``additionalOperations`` of v3_1 path items.
+    """
+    for method in HTTP_METHODS:
+        operation = getattr(path_item, method)
+
+        if operation is not None:
+            yield method, operation
+
+    additional: dict[str, Operation] | None = getattr(
+        path_item, "additional_operations", None
+    )
+
+    if additional:
+        for method, operation in additional.items():
+            yield method.lower(), operation
+
+
+@dataclass(frozen=True, slots=True)
+class OperationIndex:
+    """Immutable lookup tables over every operation of a specification.
+
+    ``by_route`` only covers ``paths``; webhook operations are reachable
+    by operation id and tag.
+    """
+
+    paths: Mapping[str, PathItem]
+    webhooks: Mapping[str, PathItem] | None
+    by_id: Mapping[str, Operation]
+    by_tag: Mapping[str, tuple[Operation, ...]]
+    by_route: Mapping[tuple[str, str], Operation]
+
+    @classmethod
+    def build(
+        cls,
+        paths: Mapping[str, PathItem],
+        webhooks: Mapping[str, PathItem] | None = None,
+    ) -> OperationIndex:
+        """Index the operations of *paths* and *webhooks*.
+
+        The first operation wins when an ``operationId`` is duplicated.
+        """
+        by_id: dict[str, Operation] = {}
+        by_tag: dict[str, list[Operation]] = {}
+        by_route: dict[tuple[str, str], Operation] = {}
+
+        def _add(operation: Operation) -> None:
+            if operation.operation_id is not None:
+                by_id.setdefault(operation.operation_id, operation)
+
+            for tag in operation.tags or ():
+                by_tag.setdefault(tag, []).append(operation)
+
+        for path, path_item in paths.items():
+            for method, operation in iter_path_item_operations(path_item):
+                by_route[(method, path)] = operation
+                _add(operation)
+
+        for path_item in (webhooks or {}).values():
+            for _, operation in iter_path_item_operations(path_item):
+                _add(operation)
+
+        return cls(
+            paths=paths,
+            webhooks=webhooks,
+            by_id=MappingProxyType(by_id),
+            by_tag=MappingProxyType({k: tuple(v) for k, v in by_tag.items()}),
+            by_route=MappingProxyType(by_route),
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle by rebuilding, since mapping proxies cannot be pickled."""
+        return type(self).build, (self.paths, self.webhooks)
+
+    def is_current(self, paths: Any, webhooks: Any) -> bool:
+        """Check that the index was built from these exact mappings."""
+        return self.paths is paths and self.webhooks is webhooks
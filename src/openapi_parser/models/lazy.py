@@ -0,0 +1,280 @@
+"""Lazily validated specification mappings."""
+
+import functools
+import threading
+import typing
+from collections.abc import Iterator, Mapping
+from types import TracebackType
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from openapi_parser.errors import ParserError
+from openapi_parser.models.mixins import ref_cache_scope
+
+M = TypeVar("M", bound=BaseModel)
+
+# Spec fields holding ``name -> model`` maps that are validated on access.
+_LAZY_SPEC_FIELDS = ("paths", "webhooks")
+
+
+class _SharedLock:
+    """Lock shared by the lazy mappings of one spec.
+
+    Pickling the mappings together keeps them sharing one lock, and
+    unpickling creates a fresh one.
+    """
+
+    __slots__ = ("_lock",)
+
+    def __init__(self) -> None:
+        """Create the underlying lock."""
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> None:
+        """Acquire the lock."""
+        self._lock.acquire()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Release the lock."""
+        self._lock.release()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle as a new, unlocked lock."""
+        return _SharedLock, ()
+
+
+class LazyMapping(Mapping[str, M], Generic[M]):
+    """Read-only mapping that validates its values on first access.
+
+    Values are validated into *model* when looked up and memoized, so
+    every later lookup returns the same instance. All mappings of one
+    specification share a set of ref caches, which keeps the
+    :class:`~openapi_parser.models.mixins.RefCacheMixin` identity
+    guarantees across entries validated at different times.
+
+    Pickling keeps the mapping lazy: the raw entries are stored along
+    with the models validated so far, so errors in the rest still only
+    surface on access.
+    """
+
+    __slots__ = ("_caches", "_label", "_lock", "_model", "_models", "_raw")
+
+    def __init__(
+        self,
+        raw: dict[str, Any],
+        model: type[M],
+        caches: dict[type, dict[str, Any]],
+        lock: _SharedLock,
+        label: str,
+    ) -> None:
+        """Wrap the resolved *raw* entries of the spec field named *label*."""
+        self._raw = raw
+        self._model = model
+        self._models: dict[str, M] = {}
+        self._caches = caches
+        self._lock = lock
+        self._label = label
+
+    def __getitem__(self, key: str) -> M:
+        """Return the validated model for *key*, validating it on first access."""
+        model = self._models.get(key)
+
+        if model is not None:
+            return model
+
+        data = self._raw[key]
+
+        with self._lock:
+            model = self._models.get(key)
+
+            if model is None:
+                try:
+                    with ref_cache_scope(self._caches):
+                        model = self._model.model_validate(data)
+                except ValidationError as e:
+                    raise ParserError(
+                        f"Validation failed for {self._label}[{key!r}]: {e}"
+                    ) from e
+
+                self._models[key] = model
+
+        return model
+
+    def __contains__(self, key: object) -> bool:
+        """Check for *key* without validating its value."""
+        return key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over keys without validating any value."""
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        """Return the number of entries without validating any value."""
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        """Show how many entries have been validated so far."""
+        return (
+            f"{type(self).__name__}({self._label}, "
+            f"{len(self._models)}/{len(self._raw)} validated)"
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the raw entries and the models validated so far."""
+        return (
+            _restore_lazy_mapping,
+            (
+                self._raw,
+                self._model,
+                self._caches,
+                self._lock,
+                self._label,
+                self._models,
+            ),
+        )
+
+    def materialize(self) -> dict[str, M]:
+        """Validate every remaining entry and return them as a plain dict."""
+        return {key: self[key] for key in self._raw}
+
+
+def _restore_lazy_mapping(
+    raw: dict[str, Any],
+    model: type[M],
+    caches: dict[type, dict[str, Any]],
+    lock: _SharedLock,
+    label: str,
+    models: dict[str, M],
+) -> LazyMapping[M]:
+    """Rebuild a pickled :class:`LazyMapping`."""
+    mapping = LazyMapping(raw, model, caches, lock, label)
+    mapping._models.update(models)
+
+    return mapping
+
+
+def materialize_lazy_fields(model: BaseModel) -> None:
+    """Replace the lazy mappings held by *model* with plain validated dicts.
+
+    Called before serialization, which only understands real dicts.
+    """
+    for name, value in model.__dict__.items():
+        if isinstance(value, LazyMapping):
+            model.__dict__[name] = value.materialize()
+
+
+@functools.cache
+def _model_map_fields(model: type[BaseModel]) -> dict[str, type[BaseModel]]:
+    """Return the fields of *model* annotated as ``dict[str, <model>]``."""
+    fields: dict[str, type[BaseModel]] = {}
+
+    for name, info in model.model_fields.items():
+        for candidate in (info.annotation, *typing.get_args(info.annotation)):
+            if typing.get_origin(candidate) is not dict:
+                continue
+
+            value_type = typing.get_args(candidate)[1]
+
+            if isinstance(value_type, type) and issubclass(value_type, BaseModel):
+                fields[name] = value_type
+
+    return fields
+
+
+def _optional_model(model: type[BaseModel], field: str) -> type[BaseModel] | None:
+    """Return the model class of an optional sub-model field."""
+    for candidate in typing.get_args(model.model_fields[field].annotation):
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+
+    return None
+
+
+def _split_lazy_fields(
+    model: type[BaseModel],
+    data: dict[str, Any],
+    fields: typing.Iterable[str],
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Pull the raw dicts of *fields* out of *data* for lazy validation.
+
+    Returns a shallow copy of *data* without those entries and the raw
+    entries keyed by field name.
+    """
+    data = dict(data)
+    lazy: dict[str, dict[str, Any]] = {}
+
+    for field in fields:
+        alias = model.model_fields[field].alias or field
+
+        if isinstance(data.get(alias), dict):
+            lazy[field] = data.pop(alias)
+
+    return data, lazy
+
+
+def _install(
+    instance: BaseModel,
+    lazy: dict[str, dict[str, Any]],
+    caches: dict[type, dict[str, Any]],
+    lock: _SharedLock,
+) -> None:
+    """Set the lazy mappings on an already validated frozen *instance*."""
+    value_models = _model_map_fields(type(instance))
+
+    for field, raw in lazy.items():
+        instance.__dict__[field] = LazyMapping(
+            raw, value_models[field], caches, lock, field
+        )
+        instance.__pydantic_fields_set__.add(field)
+
+
+def build_lazy_specification(
+    spec_model: type[BaseModel],
+    resolved: dict[str, Any],
+) -> Any:
+    """Validate *resolved* into *spec_model*, deferring paths and components.
+
+    Everything except ``paths``, ``webhooks`` and the ``components``
+    sections is validated straight away. The deferred entries become
+    :class:`LazyMapping` values that validate on first access.
+
+    Raises:
+        ValidationError: If the eagerly validated part is invalid.
+    """
+    caches: dict[type, dict[str, Any]] = {}
+    lock = _SharedLock()
+
+    spec_fields = [f for f in _LAZY_SPEC_FIELDS if f in spec_model.model_fields]
+    data, lazy_spec = _split_lazy_fields(spec_model, resolved, spec_fields)
+
+    # paths is required, so validate the rest against an empty mapping
+    if "paths" in lazy_spec:
+        data["paths"] = {}
+
+    components_model = _optional_model(spec_model, "components")
+    lazy_components: dict[str, dict[str, Any]] = {}
+
+    if components_model is not None and isinstance(data.get("components"), dict):
+        data["components"], lazy_components = _split_lazy_fields(
+            components_model,
+            data["components"],
+            _model_map_fields(components_model),
+        )
+
+    with ref_cache_scope(caches):
+        spec = spec_model.model_validate(data)
+
+    _install(spec, lazy_spec, caches, lock)
+
+    components = getattr(spec, "components", None)
+
+    if components is not None:
+        _install(components, lazy_components, caches, lock)
+
+    return spec
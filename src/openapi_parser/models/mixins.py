@@ -1,27 +1,137 @@
 """Deduplication, cache, and extension mixins for OpenAPI models."""
 
-import threading
-from typing import Any
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, NoReturn
 
 from pydantic import BaseModel, Field, ValidationInfo, model_validator
 
-_CACHE_ATTRIBUTE = "_ref_cache"
+from openapi_parser.observer import ParseStats
 
-_thread_cache = threading.local()
+# Per-class ref caches of the innermost active ``ref_cache_scope``.
+_ref_caches: ContextVar[dict[type, dict[str, Any]] | None] = ContextVar(
+    "ref_caches", default=None
+)
+
+# Receives the ref cache hit/miss counts of the current parse, if observed.
+_ref_cache_stats: ContextVar[ParseStats | None] = ContextVar(
+    "ref_cache_stats", default=None
+)
+
+
+@contextmanager
+def ref_cache_scope(
+    caches: dict[type, dict[str, Any]] | None = None,
+) -> Iterator[dict[type, dict[str, Any]]]:
+    """Deduplicate ``$ref`` targets validated within the block.
+
+    Each scope uses *caches*, or a fresh set when omitted, and yields
+    it. Scopes nest and are tracked in a :class:`~contextvars.ContextVar`,
+    so they are private to the current thread or asyncio task; the
+    caches are released with the scope unless the caller keeps them.
+
+    Passing the same *caches* again lets validation that is spread over
+    time, such as a lazily validated specification, keep sharing one
+    set of deduplicated targets.
+    """
+    if caches is None:
+        caches = {}
+
+    token = _ref_caches.set(caches)
+
+    try:
+        yield caches
+    finally:
+        _ref_caches.reset(token)
+
+
+@contextmanager
+def count_ref_cache(stats: ParseStats) -> Iterator[ParseStats]:
+    """Add the ref cache hits and misses within the block to *stats*."""
+    token = _ref_cache_stats.set(stats)
+
+    try:
+        yield stats
+    finally:
+        _ref_cache_stats.reset(token)
+
+
+@contextmanager
+def ensure_ref_cache_scope() -> Iterator[dict[type, dict[str, Any]]]:
+    """Open a :func:`ref_cache_scope` unless one is already active."""
+    caches = _ref_caches.get()
+
+    if caches is not None:
+        yield caches
+        return
+
+    with ref_cache_scope() as caches:
+        yield caches
+
+
+class _EmptyExtensions(dict[str, Any]):
+    """The read-only empty ``extensions`` shared by models without ``x-*`` keys.
+
+    A ``dict`` subclass so that it passes for the field type; copying
+    and pickling it yield the same object.
+    """
+
+    def _read_only(self, *_args: Any, **_kwargs: Any) -> NoReturn:
+        raise TypeError("extensions without x- keys are shared and read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> "_EmptyExtensions":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "_EmptyExtensions":
+        return self
+
+    def __reduce__(self) -> str:
+        return "EMPTY_EXTENSIONS"
+
+
+EMPTY_EXTENSIONS: dict[str, Any] = _EmptyExtensions()
+
+
+def _default_extensions() -> dict[str, Any]:
+    """Return the shared empty mapping without the copy of a plain default."""
+    return EMPTY_EXTENSIONS
+
+
+def _has_extensions(data: dict[Any, Any]) -> bool:
+    """Check whether *data* has an ``extensions`` or any ``x-*`` key."""
+    if "extensions" in data:
+        return True
+
+    for key in data:  # noqa: SIM110  # any() over a generator is slower
+        if isinstance(key, str) and key.startswith("x-"):
+            return True
+
+    return False
 
 
 class ExtensionsMixin(BaseModel):
     """Mixin that provides an ``extensions`` dict with automatic ``x-*`` extraction."""
 
-    extensions: dict[str, Any] = Field(default_factory=dict)
+    extensions: dict[str, Any] = Field(default_factory=_default_extensions)
 
     @model_validator(mode="before")
     @classmethod
     def _extract_extensions(cls, data: Any) -> Any:
-        """Move ``x-*`` keys into the extensions dict before model validation."""
+        """Move ``x-*`` keys into the extensions dict before model validation.
+
+        Input without ``x-*`` keys and without ``extensions`` is passed on
+        as is, leaving the field to its shared empty default.
+        """
         if not isinstance(data, dict):
             return data
 
+        if not _has_extensions(data):
+            return data
+
         raw_extensions = data.get("extensions")
         extensions = dict(raw_extensions) if isinstance(raw_extensions, dict) else {}
 
@@ -46,8 +156,10 @@ class RefCacheMixin(BaseModel):
     encounters the same ref_name twice, it returns the cached object,
     ensuring single Python object identity for each $ref.
 
-    The cache lives in a ``threading.local`` so concurrent ``parse()``
-    calls in different threads never share state.
+    The caches belong to the innermost :func:`ref_cache_scope`, which
+    ``parse()`` opens for the duration of each call, so concurrent,
+    nested or interleaved parses never share state. Outside of a scope
+    every ``$ref`` is validated independently.
 
     Circular refs are already broken by the resolver before Pydantic
     validation, so no cycle-handling logic is needed here.
@@ -62,16 +174,31 @@ class RefCacheMixin(BaseModel):
 
         Called by Pydantic automatically on models with this mixin.
         """
-        if not cls._should_cache(value):
+        caches = _ref_caches.get()
+
+        if caches is None or not cls._should_cache(value):
             return handler(value)
 
         ref_name: str = value["ref_name"]
-        cache = cls._get_cache()
+        cache = caches.get(cls)
+
+        if cache is None:
+            cache = caches[cls] = {}
+
+        stats = _ref_cache_stats.get()
 
         if ref_name in cache:
+            if stats is not None:
+                stats.ref_cache_hits += 1
+
             return cache[ref_name]
 
         result = handler(value)
+
+        # pydantic may nest this validator for one value; count it once
+        if stats is not None and cache.get(ref_name) is not result:
+            stats.ref_cache_misses += 1
+
         cache[ref_name] = result
 
         return result
@@ -85,31 +212,10 @@ class RefCacheMixin(BaseModel):
             and isinstance(value["ref_name"], str)
         )
 
-    @classmethod
-    def _get_cache(cls) -> dict[str, Any]:
-        """Get or create the per-class ref cache for the current thread."""
-        caches: dict[type, dict[str, Any]] | None = getattr(
-            _thread_cache, _CACHE_ATTRIBUTE, None
-        )
-
-        if caches is None:
-            caches = {}
-            setattr(_thread_cache, _CACHE_ATTRIBUTE, caches)
-
-        cache = caches.get(cls)
-
-        if cache is None:
-            cache = {}
-            caches[cls] = cache
-
-        return cache
-
     @classmethod
     def clear_ref_cache(cls) -> None:
-        """Clear the ref cache for the current thread."""
-        caches: dict[type, dict[str, Any]] | None = getattr(
-            _thread_cache, _CACHE_ATTRIBUTE, None
-        )
+        """Clear the ref caches of the current scope, if any."""
+        caches = _ref_caches.get()
 
         if caches is not None:
             for cache in caches.values():
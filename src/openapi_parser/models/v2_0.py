@@ -3,27 +3,45 @@
 from collections.abc import Iterator
 from typing import Any
 
+from openapi_parser.models.index import HTTP_METHODS
 
-def _iter_path_entries(
-    data: dict[str, Any],
-) -> Iterator[tuple[str, str, dict[str, Any]]]:
-    """Yield ``(path, key, value)`` for every dict entry in every path item."""
+# Swagger 2.0 ``$ref`` prefixes and their OpenAPI 3.0 replacements.
+_REF_PREFIXES = (
+    ("#/definitions/", "#/components/schemas/"),
+    ("#/securityDefinitions/", "#/components/securitySchemes/"),
+    ("#/parameters/", "#/components/parameters/"),
+    ("#/responses/", "#/components/responses/"),
+)
+
+_SWAGGER_REF_PREFIXES = tuple(old for old, _ in _REF_PREFIXES)
+
+
+def _iter_operations(data: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield every operation of every path item."""
     paths = data.get("paths", {})
 
     if not isinstance(paths, dict):
         return
 
-    for path, path_item in paths.items():
+    for path_item in paths.values():
         if not isinstance(path_item, dict):
             continue
 
-        for key, value in path_item.items():
-            if isinstance(value, dict):
-                yield path, key, value
+        for method in HTTP_METHODS:
+            operation = path_item.get(method)
+
+            if isinstance(operation, dict):
+                yield operation
 
 
 def normalize_swagger_v2(data: dict[str, Any]) -> dict[str, Any]:
-    """Transform Swagger 2.0 dict to OpenAPI 3.0-compatible shape."""
+    """Transform Swagger 2.0 dict to OpenAPI 3.0-compatible shape.
+
+    *data* is changed in place and returned. Each operation is converted
+    once and the document is walked once to rewrite ``$ref`` paths;
+    nodes that need no change are left as they are, not copied.
+    Responses are copied when converted, as aliases may share them.
+    """
     data["openapi"] = "3.0.0"
 
     # host + basePath + schemes → servers
@@ -53,74 +71,54 @@ def normalize_swagger_v2(data: dict[str, Any]) -> dict[str, Any]:
     if "responses" in data:
         data.setdefault("components", {})["responses"] = data.pop("responses")
 
+    # consumes/produces, formData/body parameters and response schemas
+    global_consumes = data.pop("consumes", ["application/json"])
+    global_produces = data.pop("produces", ["application/json"])
+
+    for operation in _iter_operations(data):
+        _convert_operation(operation, global_consumes, global_produces)
+
     # Rewrite $ref strings
-    data = _rewrite_refs(data)
+    _rewrite_refs(data)
 
-    # consumes/produces → per-operation defaults & inject
-    _inject_content_defaults(data)
+    return data
 
-    # in: formData parameters → requestBody
-    _convert_formdata_to_request_body(data)
 
-    # in: body parameters → requestBody
-    _convert_body_parameters(data)
+def _rewrite_refs(root: Any) -> None:
+    """Rewrite Swagger 2.0 $ref paths to OpenAPI 3.0 equivalents in place.
 
-    # convert response schemas
-    _convert_responses(data)
+    Walks the document with an explicit stack and enters every container
+    once, so shared (YAML alias) nodes are not walked again.
+    """
+    seen = {id(root)}
+    stack = [root]
 
-    return data
+    while stack:
+        node = stack.pop()
 
+        if isinstance(node, dict):
+            ref = node.get("$ref")
 
-def _rewrite_refs(node: Any) -> Any:
-    """Rewrite Swagger 2.0 $ref paths to OpenAPI 3.0 equivalents."""
-    if isinstance(node, dict):
-        if "$ref" in node and isinstance(node["$ref"], str):
-            ref = node["$ref"]
-
-            if ref.startswith("#/definitions/"):
-                node["$ref"] = ref.replace(
-                    "#/definitions/",
-                    "#/components/schemas/",
-                )
-            elif ref.startswith("#/securityDefinitions/"):
-                node["$ref"] = ref.replace(
-                    "#/securityDefinitions/",
-                    "#/components/securitySchemes/",
-                )
-            elif ref.startswith("#/parameters/"):
-                node["$ref"] = ref.replace(
-                    "#/parameters/",
-                    "#/components/parameters/",
-                )
-            elif ref.startswith("#/responses/"):
-                node["$ref"] = ref.replace(
-                    "#/responses/",
-                    "#/components/responses/",
-                )
-
-        return {k: _rewrite_refs(v) for k, v in node.items()}
-
-    if isinstance(node, list):
-        return [_rewrite_refs(v) for v in node]
-
-    return node
-
-
-def _inject_content_defaults(data: dict[str, Any]) -> None:
-    """Migrate global consumes/produces into each operation."""
-    global_consumes = data.pop("consumes", ["application/json"])
-    global_produces = data.pop("produces", ["application/json"])
+            if isinstance(ref, str) and ref.startswith(_SWAGGER_REF_PREFIXES):
+                node["$ref"] = _rewrite_ref(ref)
 
-    for _, _, operation in _iter_path_entries(data):
-        if "consumes" in operation:
-            operation["consumes"] = list(operation["consumes"])
+            children: Any = node.values()
         else:
-            operation["consumes"] = list(global_consumes)
+            children = node
 
-        if "produces" in operation:
-            operation["produces"] = list(operation["produces"])
-        else:
-            operation["produces"] = list(global_produces)
+        for child in children:
+            if isinstance(child, (dict, list)) and id(child) not in seen:
+                seen.add(id(child))
+                stack.append(child)
+
+
+def _rewrite_ref(ref: str) -> str:
+    """Map one Swagger 2.0 $ref path to its OpenAPI 3.0 location."""
+    for old, new in _REF_PREFIXES:
+        if ref.startswith(old):
+            return ref.replace(old, new)
+
+    return ref
 
 
 def _build_formdata_schema(form_params: list[dict[str, Any]]) -> dict[str, Any]:
@@ -153,91 +151,78 @@ def _build_formdata_schema(form_params: list[dict[str, Any]]) -> dict[str, Any]:
     return schema
 
 
-def _convert_formdata_to_request_body(data: dict[str, Any]) -> None:
-    """Merge formData parameters into a single requestBody per operation."""
-    for _, _, operation in _iter_path_entries(data):
-        parameters = operation.get("parameters", [])
+def _convert_operation(
+    operation: dict[str, Any],
+    global_consumes: list[str],
+    global_produces: list[str],
+) -> None:
+    """Convert one Swagger 2.0 operation to its OpenAPI 3.0 shape in place.
 
-        if not isinstance(parameters, list):
-            continue
+    ``formData`` parameters become a form ``requestBody`` and a ``body``
+    parameter a JSON one (the latter wins if both are present), and
+    response schemas are wrapped into ``content``. ``consumes`` and
+    ``produces`` fall back to the document-wide values.
+    """
+    consumes = operation.pop("consumes", global_consumes)
+    produces = operation.pop("produces", global_produces)
+    parameters = operation.get("parameters", [])
 
+    if isinstance(parameters, list):
         form_params = []
-        new_parameters = []
+        body_param = None
+        kept = []
 
         for param in parameters:
-            if isinstance(param, dict) and param.get("in") == "formData":
+            location = param.get("in") if isinstance(param, dict) else None
+
+            if location == "formData":
                 form_params.append(param)
+            elif location == "body":
+                body_param = param
             else:
-                new_parameters.append(param)
+                kept.append(param)
 
-        operation["parameters"] = new_parameters
+        if len(kept) != len(parameters) or "parameters" not in operation:
+            operation["parameters"] = kept
 
         if form_params:
             schema = _build_formdata_schema(form_params)
-
-            consumes = operation.pop("consumes", ["application/x-www-form-urlencoded"])
-            if not consumes:
-                consumes = ["application/x-www-form-urlencoded"]
-
-            content = {}
-            for mime in consumes:
-                content[mime] = {"schema": schema}
-
-            operation["requestBody"] = {"required": True, "content": content}
-
-
-def _convert_body_parameters(data: dict[str, Any]) -> None:
-    """Convert body parameters into a requestBody object per operation."""
-    for _, _, operation in _iter_path_entries(data):
-        parameters = operation.get("parameters", [])
-
-        if not isinstance(parameters, list):
-            continue
-
-        body_param = None
-        new_parameters = []
-
-        for param in parameters:
-            if isinstance(param, dict) and param.get("in") == "body":
-                body_param = param
-            else:
-                new_parameters.append(param)
-
-        operation["parameters"] = new_parameters
+            form_types = consumes or ["application/x-www-form-urlencoded"]
+            operation["requestBody"] = {
+                "required": True,
+                "content": {mime: {"schema": schema} for mime in form_types},
+            }
+            # a body parameter can't reuse the consumed media types
+            consumes = ["application/json"]
 
         if body_param:
-            consumes = operation.pop("consumes", ["application/json"])
-            content = {}
             schema = body_param.get("schema", {})
-
-            for mime in consumes:
-                content[mime] = {"schema": schema}
-
             operation["requestBody"] = {
                 "required": body_param.get("required", False),
                 "description": body_param.get("description"),
-                "content": content,
+                "content": {mime: {"schema": schema} for mime in consumes},
             }
 
+    responses = operation.get("responses", {})
 
-def _convert_responses(data: dict[str, Any]) -> None:
-    """Wrap response schemas into content/media-type structure."""
-    for _, _, operation in _iter_path_entries(data):
-        produces = operation.pop("produces", ["application/json"])
-        responses = operation.get("responses", {})
+    if not isinstance(responses, dict):
+        return
 
-        if not isinstance(responses, dict):
-            continue
+    # YAML aliases may share responses between operations of different
+    # ``produces``, so converted responses are copies, not the originals
+    operation["responses"] = {
+        code: _convert_response(response, produces)
+        for code, response in responses.items()
+    }
 
-        for _code, response in responses.items():
-            if not isinstance(response, dict):
-                continue
 
-            if "schema" in response:
-                schema = response.pop("schema")
-                content = {}
+def _convert_response(response: Any, produces: list[str]) -> Any:
+    """Return *response* with its ``schema`` wrapped into ``content``."""
+    if not isinstance(response, dict) or "schema" not in response:
+        return response
 
-                for mime in produces:
-                    content[mime] = {"schema": schema}
+    converted = dict(response)
+    schema = converted.pop("schema")
+    converted["content"] = {mime: {"schema": schema} for mime in produces}
 
-                response["content"] = content
+    return converted
@@ -27,7 +27,14 @@ from openapi_parser.models.base import (
     _ModelBase,
     _MutableModelBase,
 )
-from openapi_parser.models.mixins import ExtensionsMixin, RefCacheMixin
+from openapi_parser.models.graph import DependencyGraph
+from openapi_parser.models.index import OperationIndex
+from openapi_parser.models.lazy import materialize_lazy_fields
+from openapi_parser.models.mixins import (
+    ExtensionsMixin,
+    RefCacheMixin,
+    ensure_ref_cache_scope,
+)
 
 
 class Schema(ExtensionsMixin, RefCacheMixin, _MutableModelBase):
@@ -301,6 +308,13 @@ class Components(ExtensionsMixin, _ModelBase):
     callbacks: dict[str, Callback] | None = None
     path_items: dict[str, PathItem] | None = Field(default=None, alias="pathItems")
 
+    @model_serializer(mode="wrap")
+    def _dump_lazy(self, handler: Any) -> Any:
+        """Validate lazily loaded sections before serializing them."""
+        materialize_lazy_fields(self)
+
+        return handler(self)
+
 
 class Specification(ExtensionsMixin, _ModelBase):
     """OpenAPI 3.0 specification root object."""
@@ -313,3 +327,67 @@ class Specification(ExtensionsMixin, _ModelBase):
     security: list[dict[str, list[str]]] | None = None
     tags: list[Tag] | None = None
     external_docs: ExternalDoc | None = Field(default=None, alias="externalDocs")
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _scope_ref_caches(cls, data: Any, handler: Any) -> Any:
+        """Deduplicate ``$ref`` targets when validated outside of ``parse()``."""
+        with ensure_ref_cache_scope():
+            return handler(data)
+
+    @model_serializer(mode="wrap")
+    def _dump_lazy(self, handler: Any) -> Any:
+        """Validate lazily loaded paths before serializing them."""
+        materialize_lazy_fields(self)
+
+        return handler(self)
+
+    @property
+    def operation_index(self) -> OperationIndex:
+        """Operation lookup tables, built on first use and cached on the model.
+
+        The index is rebuilt if ``paths`` or ``webhooks`` is replaced,
+        e.g. on a ``model_copy(update=...)``. On a lazy spec, building
+        it validates every path item.
+        """
+        webhooks = getattr(self, "webhooks", None)
+        # kept in __dict__ rather than a private attribute: pydantic
+        # compares private attributes but skips non-field __dict__ keys,
+        # so the cache does not affect equality
+        index: OperationIndex | None = self.__dict__.get("_operation_index")
+
+        if index is None or not index.is_current(self.paths, webhooks):
+            index = OperationIndex.build(self.paths, webhooks)
+            object.__setattr__(self, "_operation_index", index)
+
+        return index
+
+    def get_operation(self, operation_id: str) -> Operation | None:
+        """Return the operation with the given ``operationId``, if any."""
+        return self.operation_index.by_id.get(operation_id)
+
+    def operations_by_tag(self, tag: str) -> tuple[Operation, ...]:
+        """Return every operation tagged with *tag*, in document order."""
+        return self.operation_index.by_tag.get(tag, ())
+
+    def operation_for(self, method: str, path_template: str) -> Operation | None:
+        """Return the operation for *method* on a ``paths`` template, if any."""
+        return self.operation_index.by_route.get((method.lower(), path_template))
+
+    @property
+    def dependency_graph(self) -> DependencyGraph:
+        """``$ref`` graph of the components, built on first use and cached.
+
+        Like :attr:`operation_index`, the graph is rebuilt if ``paths``,
+        ``webhooks`` or ``components`` is replaced, and building it
+        validates every entry of a lazy spec.
+        """
+        webhooks = getattr(self, "webhooks", None)
+        # cached in __dict__ like the operation index
+        graph: DependencyGraph | None = self.__dict__.get("_dependency_graph")
+
+        if graph is None or not graph.is_current(self.paths, webhooks, self.components):
+            graph = DependencyGraph.build(self.paths, webhooks, self.components)
+            object.__setattr__(self, "_dependency_graph", graph)
+
+        return graph
@@ -0,0 +1,124 @@
+"""Timings and counters reported while parsing a specification."""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel
+
+
+@dataclass
+class ParseStats:
+    """Counters collected during one :func:`~openapi_parser.parse` call.
+
+    Plain integers and a ``stage -> seconds`` dict, so the whole object
+    converts to metrics with :func:`dataclasses.asdict`. Work deferred
+    past the call, such as lazy validation, is not counted.
+    """
+
+    bytes_read: int = 0
+    external_documents: int = 0
+    refs_resolved: int = 0
+    resolved_cache_hits: int = 0
+    resolved_cache_misses: int = 0
+    ref_cache_hits: int = 0
+    ref_cache_misses: int = 0
+    models: int = 0
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+
+
+class ParseObserver:
+    """Receives stage events and counters from :func:`~openapi_parser.parse`.
+
+    Subclass it and override the hooks you need; they all do nothing by
+    default. Stages are ``read``, ``cache``, ``decode``, ``normalize``,
+    ``select``, ``resolve`` and ``validate``, and only those that run are
+    reported: ``cache`` only with a ``cache_dir``, whose hits skip the
+    rest, ``normalize`` only for Swagger 2.0 and ``select`` only with an
+    ``include_*`` filter. Hooks are called on the parsing thread.
+    """
+
+    def stage_started(self, stage: str) -> None:
+        """Called when *stage* begins."""
+
+    def stage_finished(self, stage: str, seconds: float) -> None:
+        """Called when *stage* ends, also when it fails."""
+
+    def parse_finished(self, stats: ParseStats) -> None:
+        """Called with the counters of a successful parse."""
+
+
+class _Tracker:
+    """Times the stages of one parse for an observer and collects its counters."""
+
+    def __init__(self, observer: ParseObserver) -> None:
+        """Report to *observer*."""
+        self.observer = observer
+        self.stats = ParseStats()
+        # documents may be read from several prefetch threads at once
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the block as the stage *name*."""
+        self.observer.stage_started(name)
+        started = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            durations = self.stats.stage_seconds
+            durations[name] = durations.get(name, 0.0) + seconds
+            self.observer.stage_finished(name, seconds)
+
+    def record_root(self, text: str) -> None:
+        """Count the bytes of the root document."""
+        self.stats.bytes_read += len(text.encode())
+
+    def record_read(self, _uri: str, text: str) -> None:
+        """Count an external document; usable as an ``on_read`` callback."""
+        size = len(text.encode())
+
+        with self._lock:
+            self.stats.external_documents += 1
+            self.stats.bytes_read += size
+
+    def finish(self, spec: BaseModel) -> None:
+        """Count the models of *spec* and report the final counters."""
+        self.stats.models = _count_models(spec)
+        self.observer.parse_finished(self.stats)
+
+
+def _count_models(model: BaseModel) -> int:
+    """Count the distinct model instances reachable from *model*.
+
+    Lazily validated mappings are not entered, so only models that
+    exist already are counted.
+    """
+    models = 0
+    seen: set[int] = set()
+    stack: list[Any] = [model]
+
+    while stack:
+        node = stack.pop()
+
+        if id(node) in seen:
+            continue
+
+        seen.add(id(node))
+
+        if isinstance(node, BaseModel):
+            models += 1
+            values: Any = node.__dict__.values()
+        elif isinstance(node, dict):
+            values = node.values()
+        else:
+            values = node
+
+        stack.extend(v for v in values if isinstance(v, (BaseModel, dict, list)))
+
+    return models
@@ -1,20 +1,33 @@
 """Main entry point for the OpenAPI parser."""
 
+import asyncio
+import contextlib
+import functools
 import os
 import types
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from contextlib import AbstractContextManager
 from typing import Any, TypeAlias, cast
+from urllib.parse import urlparse
 
 from pydantic import ValidationError
+from referencing import Resource
 from yaml import YAMLError
-from yaml import safe_load as safe_load_yaml
 
 from openapi_parser import models
+from openapi_parser.cache import SpecCache, content_digest
 from openapi_parser.errors import ParserError
-from openapi_parser.models.mixins import RefCacheMixin
+from openapi_parser.fetcher import AsyncFetcher, Fetcher
+from openapi_parser.loader import load_document
+from openapi_parser.models.lazy import build_lazy_specification
+from openapi_parser.models.mixins import count_ref_cache, ref_cache_scope
 from openapi_parser.models.v2_0 import normalize_swagger_v2
 from openapi_parser.models.v3_0 import Specification as SpecificationV3_0
 from openapi_parser.models.v3_1 import Specification as SpecificationV3_1
-from openapi_parser.resolver import _read_uri, resolve
+from openapi_parser.observer import ParseObserver, _Tracker
+from openapi_parser.resolver import OnRead, _read_uri, prefetch_async, resolve
+from openapi_parser.selection import Selection
 
 Specification: TypeAlias = SpecificationV3_0 | SpecificationV3_1
 
@@ -37,16 +50,38 @@ def _detect_version(raw: dict[str, Any]) -> str:
     return ".".join(version_parts)
 
 
-def _load_raw(uri: str | None, spec_string: str | None) -> dict[str, Any]:
-    """Load and parse YAML/JSON from *uri* or *spec_string*."""
+def _stage(tracker: _Tracker | None, name: str) -> AbstractContextManager[None]:
+    """Time the block as stage *name* when the parse is observed."""
+    return tracker.stage(name) if tracker is not None else contextlib.nullcontext()
+
+
+def _read_source(
+    uri: str | None,
+    spec_string: str | None,
+    fetcher: Fetcher | None = None,
+) -> tuple[str, str | None]:
+    """Return the root document text and content type from *uri* or *spec_string*."""
+    if uri:
+        try:
+            return _read_uri(uri, fetcher)
+        except OSError as e:
+            raise ParserError(f"Failed to load spec: {e}") from e
+
+    if spec_string:
+        return spec_string, None
+
+    raise ParserError("Either uri or spec_string must be provided")
+
+
+def _decode_raw(
+    text: str,
+    uri: str | None = None,
+    content_type: str | None = None,
+) -> dict[str, Any]:
+    """Parse the YAML/JSON root document *text* into a dict."""
     try:
-        if uri:
-            raw = safe_load_yaml(_read_uri(uri))
-        elif spec_string:
-            raw = safe_load_yaml(spec_string)
-        else:
-            raise ParserError("Either uri or spec_string must be provided")
-    except (OSError, YAMLError) as e:
+        raw = load_document(text, uri, content_type)
+    except YAMLError as e:
         raise ParserError(f"Failed to load spec: {e}") from e
 
     if not isinstance(raw, dict):
@@ -55,22 +90,166 @@ def _load_raw(uri: str | None, spec_string: str | None) -> dict[str, Any]:
     return raw
 
 
+def _load_raw(
+    uri: str | None,
+    spec_string: str | None,
+    fetcher: Fetcher | None = None,
+) -> dict[str, Any]:
+    """Load and parse YAML/JSON from *uri* or *spec_string*."""
+    text, content_type = _read_source(uri, spec_string, fetcher)
+
+    return _decode_raw(text, uri or None, content_type)
+
+
 def _validate_model(
     spec_module: types.ModuleType,
     resolved: dict[str, Any],
     version_key: str,
+    lazy: bool = False,
 ) -> Specification:
     """Validate the resolved spec against a version-specific module."""
     try:
+        if lazy:
+            return cast(
+                Specification,
+                build_lazy_specification(spec_module.Specification, resolved),
+            )
+
         return cast(Specification, spec_module.Specification.model_validate(resolved))
     except ValidationError as e:
         raise ParserError(f"Validation failed for OpenAPI {version_key}: {e}") from e
 
 
+def _prepare_raw(
+    raw: dict[str, Any],
+    tracker: _Tracker | None = None,
+) -> tuple[dict[str, Any], str]:
+    """Detect the version of a root document, normalizing Swagger 2.0."""
+    version = _detect_version(raw)
+    if version == "2.0":
+        with _stage(tracker, "normalize"):
+            raw = normalize_swagger_v2(raw)
+
+    if version not in _VERSION_SPEC_MAP:
+        raise ParserError(f"Unsupported OpenAPI version: {version}")
+
+    return raw, version
+
+
+def _resolve_and_validate(
+    raw: dict[str, Any],
+    version: str,
+    location: str | None,
+    on_read: OnRead | None = None,
+    lazy: bool = False,
+    fetcher: Fetcher | None = None,
+    prefetched: list[tuple[str, Resource[Any]]] | None = None,
+    tracker: _Tracker | None = None,
+    compact: bool = False,
+) -> Specification:
+    """Resolve and validate a root document prepared by :func:`_prepare_raw`."""
+    stats = tracker.stats if tracker is not None else None
+
+    try:
+        with _stage(tracker, "resolve"):
+            resolved = resolve(
+                raw, location, version, on_read, fetcher, prefetched, stats, compact
+            )
+    except Exception as e:
+        raise ParserError(f"Failed to resolve references: {e}") from e
+
+    with (
+        _stage(tracker, "validate"),
+        count_ref_cache(stats) if stats is not None else contextlib.nullcontext(),
+    ):
+        return _validate_model(_VERSION_SPEC_MAP[version], resolved, version, lazy)
+
+
+def _parse_raw(
+    raw: dict[str, Any],
+    location: str | None,
+    on_read: OnRead | None = None,
+    lazy: bool = False,
+    fetcher: Fetcher | None = None,
+    tracker: _Tracker | None = None,
+    selection: Selection | None = None,
+    compact: bool = False,
+) -> Specification:
+    """Normalize, prune, resolve and validate a loaded root document."""
+    raw, version = _prepare_raw(raw, tracker)
+
+    if selection is not None:
+        with _stage(tracker, "select"):
+            raw = selection.apply(raw)
+
+    return _resolve_and_validate(
+        raw, version, location, on_read, lazy, fetcher, tracker=tracker, compact=compact
+    )
+
+
+def _parse_cached(
+    text: str,
+    content_type: str | None,
+    uri: str | None,
+    location: str | None,
+    cache_dir: str | os.PathLike[str],
+    lazy: bool = False,
+    fetcher: Fetcher | None = None,
+    tracker: _Tracker | None = None,
+    selection: Selection | None = None,
+    compact: bool = False,
+) -> Specification:
+    """Serve the spec from *cache_dir*, parsing and storing it on a miss."""
+    cache = SpecCache(cache_dir, fetcher)
+    variant = selection.cache_key if selection is not None else ""
+
+    if compact:
+        variant += "compact"
+
+    # lazy entries defer validation, so eager parses must not load them
+    if lazy:
+        variant += "lazy"
+
+    with _stage(tracker, "cache"):
+        key = cache.key(text, location, variant)
+        cached = cache.load(key)
+
+    if isinstance(cached, SpecificationV3_0):
+        return cached
+
+    documents: dict[str, str] = {}
+
+    def _record(document_uri: str, document_text: str) -> None:
+        documents[document_uri] = content_digest(document_text)
+
+        if tracker is not None:
+            tracker.record_read(document_uri, document_text)
+
+    with _stage(tracker, "decode"):
+        raw = _decode_raw(text, uri, content_type)
+
+    spec = _parse_raw(
+        raw, location, _record, lazy, fetcher, tracker, selection, compact
+    )
+
+    with _stage(tracker, "cache"):
+        cache.store(key, documents, spec)
+
+    return spec
+
+
 def parse(
     uri: str | os.PathLike[str] | None = None,
     spec_string: str | None = None,
     base_uri: str | os.PathLike[str] | None = None,
+    cache_dir: str | os.PathLike[str] | None = None,
+    lazy: bool = False,
+    fetcher: Fetcher | None = None,
+    observer: ParseObserver | None = None,
+    include_paths: Iterable[str] | None = None,
+    include_tags: Iterable[str] | None = None,
+    include_operation_ids: Iterable[str] | None = None,
+    compact: bool = False,
 ) -> Specification:
     """Parse an OpenAPI/Swagger spec into fully typed Pydantic models.
 
@@ -84,6 +263,43 @@ def parse(
         Location used to resolve external ``$ref`` targets when parsing
         a *spec_string* (e.g. ``"file:///path/to/specs/main.yaml"``).
         Ignored when *uri* is provided.
+    cache_dir : str, optional
+        Directory of a persistent cache of parsed specs. Entries are
+        keyed by the content hash of the root document and of every
+        external ``$ref`` document it pulled in; a hit skips loading,
+        resolution and validation entirely. Entries are pickled, so the
+        directory must not be writable by untrusted users.
+    lazy : bool, optional
+        Defer validation of ``paths``, ``webhooks`` and every
+        ``components`` section. Those become read-only mappings whose
+        values are validated on first access and memoized; validation
+        errors surface as :class:`ParserError` at that point.
+        Serializing or caching the spec validates everything.
+    fetcher : Fetcher, optional
+        Retrieves ``http(s)://`` documents, e.g. an
+        :class:`~openapi_parser.fetcher.HTTPFetcher` that pools
+        keep-alive connections, retries and decodes compressed bodies.
+        Defaults to a plain ``urlopen`` per document.
+    observer : ParseObserver, optional
+        Notified when each stage of the parse starts and ends, and given
+        the bytes read, documents fetched, ``$ref`` and cache counters
+        and model count of a successful parse; see
+        :class:`~openapi_parser.observer.ParseObserver`.
+    include_paths : Iterable[str], optional
+        Path templates whose operations are kept. Passing any of the
+        ``include_*`` filters drops every operation matched by none of
+        them before ``$ref`` resolution, together with the path items
+        and webhooks left empty and every component not reachable from
+        what is kept, so the parse costs time in proportion to the
+        slice. ``securitySchemes`` are always kept.
+    include_tags : Iterable[str], optional
+        Tags whose operations are kept, in ``paths`` and ``webhooks``.
+    include_operation_ids : Iterable[str], optional
+        ``operationId`` values of operations to keep.
+    compact : bool, optional
+        Use less memory for the models: equal keys and strings, such as
+        ``ref_name`` values, property names and media types, share one
+        object.
 
     Returns:
     -------
@@ -95,7 +311,124 @@ def parse(
     ParserError
         On parse failures, wrapping the original exception.
     """
-    RefCacheMixin.clear_ref_cache()
+    if uri is not None:
+        uri = os.fspath(uri)
+
+    if base_uri is not None:
+        base_uri = os.fspath(base_uri)
+
+    location = base_uri if uri is None else uri
+    tracker = _Tracker(observer) if observer is not None else None
+    selection = Selection.of(include_paths, include_tags, include_operation_ids)
+
+    # $ref dedup caches live only as long as this call
+    with ref_cache_scope():
+        with _stage(tracker, "read"):
+            text, content_type = _read_source(uri, spec_string, fetcher)
+
+        if tracker is not None:
+            tracker.record_root(text)
+
+        if cache_dir is not None:
+            spec = _parse_cached(
+                text,
+                content_type,
+                uri,
+                location,
+                cache_dir,
+                lazy,
+                fetcher,
+                tracker,
+                selection,
+                compact,
+            )
+        else:
+            with _stage(tracker, "decode"):
+                raw = _decode_raw(text, uri or None, content_type)
+
+            on_read = tracker.record_read if tracker is not None else None
+            spec = _parse_raw(
+                raw, location, on_read, lazy, fetcher, tracker, selection, compact
+            )
+
+        if tracker is not None:
+            tracker.finish(spec)
+
+        return spec
+
+
+def _decode_and_prepare(
+    text: str,
+    uri: str | None,
+    content_type: str | None,
+) -> tuple[dict[str, Any], str]:
+    """Decode a root document and detect its version."""
+    return _prepare_raw(_decode_raw(text, uri, content_type))
+
+
+def _resolve_isolated(
+    raw: dict[str, Any],
+    version: str,
+    location: str | None,
+    lazy: bool,
+    prefetched: list[tuple[str, Resource[Any]]] | None,
+) -> Specification:
+    """Resolve and validate using a ref cache private to this call.
+
+    Executor threads do not inherit the caller's context, so the scope
+    is opened inside the job itself.
+    """
+    with ref_cache_scope():
+        return _resolve_and_validate(
+            raw, version, location, lazy=lazy, prefetched=prefetched
+        )
+
+
+async def parse_async(
+    uri: str | os.PathLike[str] | None = None,
+    spec_string: str | None = None,
+    base_uri: str | os.PathLike[str] | None = None,
+    lazy: bool = False,
+    fetcher: AsyncFetcher | None = None,
+    executor: Executor | None = None,
+) -> Specification:
+    """Parse an OpenAPI/Swagger spec without blocking the event loop.
+
+    The root document and every external ``$ref`` document are read
+    concurrently; decoding, resolution and validation run in
+    *executor*. The result is identical to :func:`parse`.
+
+    Parameters
+    ----------
+    uri : str, optional
+        Location of the spec file. Accepts a local paths and URIs.
+    spec_string : str, optional
+        Raw spec YAML/JSON string (alternative to *uri*).
+    base_uri : str, optional
+        Location used to resolve external ``$ref`` targets when parsing
+        a *spec_string*. Ignored when *uri* is provided.
+    lazy : bool, optional
+        Defer validation of ``paths``, ``webhooks`` and every
+        ``components`` section, as in :func:`parse`.
+    fetcher : AsyncFetcher, optional
+        Retrieves ``http(s)://`` documents on the event loop, e.g. a
+        :class:`~openapi_parser.fetcher.ThreadedFetcher`. Defaults to a
+        plain ``urlopen`` per document in *executor*.
+    executor : Executor, optional
+        Runs file reads and CPU-bound work. Defaults to the loop's
+        default executor.
+
+    Returns:
+    -------
+    Specification
+        Version-specific typed specification model.
+
+    Raises:
+    ------
+    ParserError
+        On parse failures, wrapping the original exception.
+    """
+    loop = asyncio.get_running_loop()
 
     if uri is not None:
         uri = os.fspath(uri)
@@ -103,19 +436,39 @@ def parse(
     if base_uri is not None:
         base_uri = os.fspath(base_uri)
 
-    raw = _load_raw(uri, spec_string)
+    location = base_uri if uri is None else uri
 
-    version = _detect_version(raw)
-    if version == "2.0":
-        raw = normalize_swagger_v2(raw)
+    async def _read(document_uri: str) -> tuple[str, str | None]:
+        if fetcher is not None and urlparse(document_uri).scheme in ("http", "https"):
+            return await fetcher.fetch(document_uri)
 
-    spec_module = _VERSION_SPEC_MAP.get(version)
-    if spec_module is None:
-        raise ParserError(f"Unsupported OpenAPI version: {version}")
+        return await loop.run_in_executor(executor, _read_uri, document_uri)
 
-    try:
-        resolved = resolve(raw, base_uri if uri is None else uri, version)
-    except Exception as e:
-        raise ParserError(f"Failed to resolve references: {e}") from e
+    async def _load(document_uri: str) -> Any:
+        text, content_type = await _read(document_uri)
+
+        return await loop.run_in_executor(
+            executor, load_document, text, document_uri, content_type
+        )
+
+    if uri:
+        try:
+            text, content_type = await _read(uri)
+        except OSError as e:
+            raise ParserError(f"Failed to load spec: {e}") from e
+    elif spec_string:
+        text, content_type = spec_string, None
+    else:
+        raise ParserError("Either uri or spec_string must be provided")
+
+    raw, version = await loop.run_in_executor(
+        executor, _decode_and_prepare, text, uri or None, content_type
+    )
+    prefetched = (
+        await prefetch_async(raw, location, version, _load) if location else None
+    )
 
-    return _validate_model(spec_module, resolved, version)
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(_resolve_isolated, raw, version, location, lazy, prefetched),
+    )
@@ -1,14 +1,20 @@
 """OpenAPI specification resolver using the referencing library."""
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from os.path import abspath, dirname, isabs, join
-from typing import Any, TypeVar, cast
-from urllib.parse import urljoin, urlparse
+from typing import Any, TypeAlias, TypeVar, cast
+from urllib.parse import urldefrag, urljoin, urlparse
 from urllib.request import url2pathname, urlopen
 
 from referencing import Registry, Resource, Specification
 from referencing.jsonschema import DRAFT4, DRAFT202012
-from yaml import safe_load
+
+from openapi_parser.fetcher import Fetcher
+from openapi_parser.loader import load_document
+from openapi_parser.observer import ParseStats
 
 _DRAFT_BY_VERSION = {
     "2.0": DRAFT4,
@@ -17,52 +23,238 @@ _DRAFT_BY_VERSION = {
     "3.2": DRAFT202012,
 }
 
+# Upper bound on concurrent external document fetches.
+_PREFETCH_WORKERS = 8
+
+# URI that the root document is registered under.
+_ROOT_URI = "urn:root"
+
+
+def _read_uri(uri: str, fetcher: Fetcher | None = None) -> tuple[str, str | None]:
+    """Read the full contents of a URI along with its reported content type.
 
-def _read_uri(uri: str) -> str:
-    """Read the full contents of a URI into a string."""
+    Remote documents go through *fetcher* when one is given, and a plain
+    ``urlopen`` otherwise.
+    """
     parsed = urlparse(uri)
 
     if parsed.scheme in ("http", "https"):
+        if fetcher is not None:
+            return fetcher.fetch(uri)
+
         with urlopen(uri, timeout=10) as response:
             body: str = response.read().decode("utf-8")
-            return body
+            headers = getattr(response, "headers", None)
+            content_type = headers.get("Content-Type") if headers else None
+            return body, content_type
 
     if parsed.scheme == "file":
         with open(url2pathname(parsed.path)) as f:
-            return f.read()
+            return f.read(), None
 
     with open(uri) as f:
-        return f.read()
+        return f.read(), None
+
+
+# Called with ``(uri, text)`` for every document read from a URI.
+OnRead: TypeAlias = Callable[[str, str], None]
+
+
+def _load_uri(
+    uri: str,
+    on_read: OnRead | None = None,
+    fetcher: Fetcher | None = None,
+) -> Any:
+    """Read and decode the JSON/YAML document at *uri*."""
+    text, content_type = _read_uri(uri, fetcher)
+
+    if on_read is not None:
+        on_read(uri, text)
+
+    return load_document(text, uri, content_type)
+
+
+def _make_locator(base_uri: str) -> Callable[[str], str]:
+    """Map document URIs seen by ``referencing`` to readable locations.
+
+    Relative targets are joined against the URL of a remote *base_uri*,
+    or against the directory of a local one.
+    """
+    parsed = urlparse(base_uri)
+
+    if parsed.scheme in ("http", "https"):
+        return partial(urljoin, base_uri)
+
+    resolved = url2pathname(parsed.path) if parsed.scheme == "file" else base_uri
+    base_dir = dirname(abspath(resolved))
+
+    def _locate(u: str) -> str:
+        return join(base_dir, u) if not isabs(u) else u
+
+    return _locate
 
 
 def _make_retriever(
-    base_uri: str, draft: Specification[Any]
+    base_uri: str,
+    draft: Specification[Any],
+    on_read: OnRead | None = None,
+    fetcher: Fetcher | None = None,
 ) -> Callable[[str], Resource[Any]]:
     """Build a retriever callable for the ``referencing`` library.
 
     Handles both local files and HTTP(S) external ``$ref`` targets
-    using the shared :func:`_read_uri` helper.
+    using the shared :func:`_load_uri` helper. *on_read* is notified of
+    every document fetched; remote ones are retrieved with *fetcher*.
     """
-    parsed = urlparse(base_uri)
-    is_http = parsed.scheme in ("http", "https")
-
-    if not is_http:
-        resolved = url2pathname(parsed.path) if parsed.scheme == "file" else base_uri
-        base_dir = dirname(abspath(resolved))
+    locate = _make_locator(base_uri)
 
     def _retrieve(u: str) -> Resource[Any]:
-        if is_http:
-            ref_url = urljoin(base_uri, u)
-            raw: Any = safe_load(_read_uri(ref_url))
-        else:
-            path = join(base_dir, u) if not isabs(u) else u
-            raw = safe_load(_read_uri(path))
+        raw = _load_uri(locate(u), on_read, fetcher)
 
         return Resource.from_contents(raw, default_specification=draft)
 
     return _retrieve
 
 
+def _iter_refs(node: Any) -> Iterator[str]:
+    """Yield the ``$ref`` strings below *node*.
+
+    Containers are tracked by ``id()``, so nodes shared or made cyclic by
+    YAML aliases are scanned only once.
+    """
+    seen: set[int] = set()
+    stack = [node]
+
+    while stack:
+        current = stack.pop()
+
+        if not isinstance(current, (dict, list)) or id(current) in seen:
+            continue
+
+        seen.add(id(current))
+
+        if isinstance(current, dict):
+            ref = current.get("$ref")
+
+            if isinstance(ref, str):
+                yield ref
+
+            stack.extend(current.values())
+        else:
+            stack.extend(current)
+
+
+def _external_targets(contents: Any, base_uri: str) -> set[str]:
+    """Collect the URIs of external documents referenced from *contents*.
+
+    URIs are joined against *base_uri* the same way ``referencing`` does,
+    so they match the keys it looks up in the registry.
+    """
+    targets: set[str] = set()
+
+    for ref in _iter_refs(contents):
+        target = urldefrag(ref)[0]
+
+        if target:
+            targets.add(urldefrag(urljoin(base_uri, target))[0])
+
+    return targets
+
+
+def _prefetch(
+    raw: dict[str, Any],
+    retrieve: Callable[[str], Resource[Any]],
+    max_workers: int = _PREFETCH_WORKERS,
+    known: dict[str, Resource[Any]] | None = None,
+) -> list[tuple[str, Resource[Any]]]:
+    """Fetch every external document reachable from *raw* concurrently.
+
+    Documents are fetched in breadth-first waves on a bounded thread
+    pool: each wave retrieves the targets referenced by the previous
+    one. Failed fetches are skipped here; the walk retries them and
+    reports the error in context. Documents in *known*, together with
+    everything they reference, were fetched before and are returned
+    without being read again.
+    """
+    known = known or {}
+    fetched: list[tuple[str, Resource[Any]]] = list(known.items())
+    wave = _external_targets(raw, _ROOT_URI) - known.keys()
+    seen = wave | known.keys()
+
+    if not wave:
+        return fetched
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while wave:
+            futures: dict[str, Future[Resource[Any]]] = {
+                uri: pool.submit(retrieve, uri) for uri in sorted(wave)
+            }
+            wave = set()
+
+            for uri, future in futures.items():
+                try:
+                    resource = future.result()
+                except Exception:  # noqa: BLE001, S112  # the walk re-raises it
+                    continue
+
+                fetched.append((uri, resource))
+                targets = _external_targets(resource.contents, uri) - seen
+                seen |= targets
+                wave |= targets
+
+    return fetched
+
+
+async def prefetch_async(
+    raw: dict[str, Any],
+    uri: str,
+    version: str | None,
+    load: Callable[[str], Awaitable[Any]],
+    max_concurrency: int = _PREFETCH_WORKERS,
+) -> list[tuple[str, Resource[Any]]]:
+    """Fetch every external document reachable from *raw* on the event loop.
+
+    The asynchronous counterpart of the prefetch done by :func:`resolve`:
+    *load* reads and decodes the document at a location, and each wave
+    of targets is awaited concurrently, at most *max_concurrency* at a
+    time. Pass the result to :func:`resolve` as *prefetched*.
+    """
+    draft = _DRAFT_BY_VERSION.get(version or "", DRAFT202012)
+    locate = _make_locator(uri)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _fetch(u: str) -> Resource[Any]:
+        async with semaphore:
+            contents = await load(locate(u))
+
+        return Resource.from_contents(contents, default_specification=draft)
+
+    fetched: list[tuple[str, Resource[Any]]] = []
+    wave = _external_targets(raw, _ROOT_URI)
+    seen = set(wave)
+
+    while wave:
+        targets = sorted(wave)
+        results = await asyncio.gather(
+            *(_fetch(u) for u in targets), return_exceptions=True
+        )
+        wave = set()
+
+        for target, result in zip(targets, results, strict=True):
+            if not isinstance(result, Resource):
+                if not isinstance(result, Exception):  # e.g. cancellation
+                    raise result
+
+                continue  # the walk retries it and reports the error
+
+            fetched.append((target, result))
+            found = _external_targets(result.contents, target) - seen
+            seen |= found
+            wave |= found
+
+    return fetched
+
+
 _COMPONENT_SECTIONS = frozenset(
     {
         "schemas",
@@ -79,47 +271,6 @@ _COMPONENT_SECTIONS = frozenset(
 )
 
 
-def _traverse(
-    node: Any,
-    process_dict: Callable[[dict[str, Any]], Any] | None = None,
-    *,
-    _tracking: set[int],
-) -> Any:
-    """Walk a JSON-like tree with ``id()``-based cycle tracking.
-
-    For every dict encountered, *process_dict* is called first.
-    If it returns a value other than ``None``, that value replaces the
-    dict and recursion is skipped (used for ``$ref`` resolution and
-    cycle-breaking placeholders).
-    """
-    if isinstance(node, dict):
-        if process_dict is not None:
-            replacement = process_dict(node)
-
-            if replacement is not None:
-                return replacement
-
-        nid = id(node)
-
-        _tracking.add(nid)
-
-        try:
-            for k, v in list(node.items()):
-                node[k] = _traverse(v, process_dict, _tracking=_tracking)
-
-            return node
-        finally:
-            _tracking.discard(nid)
-
-    if isinstance(node, list):
-        for i, v in enumerate(node):
-            node[i] = _traverse(v, process_dict, _tracking=_tracking)
-
-        return node
-
-    return node
-
-
 def _annotate_component_refs(data: dict[str, Any]) -> None:
     """Add ref_name to every component entry so RefCacheMixin can track them."""
     components = data.get("components")
@@ -140,106 +291,289 @@ def _annotate_component_refs(data: dict[str, Any]) -> None:
 
 T = TypeVar("T")
 
+# A container whose children are still being walked: the container, an
+# iterator over its remaining ``(key, value)`` pairs, the resolver for
+# ``$ref``s inside it, its ``id()`` and the ``ref_name`` to annotate it
+# with once all children are resolved.
+_Frame: TypeAlias = tuple[
+    "dict[str, Any] | list[Any]",
+    Iterator[tuple[Any, Any]],
+    Any,
+    int,
+    "str | None",
+]
+
+
+def _alias_cycle(key: Any) -> ValueError:
+    """Return the error for a container that contains itself under *key*."""
+    return ValueError(
+        f"{key!r} contains the object it belongs to (a YAML alias cycle); "
+        "cycles are only supported through $ref"
+    )
 
-def _resolve_ref_node(
-    node: dict[str, Any],
-    resolver: Any,
-    resolved_cache: dict[str, dict[str, Any]],
-    _walking: set[int],
-) -> Any:
-    """Resolve a single $ref node and return the referenced content."""
-    ref = node["$ref"]
 
-    if ref in resolved_cache:
-        cached: Any = resolved_cache[ref]
+def _is_ref(node: Any) -> bool:
+    """Check whether *node* is a ``{"$ref": "<string>"}`` reference object."""
+    return isinstance(node, dict) and isinstance(node.get("$ref"), str)
 
-        if isinstance(cached, dict) and id(cached) in _walking:
-            return {"ref_name": ref}
 
-        return cached
+class _RefWalker:
+    """Iterative depth-first ``$ref`` resolver over a JSON-like tree.
+
+    Uses an explicit stack instead of recursion, so arbitrarily deep
+    documents never hit the interpreter recursion limit. Containers are
+    tracked by ``id()`` in ``seen``: ``True`` while they are on the
+    current path and ``False`` once walked. A ``$ref`` back to a
+    container on the path is replaced with a ``{"ref_name": ...}``
+    placeholder to break the cycle; reaching one without a ``$ref``, as
+    a YAML alias to an enclosing node does, raises ``ValueError``.
+    Walked containers are never descended into again.
+
+    ``refs`` counts the ``$ref`` nodes met and ``cache_hits`` those
+    whose target was already in ``resolved_cache``.
+    """
+
+    def __init__(self, resolved_cache: dict[str, Any] | None = None) -> None:
+        self.resolved_cache: dict[str, Any] = (
+            resolved_cache if resolved_cache is not None else {}
+        )
+        self.seen: dict[int, bool] = {}
+        self.stack: list[_Frame] = []
+        self.refs = 0
+        self.cache_hits = 0
+
+    def walk(self, node: T, resolver: Any) -> T:
+        """Resolve every ``$ref`` below *node* in place and return the result.
+
+        Raises:
+            ValueError: If a container contains itself other than
+                through a ``$ref``.
+        """
+        stack = self.stack
+        seen = self.seen
+        result = self._visit(node, resolver)
+
+        while stack:
+            container, items, frame_resolver, container_id, ref = stack[-1]
+
+            # hot loop: the common cases of _visit are inlined here
+            for key, value in items:
+                if isinstance(value, dict):
+                    target = value.get("$ref")
+
+                    if isinstance(target, str):
+                        if self._replace_ref(
+                            container, key, value, target, frame_resolver
+                        ):
+                            break
+
+                        continue
+
+                    items_of: Iterator[tuple[Any, Any]] = iter(value.items())
+                elif isinstance(value, list):
+                    items_of = enumerate(value)
+                else:
+                    continue
+
+                value_id = id(value)
+                walking = seen.get(value_id)
+
+                if walking is None:
+                    seen[value_id] = True
+                    stack.append((value, items_of, frame_resolver, value_id, None))
+                    break
+
+                if walking:
+                    raise _alias_cycle(key)
+            else:
+                stack.pop()
+                seen[container_id] = False
+
+                if ref is not None:
+                    cast("dict[str, Any]", container)["ref_name"] = ref
+
+        return cast(T, result)
+
+    def _replace_ref(
+        self,
+        container: dict[str, Any] | list[Any],
+        key: Any,
+        node: dict[str, Any],
+        ref: str,
+        resolver: Any,
+    ) -> bool:
+        """Replace the ``$ref`` *node* at *key*; return whether it was pushed."""
+        if ref in self.resolved_cache:
+            self.refs += 1
+            self.cache_hits += 1
+            container[key] = self._cached(ref)
+            return False
+
+        depth = len(self.stack)
+        replacement = self._resolve_ref_node(node, resolver)
+
+        if replacement is not node:
+            container[key] = replacement
+
+        return len(self.stack) > depth
+
+    def _push(
+        self,
+        container: dict[str, Any] | list[Any],
+        resolver: Any,
+        ref: str | None = None,
+    ) -> None:
+        """Schedule the children of *container* to be walked."""
+        container_id = id(container)
+        items: Iterator[tuple[Any, Any]] = (
+            iter(container.items())
+            if isinstance(container, dict)
+            else enumerate(container)
+        )
+        self.seen[container_id] = True
+        self.stack.append((container, items, resolver, container_id, ref))
+
+    def _visit(self, node: Any, resolver: Any) -> Any:
+        """Return the replacement for *node*, scheduling its children."""
+        if _is_ref(node):
+            return self._resolve_ref_node(node, resolver)
+
+        if isinstance(node, (dict, list)) and id(node) not in self.seen:
+            self._push(node, resolver)
+
+        return node
+
+    def _resolve_ref_node(self, node: dict[str, Any], resolver: Any) -> Any:
+        """Resolve a single $ref node and return the referenced content.
 
-    result = resolver.lookup(ref)
-    contents = result.contents
-    evolved_resolver = result.resolver
+        ``$ref`` chains are followed in a loop and every ref along the
+        chain is cached to the final target.
+        """
+        chain: list[str] = []
+        self.refs += 1
 
-    if isinstance(contents, dict):
-        resolved_cache[ref] = contents
-        contents_id = id(contents)
+        if node["$ref"] in self.resolved_cache:
+            self.cache_hits += 1
 
-        if contents_id in _walking:
+        while True:
+            ref = node["$ref"]
+
+            if ref in self.resolved_cache:
+                resolved = self._cached(ref)
+                break
+
+            result = resolver.lookup(ref)
+            contents = result.contents
+            resolver = result.resolver
+
+            if _is_ref(contents):
+                self.resolved_cache[ref] = contents
+                chain.append(ref)
+                node = contents
+                continue
+
+            resolved = self._enter_contents(ref, contents, resolver)
+            break
+
+        for chained_ref in chain:
+            self.resolved_cache[chained_ref] = resolved
+
+        return resolved
+
+    def _cached(self, ref: str) -> Any:
+        """Return the cached target of *ref*, or a placeholder on a cycle."""
+        cached = self.resolved_cache[ref]
+
+        if isinstance(cached, dict) and self.seen.get(id(cached)):
             return {"ref_name": ref}
 
-        if "$ref" in contents and isinstance(contents["$ref"], str):
-            resolved = _resolve_ref_node(
-                contents, evolved_resolver, resolved_cache, _walking
-            )
-            resolved_cache[ref] = resolved
-            return resolved
+        return cached
 
-        _walking.add(contents_id)
+    def _enter_contents(self, ref: str, contents: Any, resolver: Any) -> Any:
+        """Cache the target of *ref* and schedule its children to be walked.
 
-        try:
-            for k, v in list(contents.items()):
-                contents[k] = _walk(v, evolved_resolver, resolved_cache, _walking)
-        finally:
-            _walking.discard(contents_id)
+        Dict contents are returned straight away; the ``ref_name``
+        annotation is added once their children have been walked.
+        """
+        if not isinstance(contents, dict):
+            return self._visit(contents, resolver)
 
-        contents["ref_name"] = ref
+        self.resolved_cache[ref] = contents
+        walking = self.seen.get(id(contents))
 
-        return contents
+        if walking:
+            return {"ref_name": ref}
+
+        if walking is None:
+            self._push(contents, resolver, ref)
+        else:
+            contents["ref_name"] = ref
 
-    return _walk(contents, evolved_resolver, resolved_cache, _walking)
+        return contents
 
 
 def _walk(
     node: T,
     resolver: Any,
-    resolved_cache: dict[str, dict[str, Any]] | None = None,
-    _walking: set[int] | None = None,
+    resolved_cache: dict[str, Any] | None = None,
+    stats: ParseStats | None = None,
 ) -> T:
-    """Recursively walk and resolve all $ref nodes in the spec tree."""
-    if resolved_cache is None:
-        resolved_cache = {}
+    """Walk the spec tree and resolve all $ref nodes in place.
 
-    if _walking is None:
-        _walking = set()
-
-    def _dict_fn(d: dict[str, Any]) -> Any:
-        if "$ref" in d and isinstance(d["$ref"], str):
-            return _resolve_ref_node(d, resolver, resolved_cache, _walking)
+    The ``$ref`` and cache counts are added to *stats* if given.
+    """
+    walker = _RefWalker(resolved_cache)
+    result = walker.walk(node, resolver)
 
-        return None
+    if stats is not None:
+        stats.refs_resolved += walker.refs
+        stats.resolved_cache_hits += walker.cache_hits
+        stats.resolved_cache_misses += walker.refs - walker.cache_hits
 
-    return cast(T, _traverse(node, _dict_fn, _tracking=_walking))
+    return result
 
 
 def _build_registry(
     raw: dict[str, Any],
     uri: str | None = None,
     version: str | None = None,
+    on_read: OnRead | None = None,
+    fetcher: Fetcher | None = None,
+    prefetched: list[tuple[str, Resource[Any]]] | None = None,
 ) -> Registry[Any]:
-    """Build a ``referencing`` Registry with the root spec loaded."""
+    """Build a ``referencing`` Registry with the root spec loaded.
+
+    When the spec has a location, every external document it reaches is
+    prefetched concurrently and seeded into the registry, so resolution
+    does not block on I/O one reference at a time. Documents already
+    *prefetched* are seeded as they are.
+    """
     draft = _DRAFT_BY_VERSION.get(version or "", DRAFT202012)
     retrieval: Callable[[str], Resource[Any]] | None = (
-        _make_retriever(uri, draft) if uri else None
+        _make_retriever(uri, draft, on_read, fetcher) if uri else None
     )
     registry = (
         Registry(retrieve=retrieval) if retrieval else Registry()  # type: ignore[call-arg]  # referencing stubs missing ``retrieve``
     )
+    resources = [(_ROOT_URI, Resource.from_contents(raw, default_specification=draft))]
 
-    return cast(
-        "Registry[Any]",
-        registry.with_resource(
-            "urn:root",
-            Resource.from_contents(raw, default_specification=draft),
-        ),
-    )
+    if prefetched is not None:
+        resources.extend(prefetched)
+    elif retrieval is not None:
+        resources.extend(_prefetch(raw, retrieval))
+
+    return registry.with_resources(resources)
 
 
 def resolve(
     raw: dict[str, Any],
     uri: str | None = None,
     version: str | None = None,
+    on_read: OnRead | None = None,
+    fetcher: Fetcher | None = None,
+    prefetched: list[tuple[str, Resource[Any]]] | None = None,
+    stats: ParseStats | None = None,
+    compact: bool = False,
 ) -> dict[str, Any]:
     """Resolve all ``$ref`` entries in *raw*, annotating each with *ref_name*.
 
@@ -250,10 +584,60 @@ def resolve(
 
     The JSON Schema *version* ("3.0" vs "3.1") selects the dialect used
     for ``$ref`` resolution (Draft 4 vs Draft 2020-12).
+
+    *on_read* is called with ``(uri, text)`` for every external document
+    read while resolving, possibly from several threads at once. Remote
+    documents are retrieved with *fetcher* if given. External documents
+    in *prefetched*, e.g. from :func:`prefetch_async`, are not read again.
+    The ``$ref`` counts of the walk are added to *stats* if given. With
+    *compact*, equal keys and strings of the result share one object.
     """
-    registry = _build_registry(raw, uri, version)
-    resolver_obj = registry.resolver(base_uri="urn:root")
-    result = _walk(raw, resolver_obj)
+    registry = _build_registry(raw, uri, version, on_read, fetcher, prefetched)
+    resolver_obj = registry.resolver(base_uri=_ROOT_URI)
+    result = _walk(raw, resolver_obj, stats=stats)
     _annotate_component_refs(result)
 
+    if compact:
+        _intern_strings(result)
+
     return result
+
+
+def _intern_strings(root: Any) -> None:
+    """Make equal dict keys and string values below *root* one object each.
+
+    Decoders create a new string for every occurrence of a key such as
+    ``description`` or ``application/json`` and for every ``ref_name``
+    copied from a ``$ref``. Dicts are refilled in place, which keeps
+    their identity and key order.
+    """
+    strings: dict[str, str] = {}
+    intern = strings.setdefault
+    seen: set[int] = set()
+    stack = [root]
+
+    while stack:
+        node = stack.pop()
+
+        if id(node) in seen:
+            continue
+
+        seen.add(id(node))
+
+        if isinstance(node, dict):
+            items = [
+                (
+                    intern(key, key) if type(key) is str else key,
+                    intern(value, value) if type(value) is str else value,
+                )
+                for key, value in node.items()
+            ]
+            node.clear()
+            node.update(items)
+            stack.extend(value for _, value in items if isinstance(value, (dict, list)))
+        elif isinstance(node, list):
+            for index, value in enumerate(node):
+                if type(value) is str:
+                    node[index] = intern(value, value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
@@ -0,0 +1,244 @@
+"""Match concrete request URLs to the path templates of a specification."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+from urllib.parse import unquote, urlsplit
+
+from openapi_parser.models.index import iter_path_item_operations
+
+if TYPE_CHECKING:
+    from openapi_parser.models.v3_0 import Operation, PathItem, Specification
+
+T = TypeVar("T")
+
+_TEMPLATE_PARAM = re.compile(r"\{([^{}/]+)\}")
+
+
+@dataclass(frozen=True, slots=True)
+class RouteMatch:
+    """Result of matching a request against a :class:`Router`.
+
+    ``operation`` is ``None`` when the path matched but the path item has
+    no operation for the requested method.
+    """
+
+    template: str
+    path_item: PathItem
+    operation: Operation | None
+    path_params: dict[str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class _Route:
+    template: str
+    path_item: PathItem
+    param_names: tuple[str, ...]
+    operations: Mapping[str, Operation]
+
+
+class _Node:
+    """Segment trie node.
+
+    Children are tried from most to least specific: a literal segment,
+    then segments mixing literals and parameters (``v{version}``), then
+    a whole-segment parameter.
+    """
+
+    __slots__ = ("param", "patterns", "static", "value")
+
+    def __init__(self) -> None:
+        self.static: dict[str, _Node] = {}
+        self.patterns: dict[str, tuple[re.Pattern[str], _Node]] = {}
+        self.param: _Node | None = None
+        self.value: object = None
+
+    def insert(self, segments: list[str]) -> tuple[_Node, list[str]]:
+        """Return the node for a template's *segments* and its parameter names."""
+        node = self
+        names: list[str] = []
+
+        for segment in segments:
+            segment_names = _TEMPLATE_PARAM.findall(segment)
+            names.extend(segment_names)
+
+            if not segment_names:
+                node = node.static.setdefault(segment, _Node())
+            elif segment == f"{{{segment_names[0]}}}":
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+            else:
+                key = _TEMPLATE_PARAM.sub("{}", segment)
+
+                if key not in node.patterns:
+                    node.patterns[key] = (_compile_segment(segment), _Node())
+                node = node.patterns[key][1]
+
+        return node, names
+
+
+def _compile_segment(segment: str) -> re.Pattern[str]:
+    """Compile a segment mixing literals and parameters into a regex."""
+    literals = _TEMPLATE_PARAM.split(segment)[::2]
+
+    return re.compile("(.+?)".join(re.escape(literal) for literal in literals))
+
+
+def _search(
+    node: _Node,
+    segments: list[str],
+    index: int,
+    captured: list[str],
+    accept: Callable[[_Node, int], T | None],
+) -> T | None:
+    """Depth-first search of the trie, backtracking to less specific nodes.
+
+    *accept* is asked about a node once every more specific continuation
+    from it has failed, and ends the search by returning a result.
+    """
+    if index < len(segments):
+        segment = segments[index]
+        child = node.static.get(segment)
+
+        if child is not None:
+            found = _search(child, segments, index + 1, captured, accept)
+
+            if found is not None:
+                return found
+
+        for pattern, child in node.patterns.values():
+            m = pattern.fullmatch(segment)
+
+            if m is not None:
+                mark = len(captured)
+                captured.extend(m.groups())
+                found = _search(child, segments, index + 1, captured, accept)
+
+                if found is not None:
+                    return found
+
+                del captured[mark:]
+
+        if node.param is not None and segment:
+            captured.append(segment)
+            found = _search(node.param, segments, index + 1, captured, accept)
+
+            if found is not None:
+                return found
+
+            captured.pop()
+
+    return accept(node, index)
+
+
+def _split(path: str) -> list[str]:
+    """Split an absolute path into segments; ``/`` is a single empty one."""
+    return path.split("/")[1:]
+
+
+def server_base_path(url: str) -> str:
+    """Return the path component of a server URL, without a trailing slash.
+
+    Works on templated URLs such as ``{scheme}://host/v{version}``,
+    which :func:`urllib.parse.urlsplit` does not understand.
+    """
+    if "://" in url or url.startswith("//"):
+        rest = url.split("//", 1)[1]
+        slash = rest.find("/")
+        path = rest[slash:] if slash >= 0 else ""
+    else:
+        path = url
+
+    path = path.split("?", 1)[0].split("#", 1)[0].rstrip("/")
+
+    if path and not path.startswith("/"):
+        path = f"/{path}"
+
+    return path
+
+
+class Router:
+    """Route requests to operations using a segment trie over ``paths``.
+
+    Matching time depends on the number of segments in the request path,
+    not on the number of paths in the specification. Literal segments
+    take precedence over templated ones, as required by the OpenAPI
+    specification, with backtracking when a literal branch dead-ends.
+
+    Request paths are expected to start with one of the base paths of
+    the specification's top-level ``servers``; pass *base_paths* to
+    override them, e.g. ``[""]`` to match paths relative to the server.
+    Server variables in base paths match any non-empty segment.
+    """
+
+    def __init__(
+        self,
+        specification: Specification,
+        base_paths: Iterable[str] | None = None,
+    ) -> None:
+        """Compile the routes of *specification*."""
+        if base_paths is None:
+            base_paths = [server_base_path(s.url) for s in specification.servers]
+
+        self._bases = _Node()
+
+        for base in list(base_paths) or [""]:
+            base = base.rstrip("/")
+            node, _ = self._bases.insert(_split(base) if base else [])
+            node.value = True
+
+        self._paths = _Node()
+
+        for template, path_item in specification.paths.items():
+            node, names = self._paths.insert(_split(template))
+
+            if node.value is None:  # equivalent templates: the first wins
+                node.value = _Route(
+                    template=template,
+                    path_item=path_item,
+                    param_names=tuple(names),
+                    operations=dict(iter_path_item_operations(path_item)),
+                )
+
+    def match(self, method: str, url: str) -> RouteMatch | None:
+        """Return the route for a request, or ``None`` if no path matches.
+
+        *url* may be a full URL or just its path; the query string and
+        fragment are ignored. Path parameter values are percent-decoded.
+        """
+        path = urlsplit(url).path or "/"
+        segments = _split(path)
+        captured: list[str] = []
+
+        def accept_path(node: _Node, index: int) -> _Route | None:
+            if index == len(segments) and isinstance(node.value, _Route):
+                return node.value
+
+            return None
+
+        def accept_base(node: _Node, index: int) -> _Route | None:
+            if node.value is None:
+                return None
+
+            del captured[:]
+
+            return _search(self._paths, segments, index, captured, accept_path)
+
+        route = _search(self._bases, segments, 0, [], accept_base)
+
+        if route is None:
+            return None
+
+        return RouteMatch(
+            template=route.template,
+            path_item=route.path_item,
+            operation=route.operations.get(method.lower()),
+            path_params={
+                name: unquote(value)
+                for name, value in zip(route.param_names, captured, strict=True)
+            },
+        )
@@ -0,0 +1,310 @@
+"""Prune a root document to the operations a caller asks for."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import unquote
+
+from openapi_parser.models.index import HTTP_METHODS
+
+# Components referenced by name rather than by ``$ref``, always kept whole.
+_NAMED_SECTIONS = frozenset({"securitySchemes"})
+
+
+def _pointer_parts(ref: str) -> list[str]:
+    """Split a local ``$ref`` such as ``#/components/schemas/Pet`` into tokens."""
+    return [
+        unquote(part).replace("~1", "/").replace("~0", "~")
+        for part in ref[2:].split("/")
+    ]
+
+
+def _operations(path_item: dict[str, Any]) -> list[Any]:
+    """Return the raw operations of *path_item*, including ``additionalOperations``."""
+    operations = [path_item.get(method) for method in HTTP_METHODS]
+    additional = path_item.get("additionalOperations")
+
+    if isinstance(additional, dict):
+        operations.extend(additional.values())
+
+    return operations
+
+
+@dataclass(frozen=True)
+class Selection:
+    """The operations to keep from a root document.
+
+    An operation is kept if its path template is one of ``paths``, one
+    of its tags is in ``tags`` or its ``operationId`` is one of
+    ``operation_ids``. ``paths`` keeps every operation of a path item and
+    never matches webhooks.
+    """
+
+    paths: frozenset[str] = frozenset()
+    tags: frozenset[str] = frozenset()
+    operation_ids: frozenset[str] = frozenset()
+
+    @classmethod
+    def of(
+        cls,
+        paths: Iterable[str] | None = None,
+        tags: Iterable[str] | None = None,
+        operation_ids: Iterable[str] | None = None,
+    ) -> Selection | None:
+        """Return the selection of the given filters, or ``None`` without any."""
+        if paths is None and tags is None and operation_ids is None:
+            return None
+
+        return cls(
+            frozenset(paths or ()),
+            frozenset(tags or ()),
+            frozenset(operation_ids or ()),
+        )
+
+    @property
+    def cache_key(self) -> str:
+        """A stable text form, to keep cached selections apart."""
+        return json.dumps(
+            [sorted(self.paths), sorted(self.tags), sorted(self.operation_ids)]
+        )
+
+    def matches(self, operation: Any) -> bool:
+        """Check whether a raw *operation* is selected by its id or tags."""
+        if not isinstance(operation, dict):
+            return False
+
+        operation_id = operation.get("operationId")
+
+        if isinstance(operation_id, str) and operation_id in self.operation_ids:
+            return True
+
+        tags = operation.get("tags")
+
+        return isinstance(tags, list) and any(
+            isinstance(tag, str) and tag in self.tags for tag in tags
+        )
+
+    def apply(self, raw: dict[str, Any]) -> dict[str, Any]:
+        """Return a copy of *raw* holding only the selected operations.
+
+        Path items and webhooks without a selected operation are dropped.
+        Of the components, only those reachable through ``$ref`` chains
+        from what is kept remain, plus every ``securitySchemes`` entry.
+        *raw* itself is not changed; kept nodes are shared with it.
+        """
+        pruned = dict(raw)
+
+        for name, by_path in (("paths", True), ("webhooks", False)):
+            entries = raw.get(name)
+
+            if isinstance(entries, dict):
+                pruned[name] = self._prune_entries(raw, entries, by_path)
+
+        components = raw.get("components")
+
+        if isinstance(components, dict):
+            pruned["components"] = _Reachable(raw, pruned).components(components)
+
+        return pruned
+
+    def _prune_entries(
+        self,
+        raw: dict[str, Any],
+        entries: dict[str, Any],
+        by_path: bool,
+    ) -> dict[str, Any]:
+        kept = {}
+
+        for key, path_item in entries.items():
+            if by_path and key in self.paths:
+                kept[key] = path_item
+            elif isinstance(path_item, dict):
+                item = self._prune_path_item(raw, path_item)
+
+                if item is not None:
+                    kept[key] = item
+
+        return kept
+
+    def _prune_path_item(
+        self,
+        raw: dict[str, Any],
+        path_item: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """Drop the unselected operations of *path_item*, or all of it."""
+        ref = path_item.get("$ref")
+
+        if isinstance(ref, str):
+            # a referenced path item is kept whole if any operation matches;
+            # external targets can't be checked without reading them
+            target = _Reachable.lookup(raw, ref)
+
+            if not isinstance(target, dict):
+                return path_item
+
+            return path_item if any(map(self.matches, _operations(target))) else None
+
+        item = {
+            key: value
+            for key, value in path_item.items()
+            if key not in HTTP_METHODS and key != "additionalOperations"
+        }
+        selected = False
+
+        for method in HTTP_METHODS:
+            if self.matches(path_item.get(method)):
+                item[method] = path_item[method]
+                selected = True
+
+        additional = path_item.get("additionalOperations")
+
+        if isinstance(additional, dict):
+            operations = {k: v for k, v in additional.items() if self.matches(v)}
+
+            if operations:
+                item["additionalOperations"] = operations
+                selected = True
+
+        return item if selected else None
+
+
+class _Reachable:
+    """Collects the components a pruned document reaches through ``$ref``s."""
+
+    def __init__(self, raw: dict[str, Any], pruned: dict[str, Any]) -> None:
+        self.raw = raw
+        self.pruned = pruned
+        # section -> kept entry names, or ``None`` to keep the whole section
+        self.kept: dict[str, set[str] | None] = {}
+        self.keep_all = False
+
+    @staticmethod
+    def lookup(document: Any, ref: str) -> Any:
+        """Return the node a local ``$ref`` points to in *document*, if any."""
+        if not ref.startswith("#/"):
+            return None
+
+        node = document
+
+        for part in _pointer_parts(ref):
+            if isinstance(node, dict):
+                node = node.get(part)
+            elif isinstance(node, list) and part.isdigit() and int(part) < len(node):
+                node = node[int(part)]
+            else:
+                return None
+
+        return node
+
+    def components(self, components: dict[str, Any]) -> dict[str, Any]:
+        """Return *components* reduced to the reachable entries."""
+        roots = [value for key, value in self.pruned.items() if key != "components"]
+        self._walk(roots)
+
+        if self.keep_all:
+            return components
+
+        reduced = dict(components)
+
+        for section, entries in components.items():
+            if (
+                section in _NAMED_SECTIONS
+                or section.startswith("x-")
+                or not isinstance(entries, dict)
+            ):
+                continue
+
+            names = self.kept.get(section, set())
+
+            if names is not None:
+                reduced[section] = {k: v for k, v in entries.items() if k in names}
+
+        return reduced
+
+    def _walk(self, roots: list[Any]) -> None:
+        stack = roots
+        seen: set[int] = set()
+
+        while stack and not self.keep_all:
+            node = stack.pop()
+
+            if id(node) in seen:
+                continue
+
+            seen.add(id(node))
+
+            if isinstance(node, dict):
+                ref = node.get("$ref")
+
+                if isinstance(ref, str):
+                    stack.extend(self._follow(ref))
+
+                mapping = node.get("mapping")
+
+                if "propertyName" in node and isinstance(mapping, dict):
+                    # discriminator mappings name schemas without a $ref
+                    for target in mapping.values():
+                        if isinstance(target, str):
+                            if "/" not in target:
+                                target = f"#/components/schemas/{target}"
+
+                            stack.extend(self._follow(target))
+
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+
+    def _follow(self, ref: str) -> list[Any]:
+        """Keep what a local *ref* points into; return new nodes to walk."""
+        if not ref.startswith("#/"):
+            # external documents load the root file by its own location
+            return []
+
+        parts = _pointer_parts(ref)
+
+        if parts[0] == "components":
+            return self._keep_component(parts[1:])
+
+        if parts[0] in ("paths", "webhooks") and len(parts) > 1:
+            # put back a pruned path item that something refers into
+            entries = self.raw.get(parts[0])
+            kept = self.pruned.get(parts[0])
+
+            if (
+                isinstance(entries, dict)
+                and isinstance(kept, dict)
+                and parts[1] in entries
+                and kept.get(parts[1]) is not entries[parts[1]]
+            ):
+                kept[parts[1]] = entries[parts[1]]
+                return [entries[parts[1]]]
+
+        return []
+
+    def _keep_component(self, parts: list[str]) -> list[Any]:
+        """Keep a component entry, or a whole section; return what to walk."""
+        components = self.raw.get("components")
+
+        if not parts or not isinstance(components, dict):
+            self.keep_all = True
+            return []
+
+        section = parts[0]
+        entries = components.get(section)
+        names = self.kept.setdefault(section, set())
+
+        if not isinstance(entries, dict) or names is None:
+            return []
+
+        if len(parts) == 1:
+            self.kept[section] = None
+            return list(entries.values())
+
+        if parts[1] in names or parts[1] not in entries:
+            return []
+
+        names.add(parts[1])
+        return [entries[parts[1]]]
@@ -0,0 +1,164 @@
+"""Iterate over the operations of a spec one path item at a time."""
+
+import os
+from collections.abc import Iterator
+from typing import Any, TypeAlias
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from pydantic import ValidationError
+from yaml import YAMLError
+
+from openapi_parser.errors import ParserError
+from openapi_parser.fetcher import Fetcher
+from openapi_parser.loader import load_stream
+from openapi_parser.models.index import iter_path_item_operations
+from openapi_parser.models.mixins import ref_cache_scope
+from openapi_parser.models.v3_0 import Operation
+from openapi_parser.parser import (
+    _VERSION_SPEC_MAP,
+    _decode_raw,
+    _prepare_raw,
+    _read_source,
+)
+from openapi_parser.resolver import (
+    _ROOT_URI,
+    _build_registry,
+    _iter_refs,
+    _RefWalker,
+)
+from openapi_parser.selection import _pointer_parts
+
+OperationEntry: TypeAlias = tuple[str, str, Operation]
+
+
+def _load_root(
+    uri: str | None,
+    spec_string: str | None,
+    fetcher: Fetcher | None,
+) -> dict[str, Any]:
+    """Load the root document, streaming it from disk if it is a local file."""
+    if not uri or urlparse(uri).scheme in ("http", "https"):
+        text, content_type = _read_source(uri, spec_string, fetcher)
+
+        return _decode_raw(text, uri or None, content_type)
+
+    parsed = urlparse(uri)
+    path = url2pathname(parsed.path) if parsed.scheme == "file" else uri
+
+    try:
+        with open(path, "rb") as f:
+            raw = load_stream(f, uri)
+    except (OSError, YAMLError) as e:
+        raise ParserError(f"Failed to load spec: {e}") from e
+
+    if not isinstance(raw, dict):
+        raise ParserError("OpenAPI spec must be a dictionary")
+
+    return raw
+
+
+def _referenced_paths(raw: dict[str, Any]) -> set[str]:
+    """Return the path templates that some local ``$ref`` points into."""
+    return {
+        _pointer_parts(ref)[1] for ref in _iter_refs(raw) if ref.startswith("#/paths/")
+    }
+
+
+def iter_operations(
+    uri: str | os.PathLike[str] | None = None,
+    spec_string: str | None = None,
+    base_uri: str | os.PathLike[str] | None = None,
+    fetcher: Fetcher | None = None,
+) -> Iterator[OperationEntry]:
+    """Yield ``(path, method, operation)`` for every operation in ``paths``.
+
+    Unlike :func:`~openapi_parser.parse`, no :class:`Specification` is
+    built. Each path item is resolved and validated when the iteration
+    reaches it, and its raw content is released once its operations
+    were yielded, unless a ``$ref`` points into it. Component models
+    are validated the first time a path item uses them and then shared
+    by every later one, so memory holds the components and one path
+    item rather than the whole spec. Local files are loaded with
+    :func:`~openapi_parser.loader.load_stream`. Webhooks are skipped.
+
+    Parameters
+    ----------
+    uri : str, optional
+        Location of the spec file. Accepts a local paths and URIs.
+    spec_string : str, optional
+        Raw spec YAML/JSON string (alternative to *uri*).
+    base_uri : str, optional
+        Location used to resolve external ``$ref`` targets when parsing
+        a *spec_string*. Ignored when *uri* is provided.
+    fetcher : Fetcher, optional
+        Retrieves ``http(s)://`` documents, as in :func:`parse`.
+
+    Returns:
+    -------
+    Iterator[tuple[str, str, Operation]]
+        Path template, lower-cased method and operation model, in
+        document order.
+
+    Raises:
+    ------
+    ParserError
+        On load failures by the call itself, and on resolution or
+        validation failures of a path item once the iteration reaches it.
+    """
+    if uri is not None:
+        uri = os.fspath(uri)
+
+    if base_uri is not None:
+        base_uri = os.fspath(base_uri)
+
+    location = base_uri if uri is None else uri
+    raw, version = _prepare_raw(_load_root(uri, spec_string, fetcher))
+
+    return _iter_path_items(raw, version, location, fetcher)
+
+
+def _iter_path_items(
+    raw: dict[str, Any],
+    version: str,
+    location: str | None,
+    fetcher: Fetcher | None,
+) -> Iterator[OperationEntry]:
+    """Resolve, validate and yield the operations of each path item in turn."""
+    paths = raw.get("paths")
+
+    if not isinstance(paths, dict):
+        return
+
+    path_item_model = _VERSION_SPEC_MAP[version].PathItem
+
+    try:
+        registry = _build_registry(raw, location, version, fetcher=fetcher)
+    except Exception as e:
+        raise ParserError(f"Failed to resolve references: {e}") from e
+
+    resolver = registry.resolver(base_uri=_ROOT_URI)
+    referenced = _referenced_paths(raw)
+    # resolved component targets and their models, shared by all path items
+    resolved_cache: dict[str, Any] = {}
+    ref_caches: dict[type, dict[str, Any]] = {}
+
+    for path in list(paths):
+        node = paths[path] if path in referenced else paths.pop(path)
+
+        try:
+            # a fresh walker per path item: ids of released dicts get reused
+            node = _RefWalker(resolved_cache).walk(node, resolver)
+        except Exception as e:
+            raise ParserError(f"Failed to resolve references: {e}") from e
+
+        try:
+            with ref_cache_scope(ref_caches):
+                path_item = path_item_model.model_validate(node)
+        except ValidationError as e:
+            raise ParserError(f"Validation failed for OpenAPI {version}: {e}") from e
+
+        del node
+
+        for method, operation in iter_path_item_operations(path_item):
+            yield path, method, operation
@@ -0,0 +1,231 @@
+"""Reload a specification when its files change on disk."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from types import TracebackType
+from typing import TYPE_CHECKING, TypeAlias
+from urllib.parse import urlparse
+
+from openapi_parser import resolver
+from openapi_parser.errors import ParserError
+from openapi_parser.incremental import IncrementalParser
+from openapi_parser.parser import Specification, _read_source
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# Modification time and size of a file, or ``None`` if it is missing.
+_Stamp: TypeAlias = tuple[int, int] | None
+
+# Stamp of a document edited after the parser read it; matches no file.
+_EDITED: _Stamp = (-1, -1)
+
+
+def _stamp(path: str) -> _Stamp:
+    """Return the modification time and size of *path*."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SpecWatcher:
+    """Keeps a parsed specification in sync with its files.
+
+    The root document and every local external ``$ref`` document read
+    while parsing it are polled for changes of modification time and
+    size. Once changed files have stayed untouched for *debounce*
+    seconds, so that a burst of saves leads to a single parse, the spec
+    is re-parsed with an :class:`~openapi_parser.IncrementalParser` and
+    swapped in: :attr:`specification` always holds one complete version.
+    A failed re-parse keeps the previous specification and is stored in
+    :attr:`error`. Remote documents are not watched.
+
+    Polling runs on a daemon thread between :meth:`start` and
+    :meth:`stop`, or the watcher is used as a context manager::
+
+        with SpecWatcher("specs/openapi.yml") as watcher:
+            serve(lambda: watcher.specification)
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        interval: float = 0.5,
+        debounce: float = 0.2,
+        on_reload: Callable[[Specification], None] | None = None,
+        on_error: Callable[[ParserError], None] | None = None,
+    ) -> None:
+        """Parse the spec at *path* and poll its files every *interval* seconds.
+
+        *on_reload* is called with every specification swapped in and
+        *on_error* with every failed re-parse, both on the polling
+        thread.
+
+        Raises:
+            ParserError: If the initial parse fails.
+        """
+        self.path = os.path.abspath(os.fspath(path))
+        self.interval = interval
+        self.debounce = debounce
+        self.on_reload = on_reload
+        self.on_error = on_error
+        self.error: ParserError | None = None
+
+        self._parser = IncrementalParser(base_uri=self.path, on_read=self._record)
+        # stamps of the documents read by the current parse
+        self._read: dict[str, _Stamp] = {}
+        self._read_lock = threading.Lock()
+        self._check_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        root = _stamp(self.path)
+        self.specification: Specification = self._parse(reload_documents=False)
+        self._loaded = {self.path: root, **self._take_read()}
+        self._seen = self._loaded
+        self._changed_at = 0.0
+        # external documents changed since the last successful parse
+        self._documents_changed = False
+
+    def __enter__(self) -> Self:
+        """Start polling."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Stop polling."""
+        self.stop()
+
+    @property
+    def files(self) -> frozenset[str]:
+        """Paths of the watched files."""
+        return frozenset(self._loaded)
+
+    def start(self) -> None:
+        """Poll for changes on a daemon thread."""
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="openapi-spec-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and wait for a re-parse in progress to finish."""
+        thread, self._thread = self._thread, None
+
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def check(self) -> bool:
+        """Poll the watched files once and re-parse them if they settled.
+
+        Returns whether a new specification was swapped in.
+        """
+        with self._check_lock:
+            seen = {path: _stamp(path) for path in self._loaded}
+            now = time.monotonic()
+
+            if seen != self._seen:
+                self._seen = seen
+                self._changed_at = now
+
+            if seen == self._loaded or now - self._changed_at < self.debounce:
+                return False
+
+            return self._reload(seen)
+
+    def _run(self) -> None:
+        """Call :meth:`check` every *interval* seconds until stopped."""
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def _reload(self, seen: dict[str, _Stamp]) -> bool:
+        """Re-parse after the files stamped in *seen* changed."""
+        reload_documents = self._documents_changed or any(
+            stamp != self._loaded[path]
+            for path, stamp in seen.items()
+            if path != self.path
+        )
+        self._take_read()
+
+        try:
+            spec = self._parse(reload_documents)
+        except ParserError as e:
+            # retried once the files change again
+            self._loaded = {**seen, **self._take_read()}
+            self._documents_changed = reload_documents
+            self.error = e
+
+            if self.on_error is not None:
+                self.on_error(e)
+
+            return False
+
+        read = self._take_read()
+        self._loaded = (
+            {self.path: seen[self.path], **read}
+            if reload_documents
+            else {**seen, **read}
+        )
+        self._seen = self._loaded
+        self._documents_changed = False
+        self.specification = spec
+        self.error = None
+
+        if self.on_reload is not None:
+            self.on_reload(spec)
+
+        return True
+
+    def _parse(self, reload_documents: bool) -> Specification:
+        """Read the root document and update the parser with it."""
+        text, _ = _read_source(self.path, None)
+
+        return self._parser.update(text, reload_documents)
+
+    def _record(self, uri: str, text: str) -> None:
+        """Stamp a document read by the parser, unless it is remote.
+
+        The parser reports a document only once it was read, so the file
+        is stamped first and then read again: if it no longer holds
+        *text*, it was edited after the parser read it and is stamped as
+        :data:`_EDITED`, which the next :meth:`check` sees as a change.
+        """
+        if urlparse(uri).scheme in ("http", "https"):
+            return
+
+        stamp = _stamp(uri)
+
+        try:
+            current, _ = resolver._read_uri(uri)
+        except OSError:
+            current = None
+
+        if current != text:
+            stamp = _EDITED
+
+        with self._read_lock:
+            self._read[os.path.abspath(uri)] = stamp
+
+    def _take_read(self) -> dict[str, _Stamp]:
+        """Return and forget the documents read since the last call."""
+        with self._read_lock:
+            read, self._read = self._read, {}
+
+        return read
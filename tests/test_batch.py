@@ -0,0 +1,111 @@
+"""Tests for parsing many specs on a process pool."""
+
+import os
+from pathlib import Path
+from typing import NoReturn
+
+import pytest
+
+from openapi_parser import parse, parse_many, resolver
+from openapi_parser.batch import _default_fetcher
+from openapi_parser.errors import ParserError
+from openapi_parser.fetcher import Fetcher, HTTPFetcher
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+FIXTURES = [os.path.join(DATA_DIR, name) for name in sorted(os.listdir(DATA_DIR))]
+
+CRASHING_URI = "https://crash.invalid/openapi.yaml"
+
+
+class _CrashingFetcher:
+    """Kills the worker process on any remote fetch."""
+
+    def fetch(self, url: str) -> NoReturn:
+        os._exit(1)
+
+
+def _crashing_fetcher() -> Fetcher:
+    return _CrashingFetcher()
+
+
+def test_results_match_parse() -> None:
+    results = dict(parse_many(FIXTURES, workers=2))
+
+    assert set(results) == set(FIXTURES)
+
+    for path, spec in results.items():
+        assert spec == parse(path)
+
+
+def test_failures_are_isolated(tmp_path: Path) -> None:
+    invalid = tmp_path / "invalid.yaml"
+    invalid.write_text('openapi: "3.0.0"\npaths: {}\n')
+    missing = tmp_path / "missing.yaml"
+
+    results = dict(parse_many([FIXTURES[0], invalid, missing], workers=2))
+
+    assert results[FIXTURES[0]] == parse(FIXTURES[0])
+
+    invalid_error = results[str(invalid)]
+    assert isinstance(invalid_error, ParserError)
+    assert ("info",) in [e["loc"] for e in invalid_error.errors()]
+
+    missing_error = results[str(missing)]
+    assert isinstance(missing_error, ParserError)
+    assert "Failed to load spec" in str(missing_error)
+
+
+def test_stopping_early() -> None:
+    results = parse_many(FIXTURES * 5, workers=1)
+    path, _ = next(results)
+    results.close()
+
+    assert path in FIXTURES
+
+
+def test_no_uris() -> None:
+    assert list(parse_many([])) == []
+
+
+def test_worker_crash_spares_queued_specs() -> None:
+    uris = [CRASHING_URI, *FIXTURES * 5]
+    results = list(parse_many(uris, workers=2, fetcher_factory=_crashing_fetcher))
+    failed = [uri for uri, result in results if isinstance(result, ParserError)]
+
+    assert sorted(uri for uri, _ in results) == sorted(uris)
+    assert CRASHING_URI in failed
+    # only the crashing spec and what the other worker was parsing fail
+    assert len(failed) <= 2
+
+    for uri, result in results:
+        if uri not in failed:
+            assert result == parse(uri)
+
+
+def test_default_fetcher_honours_proxy_variables(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    for name in ("https_proxy", "HTTPS_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+
+    monkeypatch.setenv("https_proxy", "http://proxy.invalid:3128")
+    monkeypatch.setenv("no_proxy", "direct.example")
+    proxied: list[str] = []
+    direct: list[str] = []
+
+    def read_uri(uri: str, fetcher: Fetcher | None = None) -> tuple[str, None]:
+        proxied.append(uri)
+        return "proxied", None
+
+    def fetch(self: HTTPFetcher, url: str) -> tuple[str, None]:
+        direct.append(url)
+        return "direct", None
+
+    monkeypatch.setattr(resolver, "_read_uri", read_uri)
+    monkeypatch.setattr(HTTPFetcher, "fetch", fetch)
+    fetcher = _default_fetcher()
+
+    assert fetcher.fetch("https://example.com/a.yaml") == ("proxied", None)
+    assert fetcher.fetch("https://direct.example/a.yaml") == ("direct", None)
+    assert proxied == ["https://example.com/a.yaml"]
+    assert direct == ["https://direct.example/a.yaml"]
@@ -0,0 +1,150 @@
+"""Tests for the persistent parse cache."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from openapi_parser.cache import SpecCache
+from openapi_parser.enumeration import DataType
+from openapi_parser.parser import Specification, parse
+
+ROOT_SPEC = """
+openapi: "3.0.0"
+info:
+  title: "Cached API"
+  version: "1.0.0"
+paths:
+  /users:
+    get:
+      responses:
+        "200":
+          description: "Success"
+          content:
+            application/json:
+              schema:
+                $ref: "user.yaml"
+"""
+
+
+def _write(path: Path, content: str) -> None:
+    path.write_text(content)
+
+
+def _schema_type(spec: Specification) -> object:
+    get_op = spec.paths["/users"].get
+    assert get_op is not None
+    content = get_op.responses["200"].content
+    assert content is not None
+    schema = content["application/json"].schema_object
+    assert schema is not None
+    return schema.type
+
+
+@pytest.fixture
+def spec_dir(tmp_path: Path) -> Path:
+    _write(tmp_path / "main.yaml", ROOT_SPEC)
+    _write(tmp_path / "user.yaml", "type: string\n")
+    return tmp_path
+
+
+def test_cache_hit_skips_loading_and_resolution(spec_dir: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    first = parse(spec_dir / "main.yaml", cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+
+    with (
+        patch("openapi_parser.parser.load_document", side_effect=AssertionError),
+        patch("openapi_parser.parser.resolve", side_effect=AssertionError),
+    ):
+        second = parse(spec_dir / "main.yaml", cache_dir=cache_dir)
+
+    assert second == first
+    assert second is not first
+
+
+def test_cache_invalidated_by_external_ref_change(
+    spec_dir: Path, tmp_path: Path
+) -> None:
+    cache_dir = tmp_path / "cache"
+    assert _schema_type(parse(spec_dir / "main.yaml", cache_dir=cache_dir)) == (
+        DataType.STRING
+    )
+
+    _write(spec_dir / "user.yaml", "type: integer\n")
+
+    assert _schema_type(parse(spec_dir / "main.yaml", cache_dir=cache_dir)) == (
+        DataType.INTEGER
+    )
+
+
+def test_cache_invalidated_by_root_change(spec_dir: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    parse(spec_dir / "main.yaml", cache_dir=cache_dir)
+
+    _write(spec_dir / "main.yaml", ROOT_SPEC.replace("Cached API", "Changed API"))
+
+    assert parse(spec_dir / "main.yaml", cache_dir=cache_dir).info.title == (
+        "Changed API"
+    )
+
+
+def test_corrupt_cache_entry_is_a_miss(spec_dir: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    parse(spec_dir / "main.yaml", cache_dir=cache_dir)
+
+    for name in os.listdir(cache_dir):
+        _write(cache_dir / name, "not a pickle")
+
+    spec = parse(spec_dir / "main.yaml", cache_dir=cache_dir)
+    assert _schema_type(spec) == DataType.STRING
+
+
+def test_cache_spec_string_with_base_uri(spec_dir: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    base = str(spec_dir / "main.yaml")
+
+    first = parse(spec_string=ROOT_SPEC, base_uri=base, cache_dir=cache_dir)
+    second = parse(spec_string=ROOT_SPEC, base_uri=base, cache_dir=cache_dir)
+
+    assert second == first
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def _nested(depth: int) -> list[Any]:
+    root: list[Any] = []
+    node = root
+
+    for _ in range(depth):
+        child: list[Any] = []
+        node.append(child)
+        node = child
+
+    return root
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [threading.Lock(), _nested(100_000), lambda: None],
+    ids=["type-error", "recursion", "local-object"],
+)
+def test_unpicklable_spec_is_not_stored(spec: object, tmp_path: Path) -> None:
+    cache = SpecCache(tmp_path)
+    cache.store("key", {}, spec)
+
+    assert os.listdir(tmp_path) == []
+    assert cache.load("key") is None
+
+
+def test_failed_store_removes_temp_file(tmp_path: Path) -> None:
+    class Interrupting:
+        def __reduce__(self) -> Any:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        SpecCache(tmp_path).store("key", {}, Interrupting())
+
+    assert os.listdir(tmp_path) == []
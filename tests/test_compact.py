@@ -0,0 +1,63 @@
+"""Tests for parsing specifications in compact mode."""
+
+import os
+
+from openapi_parser.parser import parse
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+SPEC = """
+openapi: "3.0.0"
+info: {title: "Pets", version: "1.0.0"}
+paths:
+  /pets:
+    get:
+      responses:
+        "200":
+          description: "OK"
+          content:
+            application/json:
+              schema: {$ref: "#/components/schemas/Pet"}
+  /owners:
+    get:
+      responses:
+        "200":
+          description: "OK"
+          content:
+            application/json:
+              schema: {$ref: "#/components/schemas/Pet"}
+components:
+  schemas:
+    Pet:
+      type: object
+      properties:
+        name: {type: string}
+"""
+
+
+def test_compact_interns_strings() -> None:
+    spec = parse(spec_string=SPEC, compact=True)
+    pets = spec.paths["/pets"].get
+    owners = spec.paths["/owners"].get
+
+    assert pets is not None
+    assert owners is not None
+
+    pets_content = pets.responses["200"].content
+    owners_content = owners.responses["200"].content
+
+    assert pets_content is not None
+    assert owners_content is not None
+
+    pets_type = next(iter(pets_content))
+    owners_type = next(iter(owners_content))
+
+    assert pets_type == owners_type
+    assert pets_type is owners_type
+    assert pets.responses["200"].description is owners.responses["200"].description
+
+
+def test_compact_matches_default_parse() -> None:
+    path = os.path.join(DATA_DIR, "openapi_3.1.yaml")
+
+    assert parse(path, compact=True).model_dump() == parse(path).model_dump()
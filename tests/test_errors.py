@@ -1,5 +1,7 @@
 """Tests for parser error handling."""
 
+import pickle
+
 import pytest
 from pydantic import ValidationError
 
@@ -63,3 +65,14 @@ paths:
 """
     with pytest.raises(ParserError, match="Failed to resolve references"):
         parse(spec_string=spec_yaml)
+
+
+def test_pickled_error_keeps_validation_errors() -> None:
+    with pytest.raises(ParserError) as exc_info:
+        parse(spec_string='openapi: "3.0.0"\npaths: {}\n')
+
+    restored = pickle.loads(pickle.dumps(exc_info.value))
+
+    assert type(restored) is ParserError
+    assert str(restored) == str(exc_info.value)
+    assert restored.errors() == exc_info.value.errors()
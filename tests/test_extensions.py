@@ -0,0 +1,88 @@
+"""Tests for the extraction of ``x-*`` keys into model extensions."""
+
+import copy
+import pickle
+
+import pytest
+
+from openapi_parser.models import v3_0
+from openapi_parser.models.mixins import EMPTY_EXTENSIONS
+from openapi_parser.parser import parse
+
+SPEC = """
+openapi: "3.0.0"
+info: {title: "Pets", version: "1.0.0"}
+paths:
+  /pets:
+    x-owner: team-pets
+    get:
+      responses:
+        "200": {description: "OK"}
+  /owners:
+    get:
+      responses:
+        "200": {description: "OK"}
+components:
+  schemas:
+    Pet:
+      type: object
+      properties:
+        name: {type: string}
+"""
+
+
+def test_models_without_extensions_share_empty_mapping() -> None:
+    spec = parse(spec_string=SPEC)
+
+    assert spec.paths["/pets"].extensions == {"x-owner": "team-pets"}
+    assert spec.paths["/owners"].extensions is EMPTY_EXTENSIONS
+    assert spec.info.extensions is EMPTY_EXTENSIONS
+    assert EMPTY_EXTENSIONS == {}
+
+
+def test_shared_empty_mapping_is_read_only() -> None:
+    spec = parse(spec_string=SPEC)
+
+    with pytest.raises(TypeError):
+        spec.paths["/owners"].extensions["x-owner"] = "team-owners"
+
+    with pytest.raises(TypeError):
+        spec.info.extensions.update({"x-owner": "team-owners"})
+
+    assert EMPTY_EXTENSIONS == {}
+
+
+def test_input_without_extensions_is_not_copied() -> None:
+    data = {"type": "string", "maxLength": 3}
+    schema = v3_0.Schema.model_validate(data)
+
+    assert schema.extensions is EMPTY_EXTENSIONS
+    assert data == {"type": "string", "maxLength": 3}
+
+
+def test_explicit_extensions_are_merged() -> None:
+    schema = v3_0.Schema.model_validate(
+        {"type": "string", "extensions": {"x-a": 1}, "x-b": 2}
+    )
+
+    assert schema.extensions == {"x-a": 1, "x-b": 2}
+    assert v3_0.Schema(type="string").extensions is EMPTY_EXTENSIONS
+
+
+def test_shared_empty_mapping_survives_copy_and_pickle() -> None:
+    spec = parse(spec_string=SPEC)
+    restored = pickle.loads(pickle.dumps(spec))
+
+    assert restored.paths["/owners"].extensions is EMPTY_EXTENSIONS
+    assert restored.paths["/pets"].extensions == {"x-owner": "team-pets"}
+    assert copy.deepcopy(spec).info.extensions is EMPTY_EXTENSIONS
+    assert spec.model_dump()["info"]["extensions"] == {}
+
+
+def test_lazy_entries_share_empty_mapping() -> None:
+    spec = parse(spec_string=SPEC, lazy=True)
+
+    assert spec.paths["/owners"].extensions is EMPTY_EXTENSIONS
+    assert spec.components is not None
+    assert spec.components.schemas is not None
+    assert spec.components.schemas["Pet"].extensions is EMPTY_EXTENSIONS
@@ -0,0 +1,159 @@
+"""Tests for the pooled HTTP fetcher."""
+
+import gzip
+import threading
+import zlib
+from collections import Counter
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.error import HTTPError
+
+import pytest
+
+from openapi_parser.errors import ParserError
+from openapi_parser.fetcher import HTTPFetcher
+from openapi_parser.parser import parse
+
+ROOT_SPEC = b"""
+openapi: "3.0.0"
+info: {title: "Remote", version: "1.0.0"}
+paths: {}
+components:
+  schemas:
+    A: {$ref: "schemas/a.yaml"}
+    B: {$ref: "schemas/b.yaml"}
+"""
+
+DOCUMENTS = {
+    "/main.yaml": ROOT_SPEC,
+    "/schemas/a.yaml": b"type: string\n",
+    "/schemas/b.yaml": b"type: integer\n",
+}
+
+
+class _Recorder:
+    """Requests and client connections seen by the test server."""
+
+    def __init__(self) -> None:
+        self.requests: Counter[str] = Counter()
+        self.connections: set[tuple[str, int]] = set()
+        self.lock = threading.Lock()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    recorder: _Recorder
+
+    def do_GET(self) -> None:
+        with self.recorder.lock:
+            self.recorder.requests[self.path] += 1
+            self.recorder.connections.add(self.client_address)
+            count = self.recorder.requests[self.path]
+
+        if self.path == "/moved.yaml":
+            self._send(301, b"", {"Location": "/main.yaml"})
+        elif self.path == "/flaky.yaml" and count == 1:
+            self._send(503, b"try again")
+        elif self.path == "/flaky.yaml":
+            self._send(200, ROOT_SPEC)
+        elif self.path == "/deflate.yaml":
+            self._send(200, zlib.compress(ROOT_SPEC), {"Content-Encoding": "deflate"})
+        elif self.path in DOCUMENTS:
+            body = DOCUMENTS[self.path]
+            headers = {"Content-Type": "application/yaml"}
+
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+                headers["Content-Encoding"] = "gzip"
+
+            self._send(200, body, headers)
+        else:
+            self._send(404, b"not found")
+
+    def _send(
+        self, status: int, body: bytes, headers: dict[str, str] | None = None
+    ) -> None:
+        self.send_response(status)
+
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[tuple[str, _Recorder]]:
+    recorder = _Recorder()
+    handler = type("Handler", (_Handler,), {"recorder": recorder})
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", recorder
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_connections_are_reused(server: tuple[str, _Recorder]) -> None:
+    base, recorder = server
+
+    with HTTPFetcher() as fetcher:
+        for _ in range(5):
+            text, content_type = fetcher.fetch(f"{base}/schemas/a.yaml")
+
+    assert text == "type: string\n"
+    assert content_type == "application/yaml"
+    assert recorder.requests["/schemas/a.yaml"] == 5
+    assert len(recorder.connections) == 1
+
+
+def test_parse_with_fetcher(server: tuple[str, _Recorder]) -> None:
+    base, recorder = server
+
+    with HTTPFetcher() as fetcher:
+        spec = parse(f"{base}/main.yaml", fetcher=fetcher)
+
+    assert spec.components is not None
+    assert spec.components.schemas is not None
+    assert set(spec.components.schemas) == {"A", "B"}
+    assert sum(recorder.requests.values()) == 3
+
+
+def test_deflate_and_redirect(server: tuple[str, _Recorder]) -> None:
+    base, _ = server
+
+    with HTTPFetcher() as fetcher:
+        assert fetcher.fetch(f"{base}/deflate.yaml")[0] == ROOT_SPEC.decode()
+        assert fetcher.fetch(f"{base}/moved.yaml")[0] == ROOT_SPEC.decode()
+
+
+def test_retries_on_retryable_status(server: tuple[str, _Recorder]) -> None:
+    base, recorder = server
+
+    with HTTPFetcher(backoff=0) as fetcher:
+        assert fetcher.fetch(f"{base}/flaky.yaml")[0] == ROOT_SPEC.decode()
+
+    assert recorder.requests["/flaky.yaml"] == 2
+
+
+def test_client_errors_are_not_retried(server: tuple[str, _Recorder]) -> None:
+    base, recorder = server
+
+    with HTTPFetcher(backoff=0) as fetcher:
+        with pytest.raises(HTTPError) as e:
+            fetcher.fetch(f"{base}/missing.yaml")
+
+        assert e.value.code == 404
+
+        with pytest.raises(ParserError, match="Failed to load spec"):
+            parse(f"{base}/missing.yaml", fetcher=fetcher)
+
+    assert recorder.requests["/missing.yaml"] == 2
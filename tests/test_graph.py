@@ -0,0 +1,145 @@
+"""Tests for the ``$ref`` dependency graph of parsed specifications."""
+
+import pickle
+from pathlib import Path
+
+from openapi_parser.parser import parse
+
+SPEC = """
+openapi: "3.0.0"
+info: {title: "Pets", version: "1.0.0"}
+paths:
+  /pets:
+    parameters:
+      - $ref: "#/components/parameters/Limit"
+    get:
+      operationId: listPets
+      responses:
+        "200":
+          description: "OK"
+          content:
+            application/json:
+              schema: {$ref: "#/components/schemas/Pets"}
+  /owners:
+    get:
+      operationId: listOwners
+      responses:
+        "200":
+          description: "OK"
+          content:
+            application/json:
+              schema:
+                type: array
+                items: {$ref: "#/components/schemas/Owner"}
+components:
+  parameters:
+    Limit:
+      name: limit
+      in: query
+      schema: {type: integer}
+  schemas:
+    Pets:
+      type: array
+      items: {$ref: "#/components/schemas/Pet"}
+    Pet:
+      type: object
+      properties:
+        owner: {$ref: "#/components/schemas/Owner"}
+    Owner:
+      type: object
+      properties:
+        pets: {$ref: "#/components/schemas/Pets"}
+        name: {$ref: "#/components/schemas/Pet/properties/owner"}
+    Tag:
+      type: object
+      properties:
+        parent: {$ref: "#/components/schemas/Tag"}
+"""
+
+PETS = "#/components/schemas/Pets"
+PET = "#/components/schemas/Pet"
+OWNER = "#/components/schemas/Owner"
+TAG = "#/components/schemas/Tag"
+
+
+def test_references_in_both_directions() -> None:
+    graph = parse(spec_string=SPEC).dependency_graph
+
+    assert graph.dependencies(PETS) == {PET}
+    assert graph.dependencies(PET) == {OWNER}
+    # a $ref into a component counts as a reference to the component
+    assert graph.dependencies(OWNER) == {PETS, PET}
+    assert graph.dependencies("#/components/parameters/Limit") == frozenset()
+
+    assert graph.dependents(PET) == {PETS, OWNER}
+    assert graph.dependents(f"{PET}/properties/owner") == {PETS, OWNER}
+    assert graph.dependents("#/components/schemas/Missing") == frozenset()
+
+
+def test_operations_using_components() -> None:
+    spec = parse(spec_string=SPEC)
+    graph = spec.dependency_graph
+    list_pets = spec.get_operation("listPets")
+    list_owners = spec.get_operation("listOwners")
+
+    assert graph.operations_using("#/components/parameters/Limit") == (list_pets,)
+    assert set(map(id, graph.operations_using(PET))) == {
+        id(list_pets),
+        id(list_owners),
+    }
+    assert graph.operations_using(TAG) == ()
+
+
+def test_cycles() -> None:
+    graph = parse(spec_string=SPEC).dependency_graph
+
+    assert set(graph.cycles) == {frozenset({PETS, PET, OWNER}), frozenset({TAG})}
+    assert graph.cycle_of(PET) == frozenset({PETS, PET, OWNER})
+    assert graph.cycle_of("#/components/parameters/Limit") is None
+
+
+def test_external_targets(tmp_path: Path) -> None:
+    (tmp_path / "owner.yaml").write_text(
+        "type: object\nproperties:\n  name: {$ref: 'name.yaml'}\n"
+    )
+    (tmp_path / "name.yaml").write_text("type: string\n")
+    main = tmp_path / "main.yaml"
+    main.write_text(
+        SPEC.replace(
+            "    Owner:\n      type: object\n      properties:\n"
+            '        pets: {$ref: "#/components/schemas/Pets"}\n'
+            '        name: {$ref: "#/components/schemas/Pet/properties/owner"}\n',
+            '    Owner: {$ref: "owner.yaml"}\n',
+        )
+    )
+
+    spec = parse(str(main))
+    graph = spec.dependency_graph
+
+    # the component entry keeps its own name
+    assert graph.dependencies(PET) == {OWNER}
+    assert graph.dependencies(OWNER) == {"name.yaml"}
+    assert graph.dependents("name.yaml") == {OWNER}
+    assert len(graph.operations_using("name.yaml")) == 2
+    assert graph.cycles == (frozenset({TAG}),)
+
+
+def test_graph_is_cached_and_pickled() -> None:
+    spec = parse(spec_string=SPEC)
+    graph = spec.dependency_graph
+
+    assert spec.dependency_graph is graph
+    assert spec.model_copy(update={"paths": {}}).dependency_graph is not graph
+
+    restored = pickle.loads(pickle.dumps(spec)).dependency_graph
+    assert restored.references == graph.references
+    assert set(restored.cycles) == set(graph.cycles)
+
+
+def test_graph_does_not_affect_equality() -> None:
+    spec = parse(spec_string=SPEC)
+    other = parse(spec_string=SPEC)
+
+    assert spec.dependency_graph.references
+    assert spec == other
+    assert other == spec
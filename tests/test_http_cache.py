@@ -0,0 +1,180 @@
+"""Tests for the conditional-GET cache of remote documents."""
+
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from openapi_parser.cache import HTTPCache
+from openapi_parser.fetcher import HTTPFetcher
+from openapi_parser.parser import parse
+
+ROOT_SPEC = b"""
+openapi: "3.0.0"
+info: {title: "Remote", version: "1.0.0"}
+paths: {}
+components:
+  schemas:
+    A: {$ref: "a.yaml"}
+"""
+
+LAST_MODIFIED = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+class _Origin:
+    """Documents served by the test server and the statuses it sent."""
+
+    def __init__(self) -> None:
+        self.documents = {"/main.yaml": ROOT_SPEC, "/a.yaml": b"type: string\n"}
+        self.cache_control = "max-age=0"
+        self.statuses: Counter[tuple[str, int]] = Counter()
+        self.lock = threading.Lock()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    origin: _Origin
+
+    def do_GET(self) -> None:
+        body = self.origin.documents.get(self.path)
+        etag = f'"{hash(body)}"'
+
+        if body is None:
+            status = 404
+        elif self.headers.get("If-None-Match") == etag or (
+            self.path == "/a.yaml"
+            and self.headers.get("If-Modified-Since") == LAST_MODIFIED
+        ):
+            status = 304
+        else:
+            status = 200
+
+        with self.origin.lock:
+            self.origin.statuses[(self.path, status)] += 1
+
+        self.send_response(status)
+        self.send_header("Cache-Control", self.origin.cache_control)
+
+        # a.yaml only carries a Last-Modified validator
+        if self.path == "/a.yaml":
+            self.send_header("Last-Modified", LAST_MODIFIED)
+        else:
+            self.send_header("ETag", etag)
+
+        payload = body if status == 200 and body is not None else b""
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def origin() -> Iterator[tuple[str, _Origin]]:
+    state = _Origin()
+    handler = type("Handler", (_Handler,), {"origin": state})
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", state
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_revalidates_with_etag_and_last_modified(
+    origin: tuple[str, _Origin], tmp_path: Path
+) -> None:
+    base, state = origin
+    cache = HTTPCache(tmp_path)
+
+    first = cache.fetch(f"{base}/main.yaml")
+    assert cache.fetch(f"{base}/main.yaml") == first
+    assert first[0] == ROOT_SPEC.decode()
+
+    assert cache.fetch(f"{base}/a.yaml")[0] == "type: string\n"
+    assert cache.fetch(f"{base}/a.yaml")[0] == "type: string\n"
+
+    assert state.statuses == {
+        ("/main.yaml", 200): 1,
+        ("/main.yaml", 304): 1,
+        ("/a.yaml", 200): 1,
+        ("/a.yaml", 304): 1,
+    }
+
+
+def test_changed_document_is_downloaded(
+    origin: tuple[str, _Origin], tmp_path: Path
+) -> None:
+    base, state = origin
+    cache = HTTPCache(tmp_path)
+    cache.fetch(f"{base}/main.yaml")
+
+    state.documents["/main.yaml"] = b"changed"
+
+    assert cache.fetch(f"{base}/main.yaml")[0] == "changed"
+    assert state.statuses[("/main.yaml", 200)] == 2
+
+
+def test_fresh_entries_skip_the_network(
+    origin: tuple[str, _Origin], tmp_path: Path
+) -> None:
+    base, state = origin
+    state.cache_control = "public, max-age=3600"
+    cache = HTTPCache(tmp_path)
+
+    cache.fetch(f"{base}/main.yaml")
+    cache.fetch(f"{base}/main.yaml")
+
+    assert sum(state.statuses.values()) == 1
+
+
+def test_no_store_is_not_cached(origin: tuple[str, _Origin], tmp_path: Path) -> None:
+    base, state = origin
+    state.cache_control = "no-store"
+    cache = HTTPCache(tmp_path)
+
+    cache.fetch(f"{base}/main.yaml")
+    cache.fetch(f"{base}/main.yaml")
+
+    assert state.statuses[("/main.yaml", 200)] == 2
+
+
+def test_offline_serves_stale_entries(
+    origin: tuple[str, _Origin], tmp_path: Path
+) -> None:
+    base, state = origin
+    HTTPCache(tmp_path).fetch(f"{base}/main.yaml")
+
+    offline = HTTPCache(tmp_path, offline=True)
+    assert offline.fetch(f"{base}/main.yaml")[0] == ROOT_SPEC.decode()
+    assert sum(state.statuses.values()) == 1
+
+    with pytest.raises(OSError, match="Offline"):
+        offline.fetch(f"{base}/a.yaml")
+
+
+def test_not_modified_spec_is_not_parsed_again(
+    origin: tuple[str, _Origin], tmp_path: Path
+) -> None:
+    base, state = origin
+    cache_dir = tmp_path / "specs"
+
+    with HTTPFetcher() as fetcher:
+        http_cache = HTTPCache(tmp_path / "http", fetcher)
+        first = parse(f"{base}/main.yaml", fetcher=http_cache, cache_dir=cache_dir)
+
+        with patch("openapi_parser.parser.resolve", side_effect=AssertionError):
+            second = parse(f"{base}/main.yaml", fetcher=http_cache, cache_dir=cache_dir)
+
+    assert second == first
+    assert state.statuses[("/main.yaml", 200)] == 1
+    assert state.statuses[("/a.yaml", 200)] == 1
@@ -0,0 +1,143 @@
+"""Tests for incremental re-parsing of edited specifications."""
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from openapi_parser import resolver
+from openapi_parser.errors import ParserError
+from openapi_parser.incremental import IncrementalParser
+from openapi_parser.parser import parse
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+SPEC = """
+openapi: "3.0.0"
+info: {{title: "Pets", version: "1.0.0"}}
+paths:
+  /pets:
+    get:
+      responses:
+        "200":
+          description: "OK"
+          content:
+            application/json:
+              schema: {{$ref: "#/components/schemas/Pets"}}
+  /owners:
+    get:
+      responses:
+        "200":
+          description: "OK"
+          content:
+            application/json:
+              schema: {{$ref: "#/components/schemas/Owner"}}
+components:
+  schemas:
+    Pets:
+      type: array
+      items: {{$ref: "#/components/schemas/Pet"}}
+    Pet:
+      type: object
+      description: "{pet}"
+    Owner:
+      type: object
+      properties:
+        name: {{type: string}}
+"""
+
+
+def _schema(spec: Any, path: str) -> Any:
+    content = spec.paths[path].get.responses["200"].content
+    return content["application/json"].schema_object
+
+
+def test_unchanged_entries_are_reused() -> None:
+    parser = IncrementalParser()
+    before = parser.update(SPEC.format(pet="A pet"))
+    after = parser.update(SPEC.format(pet="An edited pet"))
+
+    assert parser.specification is after
+    assert after is not before
+
+    # Pet changed, and Pets and /pets reach it through $refs
+    assert after.paths["/pets"] is not before.paths["/pets"]
+    pets = _schema(after, "/pets")
+    assert pets.items.description == "An edited pet"
+    assert after.components is not None
+    assert after.components.schemas is not None
+    assert pets is after.components.schemas["Pets"]
+    assert pets.items is after.components.schemas["Pet"]
+
+    assert after.paths["/owners"] is before.paths["/owners"]
+    assert before.components is not None
+    assert before.components.schemas is not None
+    assert after.components.schemas["Owner"] is before.components.schemas["Owner"]
+
+
+def test_matches_full_parse() -> None:
+    parser = IncrementalParser()
+    parser.update(SPEC.format(pet="A pet"))
+    text = SPEC.format(pet="An edited pet").replace("/owners", "/people")
+
+    spec = parser.update(text)
+
+    assert list(spec.paths) == ["/pets", "/people"]
+    assert spec.model_dump() == parse(spec_string=text).model_dump()
+
+
+def test_failed_update_keeps_state() -> None:
+    parser = IncrementalParser()
+    before = parser.update(SPEC.format(pet="A pet"))
+    broken = SPEC.format(pet="A pet").replace("#/components/schemas/Owner", "#/nope")
+
+    with pytest.raises(ParserError, match="Failed to resolve references"):
+        parser.update(broken)
+
+    assert parser.specification is before
+
+    after = parser.update(SPEC.format(pet="A pet"))
+    assert after.paths["/owners"] is before.paths["/owners"]
+
+
+def test_version_change_parses_everything() -> None:
+    parser = IncrementalParser()
+    before = parser.update(SPEC.format(pet="A pet"))
+    after = parser.update(SPEC.format(pet="A pet").replace("3.0.0", "3.1.0"))
+
+    assert type(after) is not type(before)
+    assert after.paths["/owners"] is not before.paths["/owners"]
+
+
+def test_swagger() -> None:
+    with open(os.path.join(DATA_DIR, "swagger_v2.yaml")) as f:
+        text = f.read()
+
+    spec = IncrementalParser().update(text)
+
+    assert spec.model_dump() == parse(spec_string=text).model_dump()
+
+
+def test_external_documents_are_read_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "owner.yaml").write_text("type: object\n")
+    text = SPEC.format(pet="A pet").replace(
+        "    Owner:\n      type: object\n", '    Owner:\n      $ref: "owner.yaml"\n'
+    )
+    reads: list[str] = []
+    read_uri = resolver._read_uri
+
+    def _counting_read(uri: str, fetcher: Any = None) -> tuple[str, str | None]:
+        reads.append(uri)
+        return read_uri(uri, fetcher)
+
+    monkeypatch.setattr(resolver, "_read_uri", _counting_read)
+
+    parser = IncrementalParser(base_uri=tmp_path / "main.yaml")
+    parser.update(text)
+    spec = parser.update(text.replace("A pet", "An edited pet"))
+
+    assert reads == [str(tmp_path / "owner.yaml")]
+    assert _schema(spec, "/owners").ref_name == "owner.yaml"
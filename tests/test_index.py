@@ -0,0 +1,105 @@
+"""Tests for the operation index on parsed specifications."""
+
+import os
+import pickle
+
+from openapi_parser.models import v3_1
+from openapi_parser.parser import parse
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+WEBHOOK_SPEC = """
+openapi: "3.1.0"
+info:
+  title: "Webhooks"
+  version: "1.0.0"
+paths:
+  /pets:
+    get:
+      operationId: listPets
+      tags: [pets]
+      responses:
+        "200":
+          description: "OK"
+    post:
+      operationId: listPets
+      tags: [pets, admin]
+      responses:
+        "201":
+          description: "Created"
+webhooks:
+  newPet:
+    post:
+      operationId: onNewPet
+      tags: [pets]
+      responses:
+        "200":
+          description: "OK"
+"""
+
+
+def test_lookup_by_id_tag_and_route() -> None:
+    spec = parse(os.path.join(DATA_DIR, "openapi_3.0.yaml"))
+    users = spec.paths["/users"]
+
+    assert spec.get_operation("GetUserList") is users.get
+    assert spec.get_operation("Missing") is None
+    assert spec.operation_for("GET", "/users") is users.get
+    assert spec.operation_for("post", "/users") is users.post
+    assert spec.operation_for("trace", "/users") is None
+    assert users.get in spec.operations_by_tag("Users")
+    assert spec.operations_by_tag("Missing") == ()
+
+
+def test_additional_operations_are_indexed() -> None:
+    spec = parse(os.path.join(DATA_DIR, "openapi_3.2.yaml"))
+    equipment = spec.paths["/equipment"]
+    assert isinstance(equipment, v3_1.PathItem)
+    assert equipment.additional_operations is not None
+
+    assert (
+        spec.operation_for("QUERY", "/equipment")
+        is equipment.additional_operations["query"]
+    )
+
+
+def test_webhooks_and_duplicate_ids() -> None:
+    spec = parse(spec_string=WEBHOOK_SPEC)
+    assert isinstance(spec, v3_1.Specification)
+    assert spec.webhooks is not None
+    pets = spec.paths["/pets"]
+    webhook = spec.webhooks["newPet"].post
+
+    assert spec.get_operation("listPets") is pets.get
+    assert spec.get_operation("onNewPet") is webhook
+    assert spec.operations_by_tag("pets") == (pets.get, pets.post, webhook)
+    assert spec.operations_by_tag("admin") == (pets.post,)
+
+
+def test_index_is_cached_and_follows_copies() -> None:
+    spec = parse(spec_string=WEBHOOK_SPEC)
+    index = spec.operation_index
+    assert spec.operation_index is index
+
+    copy = spec.model_copy(update={"paths": {}})
+    assert copy.get_operation("listPets") is None
+    assert copy.get_operation("onNewPet") is spec.get_operation("onNewPet")
+
+    restored = pickle.loads(pickle.dumps(spec))
+    assert restored.get_operation("listPets") is restored.paths["/pets"].get
+
+
+def test_index_does_not_affect_equality() -> None:
+    spec = parse(spec_string=WEBHOOK_SPEC)
+    other = parse(spec_string=WEBHOOK_SPEC)
+
+    assert spec.get_operation("listPets") is not None
+    assert spec.operations_by_tag("pets")
+    assert spec == other
+    assert other == spec
+
+
+def test_lazy_spec_index() -> None:
+    spec = parse(os.path.join(DATA_DIR, "openapi_3.1.yaml"), lazy=True)
+
+    assert spec.get_operation("GetUser") is spec.paths["/users/{uuid}"].get
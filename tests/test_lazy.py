@@ -0,0 +1,132 @@
+"""Tests for lazily validated specifications."""
+
+import os
+import pickle
+import threading
+from pathlib import Path
+
+import pytest
+
+from openapi_parser.errors import ParserError
+from openapi_parser.models.lazy import LazyMapping
+from openapi_parser.parser import parse
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+@pytest.mark.parametrize("fixture", sorted(os.listdir(DATA_DIR)))
+def test_lazy_spec_matches_eager_spec(fixture: str) -> None:
+    path = os.path.join(DATA_DIR, fixture)
+    eager = parse(path)
+    lazy = parse(path, lazy=True)
+
+    assert isinstance(lazy.paths, LazyMapping)
+    assert list(lazy.paths) == list(eager.paths)
+    assert lazy.model_dump(by_alias=True) == eager.model_dump(by_alias=True)
+    assert isinstance(lazy.paths, dict)
+
+
+def test_lazy_values_are_memoized_and_share_ref_identity() -> None:
+    spec = parse(os.path.join(DATA_DIR, "openapi_3.0.yaml"), lazy=True)
+    assert spec.components is not None
+    responses = spec.components.responses
+    assert isinstance(responses, LazyMapping)
+    assert repr(responses).endswith(f"0/{len(responses)} validated)")
+
+    get_op = spec.paths["/users"].get
+    assert get_op is not None
+    assert spec.paths["/users"] is spec.paths["/users"]
+    assert get_op.responses["400"] is responses["BadRequest"]
+
+    schemas = spec.components.schemas
+    assert schemas is not None
+    user = schemas["User"]
+    assert schemas["User"] is user
+
+
+def test_lazy_validation_shares_identity_across_threads() -> None:
+    spec = parse(os.path.join(DATA_DIR, "openapi_3.0.yaml"), lazy=True)
+    results = {}
+
+    def access() -> None:
+        get_op = spec.paths["/users"].get
+        assert get_op is not None
+        results["response"] = get_op.responses["400"]
+
+    thread = threading.Thread(target=access)
+    thread.start()
+    thread.join()
+
+    assert spec.components is not None
+    assert spec.components.responses is not None
+    assert results["response"] is spec.components.responses["BadRequest"]
+
+
+BROKEN_SPEC = """
+openapi: "3.0.0"
+info:
+  title: "Lazy"
+  version: "1.0.0"
+paths:
+  /ok:
+    get:
+      responses:
+        "200":
+          description: "OK"
+  /broken:
+    get:
+      responses:
+        "200":
+          summary: "missing description"
+"""
+
+
+def test_lazy_validation_errors_surface_on_access() -> None:
+    spec = parse(spec_string=BROKEN_SPEC, lazy=True)
+
+    assert spec.paths["/ok"].get is not None
+
+    with pytest.raises(ParserError, match=r"paths\['/broken'\]") as exc_info:
+        spec.paths["/broken"]
+
+    assert exc_info.value.errors()
+
+
+def test_lazy_membership_does_not_validate() -> None:
+    spec = parse(spec_string=BROKEN_SPEC, lazy=True)
+
+    assert "/broken" in spec.paths
+    assert "/missing" not in spec.paths
+    assert repr(spec.paths).endswith("0/2 validated)")
+
+
+def test_lazy_spec_stays_lazy_when_pickled() -> None:
+    spec = parse(spec_string=BROKEN_SPEC, lazy=True)
+    ok = spec.paths["/ok"]
+    restored = pickle.loads(pickle.dumps(spec))
+
+    assert isinstance(restored.paths, LazyMapping)
+    assert repr(restored.paths).endswith("1/2 validated)")
+    assert restored.paths["/ok"] == ok
+
+    with pytest.raises(ParserError, match=r"paths\['/broken'\]"):
+        restored.paths["/broken"]
+
+
+def test_lazy_spec_with_cache_defers_errors(tmp_path: Path) -> None:
+    path = tmp_path / "spec.yaml"
+    path.write_text(BROKEN_SPEC)
+    cache_dir = tmp_path / "cache"
+
+    for _ in range(2):
+        spec = parse(path, lazy=True, cache_dir=cache_dir)
+
+        assert spec.paths["/ok"].get is not None
+
+        with pytest.raises(ParserError, match=r"paths\['/broken'\]"):
+            spec.paths["/broken"]
+
+    assert [entry.suffix for entry in cache_dir.iterdir()] == [".pickle"]
+
+    with pytest.raises(ParserError, match="Validation failed"):
+        parse(path, cache_dir=cache_dir)
@@ -0,0 +1,123 @@
+"""Tests for YAML/JSON document loading."""
+
+import io
+import mmap
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from openapi_parser import loader
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+@pytest.mark.parametrize("fixture", sorted(os.listdir(DATA_DIR)))
+def test_safe_load_yaml_matches_safe_load(fixture: str) -> None:
+    with open(os.path.join(DATA_DIR, fixture)) as f:
+        text = f.read()
+
+    assert loader.safe_load_yaml(text) == yaml.safe_load(text)
+
+
+def test_safe_load_yaml_rejects_unsafe_tags() -> None:
+    with pytest.raises(yaml.YAMLError):
+        loader.safe_load_yaml("!!python/object/apply:os.system ['true']")
+
+
+def test_yaml_backend_reflects_libyaml_availability() -> None:
+    expected = "libyaml" if yaml.__with_libyaml__ else "python"
+    assert expected == loader.YAML_BACKEND
+
+
+# ---------------------------------------------------------------------------
+# JSON fast path
+# ---------------------------------------------------------------------------
+
+# ``1e5`` is a float in JSON but a string for PyYAML's YAML 1.1 resolver,
+# which tells us which decoder handled the document.
+_JSON_TEXT = '{"value": 1e5}'
+
+
+def test_load_document_sniffs_json_by_first_byte() -> None:
+    assert loader.load_document("  \n" + _JSON_TEXT) == {"value": 100000.0}
+
+
+def test_load_document_sniffs_json_by_extension() -> None:
+    text = '"value": 1e5'
+    assert loader.load_document(text, uri="spec.yaml") == {"value": "1e5"}
+    # not valid JSON, so the extension hint falls back to YAML
+    assert loader.load_document(text, uri="spec.json") == {"value": "1e5"}
+    assert loader.load_document("1e5", uri="file:///a/spec.JSON") == 100000.0
+
+
+def test_load_document_sniffs_json_by_content_type() -> None:
+    content_type = "application/json; charset=utf-8"
+    assert loader.load_document("1e5", content_type=content_type) == 100000.0
+    assert loader.load_document("1e5", content_type="application/yaml") == "1e5"
+
+
+def test_load_document_falls_back_to_yaml_for_flow_mappings() -> None:
+    assert loader.load_document("{openapi: 3.0.0, paths: {}}") == {
+        "openapi": "3.0.0",
+        "paths": {},
+    }
+
+
+def test_load_document_yaml() -> None:
+    assert loader.load_document("openapi: 3.1.0\npaths: {}\n") == {
+        "openapi": "3.1.0",
+        "paths": {},
+    }
+
+
+def test_json_backend_is_reported() -> None:
+    assert loader.JSON_BACKEND in ("orjson", "msgspec", "json")
+
+
+# ---------------------------------------------------------------------------
+# Streaming from files and memory maps
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("fixture", sorted(os.listdir(DATA_DIR)))
+def test_load_stream_matches_load_document(fixture: str) -> None:
+    path = os.path.join(DATA_DIR, fixture)
+
+    with open(path) as f:
+        expected = loader.load_document(f.read(), path)
+
+    with open(path, "rb") as f:
+        assert loader.load_stream(f, path) == expected
+
+
+def test_load_stream_sniffs_json(tmp_path: Path) -> None:
+    (tmp_path / "spec").write_text("\n" + _JSON_TEXT)
+    (tmp_path / "flow").write_text("{openapi: 3.0.0}")
+
+    with open(tmp_path / "spec", "rb") as f:
+        assert loader.load_stream(f) == {"value": 100000.0}
+
+    with open(tmp_path / "flow", "rb") as f:
+        assert loader.load_stream(f) == {"openapi": "3.0.0"}
+
+
+def test_load_stream_from_memory_map(tmp_path: Path) -> None:
+    (tmp_path / "spec.yaml").write_text("openapi: 3.1.0\npaths: {}\n")
+
+    with (
+        open(tmp_path / "spec.yaml", "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        assert loader.load_stream(mapped) == {"openapi": "3.1.0", "paths": {}}
+
+
+def test_load_stream_without_file(tmp_path: Path) -> None:
+    assert loader.load_stream(io.BytesIO(_JSON_TEXT.encode())) == {"value": 100000.0}
+    assert loader.load_stream(io.BytesIO(b"paths: {}\n")) == {"paths": {}}
+
+    (tmp_path / "empty.yaml").touch()
+
+    with open(tmp_path / "empty.yaml", "rb") as f:
+        assert loader.load_stream(f) is None
@@ -0,0 +1,128 @@
+"""Tests for parse stage events and counters."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from openapi_parser.errors import ParserError
+from openapi_parser.observer import ParseObserver, ParseStats
+from openapi_parser.parser import parse
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+ROOT_SPEC = """
+openapi: "3.0.0"
+info: {title: "Observed", version: "1.0.0"}
+paths:
+  /users:
+    get:
+      responses:
+        "200":
+          description: "OK"
+          content:
+            application/json:
+              schema: {$ref: "#/components/schemas/User"}
+components:
+  schemas:
+    User: {$ref: "user.yaml"}
+"""
+
+USER_SCHEMA = "type: object\nproperties:\n  name: {type: string}\n"
+
+
+class _Recorder(ParseObserver):
+    """Remember every event in order."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str]] = []
+        self.stats: ParseStats | None = None
+
+    def stage_started(self, stage: str) -> None:
+        self.events.append(("start", stage))
+
+    def stage_finished(self, stage: str, seconds: float) -> None:
+        assert seconds >= 0
+        self.events.append(("end", stage))
+
+    def parse_finished(self, stats: ParseStats) -> None:
+        self.stats = stats
+
+
+def _stages(events: list[tuple[str, str]]) -> list[str]:
+    return [stage for kind, stage in events if kind == "end"]
+
+
+@pytest.fixture
+def spec_path(tmp_path: Path) -> Path:
+    (tmp_path / "main.yaml").write_text(ROOT_SPEC)
+    (tmp_path / "user.yaml").write_text(USER_SCHEMA)
+
+    return tmp_path / "main.yaml"
+
+
+def test_stages_and_counters(spec_path: Path) -> None:
+    recorder = _Recorder()
+    spec = parse(spec_path, observer=recorder)
+
+    assert recorder.events == [
+        ("start", "read"),
+        ("end", "read"),
+        ("start", "decode"),
+        ("end", "decode"),
+        ("start", "resolve"),
+        ("end", "resolve"),
+        ("start", "validate"),
+        ("end", "validate"),
+    ]
+
+    stats = recorder.stats
+    assert stats is not None
+    assert stats.bytes_read == len(ROOT_SPEC) + len(USER_SCHEMA)
+    assert stats.external_documents == 1
+    assert (stats.refs_resolved, stats.resolved_cache_hits) == (2, 1)
+    assert stats.resolved_cache_misses == 1
+    assert (stats.ref_cache_hits, stats.ref_cache_misses) == (1, 1)
+    # spec, info, path item, operation, response, media type, components
+    # and the User schema with its one property
+    assert stats.models == 9
+    assert list(stats.stage_seconds) == _stages(recorder.events)
+
+    assert spec.components is not None
+    assert spec.components.schemas is not None
+
+
+def test_swagger_is_normalized() -> None:
+    recorder = _Recorder()
+    parse(os.path.join(DATA_DIR, "swagger_v2.yaml"), observer=recorder)
+
+    assert _stages(recorder.events) == [
+        "read",
+        "decode",
+        "normalize",
+        "resolve",
+        "validate",
+    ]
+
+
+def test_cache_hit_skips_later_stages(spec_path: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    parse(spec_path, cache_dir=cache_dir)
+
+    recorder = _Recorder()
+    parse(spec_path, cache_dir=cache_dir, observer=recorder)
+
+    assert _stages(recorder.events) == ["read", "cache"]
+    assert recorder.stats is not None
+    assert recorder.stats.external_documents == 0
+
+
+def test_failed_stage_is_finished(spec_path: Path) -> None:
+    (spec_path.parent / "user.yaml").unlink()
+    recorder = _Recorder()
+
+    with pytest.raises(ParserError, match="Failed to resolve references"):
+        parse(spec_path, observer=recorder)
+
+    assert recorder.events[-1] == ("end", "resolve")
+    assert recorder.stats is None
@@ -120,3 +120,78 @@ definitions:
     assert schema is not None
     assert schema.properties is not None
     assert schema.properties["name"].type == "string"
+
+
+def test_parse_swagger_v2_shared_nodes() -> None:
+    """YAML aliases are normalized once and vendor extensions are left alone."""
+    spec_yaml = """
+swagger: "2.0"
+info:
+  title: "Alias API"
+  version: "1.0.0"
+produces:
+  - "application/json"
+paths:
+  /pets:
+    x-throttle:
+      parameters: [{name: "burst", in: "body"}]
+    get:
+      responses: &pet_responses
+        "200":
+          description: "OK"
+          schema:
+            $ref: "#/definitions/Pet"
+    put:
+      responses: *pet_responses
+definitions:
+  Pet:
+    type: object
+"""
+    spec = parse(spec_string=spec_yaml)
+    path_item = spec.paths["/pets"]
+
+    assert path_item.extensions == {
+        "x-throttle": {"parameters": [{"name": "burst", "in": "body"}]},
+    }
+
+    for operation in (path_item.get, path_item.put):
+        assert operation is not None
+        content = operation.responses["200"].content
+        assert content is not None
+        schema = content["application/json"].schema_object
+        assert schema is not None
+        assert schema.ref_name == "#/components/schemas/Pet"
+
+
+def test_parse_swagger_v2_shared_responses_keep_own_produces() -> None:
+    """An aliased response is wrapped with the media types of each operation."""
+    spec_yaml = """
+swagger: "2.0"
+info:
+  title: "Alias API"
+  version: "1.0.0"
+paths:
+  /a:
+    get:
+      produces: ["application/json"]
+      responses:
+        "200": &ok
+          description: "OK"
+          schema: {type: string}
+  /b:
+    get:
+      produces: ["text/plain"]
+      responses:
+        "200": *ok
+"""
+    spec = parse(spec_string=spec_yaml)
+    media_types = []
+
+    for path in ("/a", "/b"):
+        operation = spec.paths[path].get
+        assert operation is not None
+        content = operation.responses["200"].content
+        assert content is not None
+        media_types.append(list(content))
+
+    assert media_types == [["application/json"], ["text/plain"]]
@@ -0,0 +1,107 @@
+"""Tests for the asyncio entry point."""
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from openapi_parser import parse, parse_async
+from openapi_parser.errors import ParserError
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+ROOT_SPEC = """
+openapi: "3.0.0"
+info: {title: "Remote", version: "1.0.0"}
+paths:
+  /users:
+    get:
+      responses:
+        "200":
+          description: "OK"
+          content:
+            application/json:
+              schema: {$ref: "schemas/user.yaml"}
+components:
+  schemas:
+    User: {$ref: "schemas/user.yaml"}
+    Group: {$ref: "schemas/group.yaml"}
+"""
+
+DOCUMENTS = {
+    "https://example.com/api/main.yaml": ROOT_SPEC,
+    "https://example.com/api/schemas/user.yaml": (
+        "type: object\nproperties:\n  group: {$ref: 'group.yaml'}\n"
+    ),
+    "https://example.com/api/schemas/group.yaml": "type: string\n",
+}
+
+
+class _FakeFetcher:
+    """Serve DOCUMENTS, recording how many fetches overlap."""
+
+    def __init__(self) -> None:
+        self.fetched: list[str] = []
+        self.active = 0
+        self.peak = 0
+
+    async def fetch(self, url: str) -> tuple[str, str | None]:
+        self.fetched.append(url)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+        if url not in DOCUMENTS:
+            raise OSError(f"Not found: {url}")
+
+        return DOCUMENTS[url], "application/yaml"
+
+
+@pytest.mark.parametrize("fixture", sorted(os.listdir(DATA_DIR)))
+def test_matches_parse(fixture: str) -> None:
+    path = os.path.join(DATA_DIR, fixture)
+
+    assert asyncio.run(parse_async(path)) == parse(path)
+
+
+def test_remote_documents_through_async_fetcher() -> None:
+    fetcher = _FakeFetcher()
+    spec = asyncio.run(
+        parse_async("https://example.com/api/main.yaml", fetcher=fetcher)
+    )
+
+    assert spec.components is not None
+    schemas = spec.components.schemas
+    assert schemas is not None
+    user = schemas["User"]
+    assert user.properties is not None
+    assert user.properties["group"] is schemas["Group"]
+
+    assert sorted(fetcher.fetched) == sorted(DOCUMENTS)
+    assert fetcher.peak == 2
+
+
+def test_interleaved_parses_are_isolated() -> None:
+    paths = [os.path.join(DATA_DIR, name) for name in sorted(os.listdir(DATA_DIR))]
+
+    async def _parse_all() -> list[object]:
+        return list(await asyncio.gather(*(parse_async(p) for p in paths * 3)))
+
+    specs = asyncio.run(_parse_all())
+
+    assert specs == [parse(p) for p in paths * 3]
+
+
+def test_errors(tmp_path: Path) -> None:
+    with pytest.raises(ParserError, match="Either uri or spec_string"):
+        asyncio.run(parse_async())
+
+    with pytest.raises(ParserError, match="Failed to load spec"):
+        asyncio.run(parse_async(tmp_path / "missing.yaml"))
+
+    (tmp_path / "main.yaml").write_text(ROOT_SPEC)
+
+    with pytest.raises(ParserError, match="Failed to resolve references"):
+        asyncio.run(parse_async(tmp_path / "main.yaml"))
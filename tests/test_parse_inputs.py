@@ -13,7 +13,9 @@ from unittest.mock import patch
 
 import pytest
 import yaml
+from typing_extensions import Self
 
+from openapi_parser.enumeration import DataType
 from openapi_parser.errors import ParserError
 from openapi_parser.models.v3_0 import Specification
 from openapi_parser.parser import parse
@@ -706,3 +708,61 @@ components:
     path_item = spec.paths["/users"]
     assert path_item.ref_name == "#/components/pathItems/UserPath"
     assert path_item.get is not None
+
+
+def test_external_json_ref_uses_content_type() -> None:
+    """External documents served as JSON are decoded with the JSON loader."""
+    root = yaml.dump(
+        {
+            **MINIMAL_SPEC,
+            "paths": {
+                "/items": {
+                    "get": {
+                        "responses": {
+                            "200": {
+                                "description": "OK",
+                                "content": {
+                                    "application/json": {
+                                        "schema": {"$ref": "schemas/item"},
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        }
+    ).encode("utf-8")
+    # ``1e3`` only decodes to a number through the JSON loader
+    item = b'{"type": "number", "maximum": 1e3}'
+
+    class _Response:
+        def __init__(self, body: bytes, content_type: str) -> None:
+            self.body = body
+            self.headers = {"Content-Type": content_type}
+
+        def __enter__(self) -> Self:
+            return self
+
+        def __exit__(self, *args: object) -> None:
+            pass
+
+        def read(self) -> bytes:
+            return self.body
+
+    def _urlopen(url: str, timeout: float) -> _Response:
+        if url.endswith("/schemas/item"):
+            return _Response(item, "application/json")
+        return _Response(root, "application/yaml")
+
+    with patch("openapi_parser.resolver.urlopen", _urlopen):
+        spec = parse(uri="https://example.com/api/spec")
+
+    get_op = spec.paths["/items"].get
+    assert get_op is not None
+    content = get_op.responses["200"].content
+    assert content is not None
+    schema = content["application/json"].schema_object
+    assert schema is not None
+    assert schema.type == DataType.NUMBER
+    assert schema.maximum == 1000.0
@@ -0,0 +1,121 @@
+"""Tests for concurrent prefetching of external ``$ref`` documents."""
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from openapi_parser.errors import ParserError
+from openapi_parser.parser import parse
+
+DOCUMENTS = 6
+
+ROOT_SPEC = "\n".join(
+    [
+        "openapi: '3.0.0'",
+        "info: {title: 'Split', version: '1.0.0'}",
+        "paths: {}",
+        "components:",
+        "  schemas:",
+        *(f"    S{i}: {{$ref: 'schemas/s{i}.yaml'}}" for i in range(DOCUMENTS)),
+    ]
+)
+
+
+class _Server:
+    """Record requests and peak concurrency of a slow local HTTP server."""
+
+    def __init__(self, directory: Path) -> None:
+        self.requests: Counter[str] = Counter()
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self._directory = directory
+
+    def handler(self, *args: Any) -> SimpleHTTPRequestHandler:
+        server = self
+
+        class Handler(SimpleHTTPRequestHandler):
+            def do_GET(self) -> None:
+                with server._lock:
+                    server.requests[self.path] += 1
+                    server.active += 1
+                    server.peak = max(server.peak, server.active)
+
+                time.sleep(0.05)
+
+                with server._lock:
+                    server.active -= 1
+
+                super().do_GET()
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler(*args, directory=str(self._directory))
+
+
+@pytest.fixture
+def spec_server(tmp_path: Path) -> Iterator[tuple[str, _Server]]:
+    (tmp_path / "schemas").mkdir()
+    (tmp_path / "main.yaml").write_text(ROOT_SPEC)
+
+    for i in range(DOCUMENTS):
+        (tmp_path / "schemas" / f"s{i}.yaml").write_text(
+            f"type: object\nproperties:\n  shared: {{$ref: 'common.yaml#/Id'}}\n"
+            f"  own: {{$ref: 'nested/n{i}.yaml'}}\n"
+        )
+
+    (tmp_path / "schemas" / "nested").mkdir()
+    for i in range(DOCUMENTS):
+        (tmp_path / "schemas" / "nested" / f"n{i}.yaml").write_text("type: integer\n")
+
+    (tmp_path / "schemas" / "common.yaml").write_text("Id:\n  type: string\n")
+
+    recorder = _Server(tmp_path)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), partial(_Server.handler, recorder))
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}/main.yaml", recorder
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_external_documents_fetched_concurrently_once(
+    spec_server: tuple[str, _Server],
+) -> None:
+    url, server = spec_server
+    spec = parse(url)
+
+    assert spec.components is not None
+    schemas = spec.components.schemas
+    assert schemas is not None
+    assert len(schemas) == DOCUMENTS
+
+    properties = schemas["S0"].properties
+    assert properties is not None
+    assert properties["shared"].ref_name == "common.yaml#/Id"
+
+    # root + one request per external document, never repeated
+    assert sum(server.requests.values()) == 1 + 2 * DOCUMENTS + 1
+    assert set(server.requests.values()) == {1}
+    assert server.peak > 1
+
+
+def test_missing_external_document_still_fails(
+    spec_server: tuple[str, _Server], tmp_path: Path
+) -> None:
+    url, _ = spec_server
+    (tmp_path / "schemas" / "nested" / "n3.yaml").unlink()
+
+    with pytest.raises(ParserError):
+        parse(url)
@@ -0,0 +1,73 @@
+"""Tests for the per-parse ``$ref`` deduplication scope."""
+
+import asyncio
+import gc
+import os
+import weakref
+
+import yaml
+
+from openapi_parser.models import v3_0
+from openapi_parser.models.mixins import ref_cache_scope
+from openapi_parser.parser import parse
+from openapi_parser.resolver import resolve
+
+SPEC_PATH = os.path.join(os.path.dirname(__file__), "data", "openapi_3.0.yaml")
+
+
+def _user_schema(spec: v3_0.Specification) -> v3_0.Schema:
+    assert spec.components is not None
+    assert spec.components.schemas is not None
+    return spec.components.schemas["User"]
+
+
+def test_caches_are_released_after_parse() -> None:
+    spec = parse(SPEC_PATH)
+    ref = weakref.ref(_user_schema(spec))
+
+    del spec
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_nested_parse_keeps_outer_scope() -> None:
+    with ref_cache_scope() as caches:
+        v3_0.Schema.model_validate({"ref_name": "#/components/schemas/X"})
+        parse(SPEC_PATH)
+
+        assert set(caches) == {v3_0.Schema}
+        assert list(caches[v3_0.Schema]) == ["#/components/schemas/X"]
+
+
+def test_direct_validation_deduplicates_refs() -> None:
+    with open(SPEC_PATH) as f:
+        resolved = resolve(yaml.safe_load(f), SPEC_PATH, "3.0")
+
+    spec = v3_0.Specification.model_validate(resolved)
+    get_user = spec.paths["/users/{uuid}"].get
+    assert get_user is not None
+    assert spec.components is not None
+    assert spec.components.responses is not None
+
+    assert get_user.responses["200"] is spec.components.responses["UserResponse"]
+
+
+def test_interleaved_tasks_use_separate_scopes() -> None:
+    async def _validate(type_name: str) -> v3_0.Schema:
+        with ref_cache_scope():
+            first = v3_0.Schema.model_validate({"ref_name": "#/S", "type": type_name})
+            await asyncio.sleep(0)
+            second = v3_0.Schema.model_validate({"ref_name": "#/S", "type": type_name})
+            assert second is first
+
+            return first
+
+    async def _main() -> list[v3_0.Schema]:
+        return list(await asyncio.gather(_validate("string"), _validate("integer")))
+
+    a, b = asyncio.run(_main())
+
+    assert a is not b
+    assert a.type is not None and a.type.value == "string"
+    assert b.type is not None and b.type.value == "integer"
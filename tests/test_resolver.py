@@ -0,0 +1,112 @@
+"""Tests for ``$ref`` resolution in the resolver module."""
+
+import sys
+from typing import Any
+
+import pytest
+
+from openapi_parser.errors import ParserError
+from openapi_parser.parser import parse
+from openapi_parser.resolver import _iter_refs, resolve
+
+
+def _spec(
+    schemas: dict[str, Any], paths: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Test", "version": "1.0.0"},
+        "paths": paths or {},
+        "components": {"schemas": schemas},
+    }
+
+
+def test_resolve_deeper_than_recursion_limit() -> None:
+    depth = sys.getrecursionlimit() * 2
+    schema: dict[str, Any] = {"$ref": "#/components/schemas/Leaf"}
+
+    for _ in range(depth):
+        schema = {"type": "object", "properties": {"child": schema}}
+
+    resolved = resolve(
+        _spec({"Deep": schema, "Leaf": {"type": "string"}}), version="3.0"
+    )
+
+    node = resolved["components"]["schemas"]["Deep"]
+    for _ in range(depth):
+        node = node["properties"]["child"]
+
+    assert node == {"type": "string", "ref_name": "#/components/schemas/Leaf"}
+
+
+def test_resolve_breaks_self_reference_with_placeholder() -> None:
+    resolved = resolve(
+        _spec(
+            {
+                "Node": {
+                    "type": "object",
+                    "properties": {"next": {"$ref": "#/components/schemas/Node"}},
+                },
+            },
+        ),
+        version="3.0",
+    )
+
+    node = resolved["components"]["schemas"]["Node"]
+    assert node["ref_name"] == "#/components/schemas/Node"
+    assert node["properties"]["next"] == {"ref_name": "#/components/schemas/Node"}
+
+
+def test_resolve_follows_ref_chains_to_one_object() -> None:
+    operation = {
+        "responses": {
+            "200": {
+                "description": "OK",
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": "#/components/schemas/Alias"},
+                    },
+                },
+            },
+        },
+    }
+    resolved = resolve(
+        _spec(
+            {
+                "Alias": {"$ref": "#/components/schemas/Target"},
+                "Target": {"type": "string"},
+                "Other": {"items": {"$ref": "#/components/schemas/Alias"}},
+            },
+            {"/a": {"get": operation}},
+        ),
+        version="3.0",
+    )
+
+    schemas = resolved["components"]["schemas"]
+    response = resolved["paths"]["/a"]["get"]["responses"]["200"]
+    target = response["content"]["application/json"]["schema"]
+
+    assert target == {"type": "string", "ref_name": "#/components/schemas/Target"}
+    assert schemas["Other"]["items"] is target
+
+
+ALIAS_CYCLE = """
+openapi: "3.0.0"
+info: {title: "Test", version: "1.0.0"}
+paths: {}
+components:
+  schemas:
+    A: &a {type: object, properties: {self: *a}}
+"""
+
+
+def test_parse_rejects_yaml_alias_cycle() -> None:
+    with pytest.raises(ParserError, match="YAML alias cycle"):
+        parse(spec_string=ALIAS_CYCLE)
+
+
+def test_iter_refs_scans_alias_cycles_once() -> None:
+    node: dict[str, Any] = {"$ref": "#/components/schemas/A"}
+    node["items"] = [node]
+
+    assert list(_iter_refs(node)) == ["#/components/schemas/A"]
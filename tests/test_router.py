@@ -0,0 +1,130 @@
+"""Tests for matching request URLs to path templates."""
+
+import pytest
+
+from openapi_parser.parser import parse
+from openapi_parser.router import Router, server_base_path
+
+SPEC = """
+openapi: "3.0.0"
+info:
+  title: "Routes"
+  version: "1.0.0"
+servers:
+  - url: "https://api.example.com/v{version}"
+    variables:
+      version:
+        default: "1"
+  - url: "/internal/"
+paths:
+  /:
+    get:
+      operationId: root
+      responses: {"200": {description: "OK"}}
+  /users:
+    get:
+      operationId: listUsers
+      responses: {"200": {description: "OK"}}
+  /users/me:
+    get:
+      operationId: getMe
+      responses: {"200": {description: "OK"}}
+  /users/{userId}:
+    delete:
+      operationId: deleteUser
+      responses: {"204": {description: "Deleted"}}
+  /users/{userId}/orders/{orderId}:
+    get:
+      operationId: getOrder
+      responses: {"200": {description: "OK"}}
+  /files/{name}.{ext}:
+    get:
+      operationId: getFile
+      responses: {"200": {description: "OK"}}
+"""
+
+
+@pytest.fixture(scope="module")
+def router() -> Router:
+    return Router(parse(spec_string=SPEC))
+
+
+@pytest.mark.parametrize(
+    ("method", "url", "operation_id", "params"),
+    [
+        ("GET", "https://api.example.com/v1/users", "listUsers", {}),
+        ("get", "/v2/users/me", "getMe", {}),
+        ("delete", "/v1/users/42", "deleteUser", {"userId": "42"}),
+        (
+            "get",
+            "/internal/users/me/orders/7?expand=1",
+            "getOrder",
+            {"userId": "me", "orderId": "7"},
+        ),
+        (
+            "get",
+            "/v1/users/a%20b/orders/7",
+            "getOrder",
+            {"userId": "a b", "orderId": "7"},
+        ),
+        (
+            "get",
+            "/v1/files/report.tar.gz",
+            "getFile",
+            {"name": "report", "ext": "tar.gz"},
+        ),
+        ("get", "/v1/", "root", {}),
+    ],
+)
+def test_match(
+    router: Router,
+    method: str,
+    url: str,
+    operation_id: str,
+    params: dict[str, str],
+) -> None:
+    match = router.match(method, url)
+
+    assert match is not None
+    assert match.operation is not None
+    assert match.operation.operation_id == operation_id
+    assert match.path_params == params
+
+
+@pytest.mark.parametrize(
+    "url", ["/users", "/v1/users/42/orders", "/v1/unknown", "/v1/users//orders/7"]
+)
+def test_no_match(router: Router, url: str) -> None:
+    assert router.match("get", url) is None
+
+
+def test_literal_segment_wins_over_parameter(router: Router) -> None:
+    match = router.match("delete", "/v1/users/me")
+
+    assert match is not None
+    assert match.template == "/users/me"
+    assert match.operation is None
+
+
+def test_explicit_base_paths() -> None:
+    spec = parse(spec_string=SPEC)
+    router = Router(spec, base_paths=[""])
+
+    match = router.match("get", "/users/me")
+    assert match is not None
+    assert match.path_item is spec.paths["/users/me"]
+    assert router.match("get", "/v1/users/me") is None
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://api.example.com/v1/", "/v1"),
+        ("{scheme}://api.example.com/base", "/base"),
+        ("//api.example.com", ""),
+        ("/", ""),
+        ("v2", "/v2"),
+    ],
+)
+def test_server_base_path(url: str, expected: str) -> None:
+    assert server_base_path(url) == expected
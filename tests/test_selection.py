@@ -0,0 +1,177 @@
+"""Tests for parsing a selection of the operations of a specification."""
+
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from openapi_parser.models import v3_1
+from openapi_parser.observer import ParseObserver
+from openapi_parser.parser import parse
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+SPEC = """
+openapi: "3.1.0"
+info: {title: "Pets", version: "1.0.0"}
+paths:
+  /pets:
+    parameters:
+      - $ref: "#/components/parameters/Limit"
+    get:
+      operationId: listPets
+      tags: [pets]
+      responses:
+        "200":
+          description: "OK"
+          content:
+            application/json:
+              schema: {$ref: "#/components/schemas/Pets"}
+    post:
+      operationId: createPet
+      tags: [admin]
+      requestBody: {$ref: "#/components/requestBodies/NewPet"}
+      responses:
+        "201": {description: "Created"}
+  /owners:
+    get:
+      operationId: listOwners
+      tags: [owners]
+      security: [{apiKey: []}]
+      responses:
+        "200":
+          description: "OK"
+          content:
+            application/json:
+              schema: {$ref: "#/components/schemas/Owner"}
+  /animals:
+    get:
+      operationId: listAnimals
+      responses:
+        "200": {$ref: "#/paths/~1owners/get/responses/200"}
+webhooks:
+  newPet:
+    post:
+      operationId: onNewPet
+      tags: [pets]
+      responses:
+        "200": {description: "OK"}
+components:
+  parameters:
+    Limit: {name: limit, in: query, schema: {type: integer}}
+  requestBodies:
+    NewPet:
+      content:
+        application/json:
+          schema: {$ref: "#/components/schemas/Pet"}
+  securitySchemes:
+    apiKey: {type: apiKey, name: key, in: header}
+  schemas:
+    Pets:
+      type: array
+      items: {$ref: "#/components/schemas/Pet"}
+    Pet:
+      type: object
+      discriminator:
+        propertyName: kind
+        mapping:
+          cat: Cat
+          dog: "#/components/schemas/Dog"
+    Cat: {type: object}
+    Dog: {type: object}
+    Owner: {type: object}
+"""
+
+
+def _names(section: Mapping[str, Any] | None) -> set[str]:
+    assert section is not None
+    return set(section)
+
+
+def test_select_by_operation_id() -> None:
+    spec = parse(spec_string=SPEC, include_operation_ids=["listPets"])
+
+    assert list(spec.paths) == ["/pets"]
+    pets = spec.paths["/pets"]
+    assert pets.get is not None
+    assert pets.post is None
+    assert isinstance(spec, v3_1.Specification)
+    assert spec.webhooks == {}
+
+    assert spec.components is not None
+    # Pet is reached through Pets, Cat and Dog through its discriminator
+    assert _names(spec.components.schemas) == {"Pets", "Pet", "Cat", "Dog"}
+    assert _names(spec.components.parameters) == {"Limit"}
+    assert _names(spec.components.request_bodies) == set()
+    assert _names(spec.components.security_schemes) == {"apiKey"}
+
+
+def test_select_by_tag_and_path() -> None:
+    spec = parse(spec_string=SPEC, include_tags=["pets"], include_paths=["/owners"])
+
+    assert list(spec.paths) == ["/pets", "/owners"]
+    assert spec.paths["/pets"].post is None
+    assert isinstance(spec, v3_1.Specification)
+    assert list(spec.webhooks or {}) == ["newPet"]
+
+    assert spec.components is not None
+    assert "Owner" in _names(spec.components.schemas)
+
+
+def test_refs_into_pruned_paths_keep_them() -> None:
+    spec = parse(spec_string=SPEC, include_operation_ids=["listAnimals"])
+
+    assert list(spec.paths) == ["/animals", "/owners"]
+    assert spec.components is not None
+    assert _names(spec.components.schemas) == {"Owner"}
+
+
+def test_selection_matches_full_parse() -> None:
+    full = parse(spec_string=SPEC)
+    selected = parse(spec_string=SPEC, include_operation_ids=["createPet"])
+
+    assert selected.paths["/pets"].post == full.paths["/pets"].post
+
+
+def test_select_swagger() -> None:
+    spec = parse(
+        os.path.join(DATA_DIR, "swagger_v2.yaml"), include_operation_ids=["addPet"]
+    )
+
+    assert spec.paths["/pets"].get is None
+    assert spec.paths["/pets"].post is not None
+    assert spec.components is not None
+    assert _names(spec.components.schemas) == {"NewPet", "Pet", "Error"}
+
+
+def test_empty_selection() -> None:
+    spec = parse(spec_string=SPEC, include_tags=[])
+
+    assert spec.paths == {}
+    assert spec.components is not None
+    assert _names(spec.components.schemas) == set()
+
+
+def test_selections_are_cached_apart(tmp_path: Path) -> None:
+    path = tmp_path / "openapi.yaml"
+    path.write_text(SPEC)
+
+    full = parse(path, cache_dir=tmp_path / "cache")
+    selected = parse(
+        path, cache_dir=tmp_path / "cache", include_operation_ids=["listOwners"]
+    )
+
+    assert len(full.paths) == 3
+    assert list(selected.paths) == ["/owners"]
+
+
+def test_select_stage_is_observed() -> None:
+    stages: list[str] = []
+
+    class Recorder(ParseObserver):
+        def stage_started(self, stage: str) -> None:
+            stages.append(stage)
+
+    parse(spec_string=SPEC, observer=Recorder(), include_tags=["owners"])
+
+    assert stages == ["read", "decode", "select", "resolve", "validate"]
@@ -0,0 +1,95 @@
+"""Tests for iterating over operations one path item at a time."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from openapi_parser.errors import ParserError
+from openapi_parser.models.index import iter_path_item_operations
+from openapi_parser.parser import parse
+from openapi_parser.streaming import iter_operations
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+SPEC = """
+openapi: "3.0.0"
+info: {title: "Pets", version: "1.0.0"}
+paths:
+  /pets:
+    get:
+      responses:
+        "200":
+          description: "OK"
+          content:
+            application/json:
+              schema: {$ref: "#/components/schemas/Pet"}
+  /owners:
+    get:
+      responses:
+        "200": {$ref: "#/paths/~1pets/get/responses/200"}
+    post:
+      requestBody:
+        content:
+          application/json:
+            schema: {$ref: "#/components/schemas/Pet"}
+      responses:
+        "201": {description: "Created"}
+components:
+  schemas:
+    Pet:
+      type: object
+      properties:
+        parent: {$ref: "#/components/schemas/Pet"}
+"""
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    ["openapi_3.0.yaml", "openapi_3.1.yaml", "openapi_3.2.yaml", "swagger_v2.yaml"],
+)
+def test_operations_match_full_parse(fixture: str) -> None:
+    path = os.path.join(DATA_DIR, fixture)
+    spec = parse(path)
+    expected = [
+        (template, method, operation.model_dump())
+        for template, path_item in spec.paths.items()
+        for method, operation in iter_path_item_operations(path_item)
+    ]
+
+    assert [
+        (template, method, operation.model_dump())
+        for template, method, operation in iter_operations(path)
+    ] == expected
+
+
+def test_components_are_validated_once() -> None:
+    operations = list(iter_operations(spec_string=SPEC))
+
+    assert [(path, method) for path, method, _ in operations] == [
+        ("/pets", "get"),
+        ("/owners", "get"),
+        ("/owners", "post"),
+    ]
+
+    pets_get, owners_get, owners_post = (op for _, _, op in operations)
+    response = pets_get.responses["200"]
+    assert response.content is not None
+    pet = response.content["application/json"].schema_object
+    assert owners_get.responses["200"].content == response.content
+
+    assert owners_post.request_body is not None
+    assert owners_post.request_body.content["application/json"].schema_object is pet
+    assert pet is not None
+    assert pet.ref_name == "#/components/schemas/Pet"
+
+
+def test_errors_are_raised_when_reached(tmp_path: Path) -> None:
+    broken = SPEC.replace("#/components/schemas/Pet", "#/nope")
+    operations = iter_operations(spec_string=broken)
+
+    with pytest.raises(ParserError, match="Failed to resolve references"):
+        next(operations)
+
+    with pytest.raises(ParserError, match="Failed to load spec"):
+        iter_operations(tmp_path / "missing.yaml")
@@ -0,0 +1,173 @@
+"""Tests for reloading specifications when their files change."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from openapi_parser import resolver
+from openapi_parser.errors import ParserError
+from openapi_parser.watcher import SpecWatcher
+
+ROOT_SPEC = """
+openapi: "3.0.0"
+info: {{title: "{title}", version: "1.0.0"}}
+paths:
+  /users:
+    get:
+      responses:
+        "200":
+          description: "OK"
+          content:
+            application/json:
+              schema: {{$ref: "user.yaml"}}
+  /health:
+    get:
+      responses:
+        "200": {{description: "OK"}}
+"""
+
+
+def _user_schema(description: str) -> str:
+    return f"type: object\ndescription: {description}\n"
+
+
+@pytest.fixture
+def spec_path(tmp_path: Path) -> Path:
+    (tmp_path / "main.yaml").write_text(ROOT_SPEC.format(title="Users"))
+    (tmp_path / "user.yaml").write_text(_user_schema("A user"))
+
+    return tmp_path / "main.yaml"
+
+
+def _user_description(watcher: SpecWatcher) -> str | None:
+    operation = watcher.specification.paths["/users"].get
+    assert operation is not None
+    content = operation.responses["200"].content
+    assert content is not None
+    schema = content["application/json"].schema_object
+    assert schema is not None
+    return schema.description
+
+
+def test_watches_external_documents(spec_path: Path) -> None:
+    watcher = SpecWatcher(spec_path, debounce=0)
+
+    assert watcher.files == {str(spec_path), str(spec_path.parent / "user.yaml")}
+    assert not watcher.check()
+
+
+def test_reloads_root_document(spec_path: Path) -> None:
+    watcher = SpecWatcher(spec_path, debounce=0)
+    before = watcher.specification
+
+    spec_path.write_text(ROOT_SPEC.format(title="Renamed users"))
+
+    assert watcher.check()
+    assert watcher.specification.info.title == "Renamed users"
+    assert watcher.specification.paths["/users"] is before.paths["/users"]
+    assert not watcher.check()
+
+
+def test_reloads_external_document(spec_path: Path) -> None:
+    watcher = SpecWatcher(spec_path, debounce=0)
+    before = watcher.specification
+
+    (spec_path.parent / "user.yaml").write_text(_user_schema("An edited user"))
+
+    assert watcher.check()
+    assert _user_description(watcher) == "An edited user"
+    assert watcher.specification.paths["/health"] is before.paths["/health"]
+
+
+def test_edit_during_read_is_not_missed(
+    spec_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    user = spec_path.parent / "user.yaml"
+    read_uri = resolver._read_uri
+
+    def read_then_edit(uri: str, fetcher: object = None) -> tuple[str, str | None]:
+        result = read_uri(uri)
+
+        # the edit lands after the parser read the file, before its stamp
+        if uri == str(user) and "An edited user" not in user.read_text():
+            user.write_text(_user_schema("An edited user"))
+
+        return result
+
+    monkeypatch.setattr(resolver, "_read_uri", read_then_edit)
+    watcher = SpecWatcher(spec_path, debounce=0)
+    monkeypatch.setattr(resolver, "_read_uri", read_uri)
+
+    assert _user_description(watcher) == "A user"
+    assert watcher.check()
+    assert _user_description(watcher) == "An edited user"
+    assert not watcher.check()
+
+
+def test_debounces_bursts(spec_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    watcher = SpecWatcher(spec_path, debounce=1)
+
+    spec_path.write_text(ROOT_SPEC.format(title="First save"))
+    assert not watcher.check()
+
+    now[0] += 0.5
+    spec_path.write_text(ROOT_SPEC.format(title="Second save!"))
+    assert not watcher.check()
+
+    now[0] += 0.5
+    assert not watcher.check()
+
+    now[0] += 0.5
+    assert watcher.check()
+    assert watcher.specification.info.title == "Second save!"
+
+
+def test_failed_reload_keeps_specification(spec_path: Path) -> None:
+    errors: list[ParserError] = []
+    watcher = SpecWatcher(spec_path, debounce=0, on_error=errors.append)
+    before = watcher.specification
+
+    spec_path.write_text("openapi: [unclosed")
+
+    assert not watcher.check()
+    assert watcher.specification is before
+    assert watcher.error is errors[0]
+    assert not watcher.check()
+
+    spec_path.write_text(ROOT_SPEC.format(title="Fixed"))
+
+    assert watcher.check()
+    assert watcher.error is None
+    assert watcher.specification.info.title == "Fixed"
+
+
+def test_polls_on_a_thread(spec_path: Path) -> None:
+    reloaded = threading.Event()
+
+    with SpecWatcher(
+        spec_path, interval=0.01, debounce=0, on_reload=lambda _: reloaded.set()
+    ) as watcher:
+        (spec_path.parent / "user.yaml").write_text(_user_schema("Polled"))
+
+        assert reloaded.wait(5)
+
+    assert _user_description(watcher) == "Polled"
+
+
+def test_failed_reload_of_external_document_is_not_forgotten(
+    spec_path: Path,
+) -> None:
+    watcher = SpecWatcher(spec_path, debounce=0)
+
+    (spec_path.parent / "user.yaml").write_text(_user_schema("An edited user"))
+    spec_path.write_text("openapi: [unclosed")
+    assert not watcher.check()
+
+    spec_path.write_text(ROOT_SPEC.format(title="Fixed"))
+    assert watcher.check()
+
+    assert _user_description(watcher) == "An edited user"